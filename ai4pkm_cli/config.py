@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -10,6 +12,22 @@ from .logger import Logger
 
 logger = Logger()
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_file(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; cached per (path, mtime, size) so unchanged files parse once."""
+    with open(path_str, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YAML_LOADER)
+
+
+def _load_yaml_file(path: Path) -> Any:
+    """Load a YAML file, returning a private copy of the cached parse."""
+    st = path.stat()
+    return copy.deepcopy(_parse_yaml_file(str(path), st.st_mtime_ns, st.st_size))
+
 
 class Config:
     """Read orchestrator configuration sourced from orchestrator.yaml."""
@@ -53,14 +71,13 @@ class Config:
 
         if self.config_path.exists():
             try:
-                with self.config_path.open("r", encoding="utf-8") as fh:
-                    loaded = yaml.safe_load(fh) or {}
-                    if not isinstance(loaded, dict):
-                        logger.warning(
-                            "orchestrator.yaml did not contain a mapping; falling back to defaults"
-                        )
-                    else:
-                        config_data = loaded
+                loaded = _load_yaml_file(self.config_path) or {}
+                if not isinstance(loaded, dict):
+                    logger.warning(
+                        "orchestrator.yaml did not contain a mapping; falling back to defaults"
+                    )
+                else:
+                    config_data = loaded
             except yaml.YAMLError as exc:
                 logger.error(f"Failed to parse orchestrator.yaml: {exc}")
             except OSError as exc:
@@ -71,13 +88,12 @@ class Config:
         secrets_path = self.config_path.parent / "secrets.yaml"
         if secrets_path.exists():
             try:
-                with secrets_path.open("r", encoding="utf-8") as fh:
-                    secrets = yaml.safe_load(fh) or {}
-                    if isinstance(secrets, dict):
-                        config_data = self._deep_merge(config_data, secrets)
-                        logger.debug(f"Loaded secrets from {secrets_path}")
-                    else:
-                        logger.warning(f"secrets.yaml did not contain a mapping")
+                secrets = _load_yaml_file(secrets_path) or {}
+                if isinstance(secrets, dict):
+                    config_data = self._deep_merge(config_data, secrets)
+                    logger.debug(f"Loaded secrets from {secrets_path}")
+                else:
+                    logger.warning(f"secrets.yaml did not contain a mapping")
             except yaml.YAMLError as exc:
                 logger.error(f"Failed to parse secrets.yaml: {exc}")
             except OSError as exc:
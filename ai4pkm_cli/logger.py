@@ -7,7 +7,9 @@ import threading
 from datetime import datetime
 from threading import Lock
 from rich.console import Console
-from rich.text import Text
+
+# One console for every Logger instance, so terminal detection runs once
+_CONSOLE = Console()
 
 
 class Logger:
@@ -52,7 +54,7 @@ class Logger:
         self.log_file = log_file
         self.lock = Lock()
         self.console_output = console_output
-        self.console = Console()
+        self.console = _CONSOLE
 
         # Print log file path for user reference
         # print(f"📝 Log file: {os.path.abspath(self.log_file)}")
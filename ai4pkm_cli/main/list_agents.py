@@ -1,7 +1,6 @@
 """Handler for --list-agents command."""
 
 from pathlib import Path
-from rich.console import Console
 from rich.table import Table
 
 from ..config import Config
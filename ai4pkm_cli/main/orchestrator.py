@@ -1,9 +1,7 @@
 """Orchestrator daemon and status functions."""
 
-import sys
 import signal
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 
 from ..orchestrator.core import Orchestrator
@@ -45,12 +43,9 @@ def run_orchestrator_daemon(vault_path: Path = None, debug: bool = False, workin
         working_dir=Path(working_dir) if working_dir else None
     )
 
-    # Setup signal handlers
+    # Setup signal handlers; shutdown itself runs in run_forever(), not in the handler
     def signal_handler(sig, frame):
-        logger.info("\n[yellow]Received interrupt signal, shutting down...[/yellow]")
-        if orch:
-            orch.stop()
-        sys.exit(0)
+        orch.request_shutdown()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -79,6 +74,7 @@ def run_orchestrator_daemon(vault_path: Path = None, debug: bool = False, workin
     # Start orchestrator
     logger.info("\n[cyan]Starting orchestrator...[/cyan]")
     orch.run_forever()
+    logger.info("\n[yellow]Orchestrator shut down[/yellow]")
 
 
 def show_orchestrator_status(vault_path: Path = None, working_dir: str = None):
@@ -96,14 +92,8 @@ def show_orchestrator_status(vault_path: Path = None, working_dir: str = None):
     # Use CWD as vault (requires config file in CWD)
     vault_path = vault_path or Path.cwd()
 
-    # Create orchestrator just to load agents (don't start)
-    orch = Orchestrator(
-        vault_path=vault_path,
-        config=config,
-        working_dir=Path(working_dir) if working_dir else None
-    )
-
-    status = orch.get_status()
+    # Summarize from config; no need to build (and tear down) an orchestrator
+    status = Orchestrator.describe_config(vault_path, config)
 
     logger.info(Panel.fit(
         f"[bold]Vault:[/bold] {status['vault_path']}\n"
@@ -122,15 +112,12 @@ def show_orchestrator_status(vault_path: Path = None, working_dir: str = None):
             )
 
     # Show pollers
-    pollers_list = list(orch.poller_manager.pollers.items())
-    if pollers_list:
+    if status['poller_list']:
         logger.info("\n[bold]Available Pollers:[/bold]")
-        for poller_name, poller in sorted(pollers_list, key=lambda p: p[0]):
-            # Use relative path from config instead of absolute path
-            target_dir_rel = poller.poller_config.get('target_dir', str(poller.target_dir))
+        for poller_info in status['poller_list']:
             logger.info(
-                f"  • {poller_name}\n"
-                f"    Target: {target_dir_rel}\n"
-                f"    Interval: {poller.poll_interval}s"
+                f"  • {poller_info['name']}\n"
+                f"    Target: {poller_info['target_dir']}\n"
+                f"    Interval: {poller_info['poll_interval']}s"
             )
 
@@ -1,7 +1,6 @@
 """Handler for --show-config command."""
 
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
@@ -2,7 +2,6 @@
 
 import time
 from pathlib import Path
-from rich.console import Console
 
 from ..logger import Logger
 from ..config import Config
@@ -32,7 +32,8 @@ AGENT_SCHEMA = {
         "trigger_event": {"enum": ["created", "modified", "deleted", "scheduled", "manual"]},
         "executor": {"enum": ["claude_code", "gemini_cli", "codex_cli", "cursor_agent", "continue_cli", "grok_cli"]},
         "max_parallel": {"type": "integer", "minimum": 1},
-        "timeout_minutes": {"type": "integer", "minimum": 1}
+        "timeout_minutes": {"type": "integer", "minimum": 1},
+        "stream_logs": {"type": "boolean"}
     }
 }
 
@@ -272,6 +273,7 @@ class AgentRegistry:
         executor = node.get('executor', defaults.get('executor', 'claude_code'))
         max_parallel = int(node.get('max_parallel', defaults.get('max_parallel', 1)))
         timeout_minutes = int(node.get('timeout_minutes', defaults.get('timeout_minutes', 30)))
+        stream_logs = bool(node.get('stream_logs', defaults.get('stream_logs', False)))
         task_create = node.get('task_create', defaults.get('task_create', True))
         task_priority = node.get('task_priority', defaults.get('task_priority', 'medium'))
         task_archived = node.get('task_archived', defaults.get('task_archived', False))
@@ -306,6 +308,7 @@ class AgentRegistry:
             executor=executor,
             max_parallel=max_parallel,
             timeout_minutes=timeout_minutes,
+            stream_logs=stream_logs,
             log_prefix=node.get('log_prefix', frontmatter['abbreviation']),
             log_pattern=node.get('log_pattern', '{timestamp}-{agent}.log'),
             post_process_action=node.get('post_process_action'),
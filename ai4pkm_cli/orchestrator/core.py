@@ -93,6 +93,7 @@ class Orchestrator:
         # Control state
         self._running = False
         self._event_thread: Optional[threading.Thread] = None
+        self._shutdown_requested = threading.Event()  # Set by request_shutdown(); wakes run_forever()
 
         # Hot-reload state management
         self._reload_lock = threading.Lock()
@@ -139,6 +140,7 @@ class Orchestrator:
             return
 
         logger.info("Starting orchestrator...")
+        self._shutdown_requested.clear()
 
         # Start file monitor
         self.file_monitor.start()
@@ -166,6 +168,7 @@ class Orchestrator:
 
         # Stop event processing
         self._running = False
+        self._shutdown_requested.set()
 
         # Stop pollers
         self.poller_manager.stop_all()
@@ -185,6 +188,9 @@ class Orchestrator:
         if self._event_thread and self._event_thread.is_alive():
             self._event_thread.join(timeout=5.0)
 
+        # Give running agents time to finish; stragglers are killed and marked FAILED
+        self.execution_manager.close(wait=False, timeout=30.0)
+
         logger.info("Orchestrator stopped")
 
     def _trigger_reload(self):
@@ -295,6 +301,7 @@ class Orchestrator:
                     # Swap agent registry
                     old_agent_registry = self.agent_registry
                     self.agent_registry = new_agent_registry
+                    self.file_monitor.set_agent_registry(new_agent_registry)
                     
                     # Update execution manager settings
                     self.execution_manager.update_settings(new_max_concurrent)
@@ -427,47 +434,42 @@ class Orchestrator:
 
         logger.debug(f"Found {len(matching_agents)} matching agent(s) for {trigger_event.path}")
 
-        # Execute each matching agent
+        # Execute each matching agent; agents over their concurrency limit get
+        # QUEUED task files, written together after the loop
+        queued_tasks = []
+        trigger_data_json = None
         for agent in matching_agents:
             # Try to reserve a slot atomically (prevents race conditions)
             if not self.execution_manager.reserve_slot(agent):
                 # Create QUEUED task instead of dropping
-                import json
-                from datetime import datetime, date
-
-                # Convert all date/datetime objects to strings for JSON serialization
-                def make_json_serializable(obj):
-                    """Recursively convert date/datetime objects to ISO strings."""
-                    if isinstance(obj, (datetime, date)):
-                        return obj.isoformat()
-                    elif isinstance(obj, dict):
-                        return {k: make_json_serializable(v) for k, v in obj.items()}
-                    elif isinstance(obj, list):
-                        return [make_json_serializable(item) for item in obj]
-                    else:
-                        return obj
-
-                event_data_serializable = make_json_serializable(event_data)
-
-                # Serialize trigger data (escape quotes for YAML)
-                trigger_data_json = json.dumps(event_data_serializable, ensure_ascii=False).replace('"', '\\"')
+                if trigger_data_json is None:
+                    import json
+                    from datetime import datetime, date
+
+                    # Convert all date/datetime objects to strings for JSON serialization
+                    def make_json_serializable(obj):
+                        """Recursively convert date/datetime objects to ISO strings."""
+                        if isinstance(obj, (datetime, date)):
+                            return obj.isoformat()
+                        elif isinstance(obj, dict):
+                            return {k: make_json_serializable(v) for k, v in obj.items()}
+                        elif isinstance(obj, list):
+                            return [make_json_serializable(item) for item in obj]
+                        else:
+                            return obj
+
+                    event_data_serializable = make_json_serializable(event_data)
+
+                    # Serialize trigger data (escape quotes for YAML)
+                    trigger_data_json = json.dumps(event_data_serializable, ensure_ascii=False).replace('"', '\\"')
 
                 # Create minimal context for task file creation
                 ctx = ExecutionContext(
                     agent=agent,
                     trigger_data=event_data,
-                    start_time=datetime.now()
+                    start_time_ns=time.time_ns()
                 )
-
-
-                # Create QUEUED task
-                self.execution_manager.task_manager.create_task_file(
-                    ctx, agent,
-                    initial_status="QUEUED",
-                    trigger_data_json=trigger_data_json
-                )
-
-                logger.info(f"Queued {agent.abbreviation}: concurrency limit reached")
+                queued_tasks.append((ctx, agent, "QUEUED", trigger_data_json))
                 continue
 
             # Log agent trigger at INFO level for visibility
@@ -483,6 +485,11 @@ class Orchestrator:
             )
             execution_thread.start()
 
+        if queued_tasks:
+            self.execution_manager.task_manager.create_task_files(queued_tasks)
+            for _, agent, _, _ in queued_tasks:
+                logger.info(f"Queued {agent.abbreviation}: concurrency limit reached")
+
     def _execute_agent(self, agent, event_data, slot_reserved=False):
         """
         Execute an agent task.
@@ -555,7 +562,8 @@ class Orchestrator:
                     self.execution_manager.task_manager.update_task_status(
                         task_path,
                         "FAILED",
-                        error_message=f"Agent '{agent_abbr}' not found after configuration reload"
+                        error_message=f"Agent '{agent_abbr}' not found after configuration reload",
+                        durable=True
                     )
                     logger.info(f"Marked QUEUED task as FAILED: {task_path.name}")
                     continue
@@ -578,10 +586,7 @@ class Orchestrator:
                     except json.JSONDecodeError as e:
                         logger.error(f"Failed to parse trigger_data_json: {e}")
                         # Release the reserved slot since we can't process this task
-                        with self.execution_manager._count_lock:
-                            self.execution_manager._running_count -= 1
-                        with self.execution_manager._agent_lock:
-                            self.execution_manager._agent_counts[agent.abbreviation] -= 1
+                        self.execution_manager.release_slot(agent)
                         continue
 
                 # Execute agent (slot already reserved)
@@ -731,7 +736,8 @@ class Orchestrator:
                 self.execution_manager.task_manager.update_task_status(
                     task_file_path,
                     "FAILED",
-                    error_message="Missing task_type in frontmatter"
+                    error_message="Missing task_type in frontmatter",
+                    durable=True
                 )
                 return None
 
@@ -745,7 +751,8 @@ class Orchestrator:
                 self.execution_manager.task_manager.update_task_status(
                     task_file_path,
                     "FAILED",
-                    error_message=f"Agent '{agent_abbr}' not found"
+                    error_message=f"Agent '{agent_abbr}' not found",
+                    durable=True
                 )
                 return None
 
@@ -845,6 +852,47 @@ class Orchestrator:
             ]
         }
 
+    @classmethod
+    def describe_config(cls, vault_path: Path, config: 'Config') -> dict:
+        """
+        Get the status summary for a vault without building an orchestrator.
+
+        Loads agent definitions only; no directories are created and no
+        executors, file monitor or pollers are instantiated.
+
+        Args:
+            vault_path: Path to vault root
+            config: Config instance
+
+        Returns:
+            Dictionary shaped like get_status(), plus a 'poller_list'
+        """
+        from .poller_manager import describe_enabled_pollers
+
+        vault_path = Path(vault_path)
+        agents_dir = vault_path / config.get_orchestrator_prompts_dir()
+        agent_registry = AgentRegistry(agents_dir, vault_path, config)
+        pollers = describe_enabled_pollers(config)
+
+        return {
+            'running': False,
+            'vault_path': str(vault_path),
+            'agents_loaded': len(agent_registry.agents),
+            'pollers_loaded': len(pollers),
+            'running_executions': 0,
+            'max_concurrent': config.get_orchestrator_max_concurrent(),
+            'agent_list': [
+                {
+                    'abbreviation': agent.abbreviation,
+                    'name': agent.name,
+                    'category': agent.category,
+                    'running': 0
+                }
+                for agent in agent_registry.agents.values()
+            ],
+            'poller_list': pollers
+        }
+
     def trigger_agent_once(self, agent_abbreviation: str) -> Optional[ExecutionContext]:
         """
         Manually trigger an agent once (synchronously).
@@ -891,18 +939,27 @@ class Orchestrator:
             logger.error(f"Error executing agent {agent_abbreviation}: {e}", exc_info=True)
             return None
 
+    def request_shutdown(self):
+        """
+        Ask run_forever() to stop the orchestrator and return.
+
+        Only sets an event, so it is safe to call from a signal handler; the
+        actual shutdown runs on the thread inside run_forever().
+        """
+        self._shutdown_requested.set()
+
     def run_forever(self):
         """
         Start orchestrator and run forever (until interrupted).
 
-        Blocks until KeyboardInterrupt or stop() is called.
+        Blocks until KeyboardInterrupt, request_shutdown() or stop() is called.
         """
         self.start()
 
         try:
             logger.info("Orchestrator running. Press Ctrl+C to stop.")
-            while self._running:
-                time.sleep(1)
+            while self._running and not self._shutdown_requested.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         finally:
@@ -2,19 +2,24 @@
 Execution manager for orchestrator.
 
 Manages concurrent execution of agent tasks without global semaphores.
-Uses simple instance-level counter with threading lock.
+Uses simple instance-level counters guarded by a single threading lock.
 """
+import asyncio
+import collections
+import functools
+import re
 import threading
 import subprocess
+import concurrent.futures
 import time
 import os
 import shutil
 import platform
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from .models import AgentDefinition, ExecutionContext
+from ..markdown_utils import extract_body, remove_pattern_from_content
 from ..logger import Logger
 
 if TYPE_CHECKING:
@@ -22,6 +27,75 @@ if TYPE_CHECKING:
 
 logger = Logger()
 
+# Bytes read from agent stdout per wakeup when streaming logs
+STREAM_READ_SIZE = 64 * 1024
+
+# Seconds between "still running" status messages
+HEARTBEAT_INTERVAL = 5.0
+
+# Seconds close() waits for stopped executions to write their final task status
+FINALIZE_TIMEOUT = 10.0
+
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Create-if-missing without truncating (O_CLOEXEC isn't defined on Windows)
+_TOUCH_FLAGS = os.O_CREAT | os.O_WRONLY | getattr(os, 'O_CLOEXEC', 0)
+
+# In-place read/rewrite of source notes (O_BINARY stops Windows newline translation)
+_RDWR_FLAGS = os.O_RDWR | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+
+_WIKI_LINK_RE = re.compile(r'\[\[([^\]]+)\]\]')
+
+
+def _wiki_link(target: Any) -> str:
+    """Format a target as an Obsidian wiki link."""
+    return f"[[{target}]]"
+
+
+@functools.lru_cache(maxsize=2048)
+def _compute_wiki_link(vault_str: str, abs_path_str: str) -> Optional[str]:
+    """
+    Convert an absolute path to a vault-relative wiki link (without extension).
+
+    Args:
+        vault_str: Vault root path
+        abs_path_str: Absolute path of the file
+
+    Returns:
+        Wiki link like [[AI/Tasks/name]], or None if the path is outside the vault
+    """
+    try:
+        rel_path = Path(abs_path_str).relative_to(vault_str)
+    except ValueError:
+        return None
+    return _wiki_link(f"{rel_path.parent}/{rel_path.stem}")
+
+
+def _read_fd(fd: int) -> bytes:
+    """Read an open file descriptor from its current position to EOF."""
+    chunks = []
+    size_hint = max(os.fstat(fd).st_size, 1)
+    while True:
+        chunk = os.read(fd, size_hint)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _rewrite_fd(fd: int, data: bytes) -> None:
+    """Replace the whole content of an open file descriptor in place."""
+    os.lseek(fd, 0, os.SEEK_SET)
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    os.ftruncate(fd, len(data))
+
+
+def _format_items(items: Dict) -> str:
+    """Format a mapping as markdown bullet lines."""
+    return "".join(f"- {key}: {value}\n" for key, value in items.items())
+
+
 class ExecutionManager:
     """
     Manages concurrent execution of agent tasks.
@@ -49,24 +123,196 @@ class ExecutionManager:
         self.config = config or Config()
         self.orchestrator_settings = orchestrator_settings or {}
 
-        # Instance-level state (no global state)
+        # Instance-level state (no global state).
+        # Global and per-agent running counts share one lock so admission
+        # checks and reservations are a single critical section.
+        self._sched_lock = threading.Lock()
+        self._slots_idle = threading.Condition(self._sched_lock)
         self._running_count = 0
-        self._count_lock = threading.Lock()
+        self._agent_counts: collections.Counter = collections.Counter()
 
-        # Track running executions
-        self._running_executions: Dict[str, ExecutionContext] = {}
+        # Track running executions. Writers rebuild an immutable tuple snapshot
+        # under the lock; readers just grab the current tuple without locking.
         self._executions_lock = threading.Lock()
+        self._running_executions: Dict[str, ExecutionContext] = {}
+        self._running_snapshot: Tuple[ExecutionContext, ...] = ()
+
+
+        # Executor name -> handler
+        self._executor_dispatch = {
+            'claude_code': self._execute_claude_code,
+            'gemini_cli': self._execute_gemini_cli,
+            'codex_cli': self._execute_codex_cli,
+            'cursor_agent': self._execute_cursor_agent,
+            'continue_cli': self._execute_continue_cli,
+            'grok_cli': self._execute_grok_cli,
+        }
+
+        # Executable name -> resolved path (Windows only)
+        self._executor_path_cache: Dict[str, Optional[str]] = {}
+        self._executor_path_lock = threading.Lock()
+
+        # Log directories already created (they rarely change)
+        self._mkdir_cache: Set[Path] = set()
 
-        # Track per-agent running counts
-        self._agent_counts: Dict[str, int] = {}
-        self._agent_lock = threading.Lock()
+        # Shared event loop supervising all agent subprocesses (started lazily)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+        # Agent subprocess coroutines in flight (only touched on the loop thread)
+        self._run_tasks: Set[asyncio.Task] = set()
+
+        # Shared heartbeat: execution_id -> (process, agent_name, task_identifier).
+        # One thread logs progress for all running agents.
+        self._heartbeats: Dict[str, Tuple[object, str, str]] = {}
+        self._heartbeat_lock = threading.Lock()
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+        # Shared pool for background file I/O (task file creation).
+        # Guarded by _sched_lock; recreated on demand after close().
+        self._io_executor: Optional[concurrent.futures.ThreadPoolExecutor] = self._create_io_executor(max_concurrent)
 
         # Task file manager
         from .task_manager import TaskFileManager
         self.task_manager = TaskFileManager(vault_path, config=self.config, orchestrator_settings=orchestrator_settings)
         
-        # Load system prompt if it exists
-        self.system_prompt = self._load_system_prompt()
+        # Load system prompt block (prompt + blank line) if it exists
+        self._system_prompt_mtime_ns: Optional[int] = None
+        self._system_prompt_block = self._load_system_prompt_block()
+
+        # Per-agent prompt templates: abbreviation -> (agent, template)
+        self._prompt_templates: Dict[str, Tuple[AgentDefinition, str]] = {}
+
+        # Per-agent argv without the prompt: abbreviation -> (agent, argv)
+        self._base_commands: Dict[str, Tuple[AgentDefinition, List[str]]] = {}
+
+    def __enter__(self) -> 'ExecutionManager':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Shut down the shared event loop, I/O thread pool and heartbeat thread,
+        and fsync any buffered task status updates.
+
+        Agents still running on the event loop get up to ``timeout`` seconds
+        to finish; any left are killed and their executions recorded as
+        failed. close() then waits briefly for those executions to write
+        their final task status and release their slots.
+
+        The manager stays usable: the next execution starts a new loop, pool
+        and heartbeat thread.
+
+        Args:
+            wait: If True, block until in-flight I/O helpers have finished
+            timeout: Seconds to let running agents finish (None waits for them)
+        """
+        with self._loop_lock:
+            loop, loop_thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._drain_runs(timeout), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            if wait:
+                loop_thread.join()
+
+        with self._slots_idle:
+            if not self._slots_idle.wait_for(lambda: self._running_count == 0, timeout=FINALIZE_TIMEOUT):
+                logger.warning(f"{self._running_count} execution(s) still running at shutdown")
+
+        with self._heartbeat_lock:
+            self._heartbeat_stop.set()
+        with self._sched_lock:
+            io_executor, self._io_executor = self._io_executor, None
+        if io_executor is not None:
+            io_executor.shutdown(wait=wait)
+        self.task_manager.flush()
+
+    async def _drain_runs(self, timeout: Optional[float]) -> None:
+        """
+        Wait for in-flight agent subprocess coroutines, cancelling stragglers.
+
+        Args:
+            timeout: Seconds to wait before cancelling (None waits for all)
+        """
+        if not self._run_tasks:
+            return
+        logger.info(f"Waiting for {len(self._run_tasks)} running agent(s) to finish...", console=True)
+        _, pending = await asyncio.wait(self._run_tasks, timeout=timeout)
+        for task in pending:
+            # Each cancelled run kills and reaps its process
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the shared event loop, starting its thread on first use.
+
+        Returns:
+            Running event loop that supervises agent subprocesses
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._run_event_loop, args=(self._loop,), name="agent-loop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run_event_loop(loop: asyncio.AbstractEventLoop):
+        """Run the shared event loop until close() stops it."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            # Runs submitted after close() drained the loop: kill them too
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        finally:
+            loop.close()
+
+    @staticmethod
+    def _create_io_executor(max_concurrent: int) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Create the thread pool used for background file I/O.
+
+        Each running execution submits at most one task file write, so the
+        pool is sized to the concurrency limit.
+
+        Args:
+            max_concurrent: Maximum concurrent executions
+
+        Returns:
+            ThreadPoolExecutor instance
+        """
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_concurrent),
+            thread_name_prefix="agent-io"
+        )
+
+    def _submit_io(self, fn, *args) -> concurrent.futures.Future:
+        """
+        Run an I/O helper on the shared pool, creating the pool if needed.
+
+        Args:
+            fn: Callable to run
+            *args: Arguments for fn
+
+        Returns:
+            Future for the helper's result
+        """
+        with self._sched_lock:
+            if self._io_executor is None:
+                self._io_executor = self._create_io_executor(self.max_concurrent)
+            io_executor = self._io_executor
+        return io_executor.submit(fn, *args)
 
     def can_execute(self, agent: AgentDefinition) -> bool:
         """
@@ -78,18 +324,13 @@ class ExecutionManager:
         Returns:
             True if execution is allowed
         """
-        with self._count_lock:
-            # Check global limit
-            if self._running_count >= self.max_concurrent:
-                return False
-
-        with self._agent_lock:
-            # Check per-agent limit
-            agent_count = self._agent_counts.get(agent.abbreviation, 0)
-            if agent_count >= agent.max_parallel:
-                return False
+        with self._sched_lock:
+            return self._has_capacity(agent)
 
-        return True
+    def _has_capacity(self, agent: AgentDefinition) -> bool:
+        """Check global and per-agent limits. Hold _sched_lock for an exact answer."""
+        return (self._running_count < self.max_concurrent and
+                self._agent_counts.get(agent.abbreviation, 0) < agent.max_parallel)
 
     def reserve_slot(self, agent: AgentDefinition) -> bool:
         """
@@ -104,27 +345,37 @@ class ExecutionManager:
         Returns:
             True if slot was reserved, False if at capacity
         """
-        with self._count_lock:
-            # Check global limit
-            if self._running_count >= self.max_concurrent:
+        # Fast-path reject without the lock: counter reads are atomic under the
+        # GIL, and a stale read only matters when capacity is freed concurrently
+        # (the task is then queued and picked up on the next pass)
+        if not self._has_capacity(agent):
+            return False
+
+        with self._sched_lock:
+            # Re-check under the lock before reserving
+            if not self._has_capacity(agent):
                 return False
 
-            # Reserve global slot immediately
+            # Reserve global and agent slot together
             self._running_count += 1
+            self._agent_counts[agent.abbreviation] += 1
 
-        with self._agent_lock:
-            # Check per-agent limit
-            agent_count = self._agent_counts.get(agent.abbreviation, 0)
-            if agent_count >= agent.max_parallel:
-                # Release global slot since we can't reserve agent slot
-                with self._count_lock:
-                    self._running_count -= 1
-                return False
+        return True
 
-            # Reserve agent slot immediately
-            self._agent_counts[agent.abbreviation] = agent_count + 1
+    def release_slot(self, agent: AgentDefinition) -> None:
+        """
+        Release a slot previously reserved with reserve_slot().
 
-        return True
+        Used when a reserved slot will not be handed to execute().
+
+        Args:
+            agent: Agent definition
+        """
+        with self._sched_lock:
+            self._running_count -= 1
+            self._agent_counts[agent.abbreviation] -= 1
+            if self._running_count == 0:
+                self._slots_idle.notify_all()
 
     def execute(self, agent: AgentDefinition, trigger_data: Dict, slot_reserved: bool = False) -> ExecutionContext:
         """
@@ -141,54 +392,46 @@ class ExecutionManager:
         ctx = ExecutionContext(
             agent=agent,
             trigger_data=trigger_data,
-            start_time=datetime.now()
+            start_time_ns=time.time_ns()
         )
 
         # Increment counters only if not already reserved
         if not slot_reserved:
-            with self._count_lock:
+            with self._sched_lock:
                 self._running_count += 1
+                self._agent_counts[agent.abbreviation] += 1
 
-            with self._agent_lock:
-                self._agent_counts[agent.abbreviation] = self._agent_counts.get(agent.abbreviation, 0) + 1
-
-        with self._executions_lock:
-            self._running_executions[ctx.execution_id] = ctx
+        self._register_execution(ctx)
 
         # Prepare log file path BEFORE execution (needed for task file)
         log_path = self._prepare_log_path(agent, ctx)
         ctx.log_file = log_path
 
+        task_file_future = None
         existing_task_path = trigger_data.get('_existing_task_file')
         if existing_task_path:
             task_file = Path(existing_task_path)
             ctx.task_file = task_file
 
             self.task_manager.update_task_status(task_file, "IN_PROGRESS")
+            ctx.task_file_stat = self.task_manager.stat_task_file(task_file)
             logger.info(f"Using existing task file: {task_file.name}", console=True)
         else:
-            # Create task file BEFORE execution starts
-            task_path = self.task_manager.create_task_file(ctx, agent)
-            ctx.task_file = task_path
+            # The prompt only needs the task file path, so write the file in the
+            # background while the agent runs and resolve it before the final update
+            ctx.task_file = self.task_manager.get_task_path(ctx, agent)
 
         try:
+            if ctx.task_file and not existing_task_path:
+                task_file_future = self._submit_io(self.task_manager.create_task_file, ctx, agent)
+
             logger.debug(f"Starting execution: {agent.abbreviation} (ID: {ctx.execution_id})")
 
             # Execute based on executor type
-            if agent.executor == 'claude_code':
-                self._execute_claude_code(agent, ctx, trigger_data)
-            elif agent.executor == 'gemini_cli':
-                self._execute_gemini_cli(agent, ctx, trigger_data)
-            elif agent.executor == 'codex_cli':
-                self._execute_codex_cli(agent, ctx, trigger_data)
-            elif agent.executor == 'cursor_agent':
-                self._execute_cursor_agent(agent, ctx, trigger_data)
-            elif agent.executor == 'continue_cli':
-                self._execute_continue_cli(agent, ctx, trigger_data)
-            elif agent.executor == 'grok_cli':
-                self._execute_grok_cli(agent, ctx, trigger_data)
-            else:
+            executor_fn = self._executor_dispatch.get(agent.executor)
+            if executor_fn is None:
                 raise ValueError(f"Unknown executor: {agent.executor}")
+            executor_fn(agent, ctx, trigger_data)
 
             ctx.status = 'completed'
             logger.info(f"Completed execution: {agent.abbreviation} (ID: {ctx.execution_id})")
@@ -202,19 +445,22 @@ class ExecutionManager:
             logger.error(f"Failed execution: {agent.abbreviation} (ID: {ctx.execution_id}): {e}")
 
         finally:
-            ctx.end_time = datetime.now()
+            ctx.end_time_ns = time.time_ns()
+
+            if task_file_future is not None:
+                ctx.task_file = task_file_future.result()
 
             # Update task file with final status
             if ctx.task_file:
-                # Check if agent updated task file
-                agent_status = None
-                agent_output = None
-                if ctx.task_file.exists():
-                    from ..markdown_utils import read_frontmatter
-                    task_fm = read_frontmatter(ctx.task_file)
-                    agent_status = task_fm.get('status', '').upper()
-                    agent_output = task_fm.get('output', '').strip()
-                
+                # Check if agent updated task file (one read serves validation and the final write).
+                # If it is untouched since our last write, skip the parse; finalize_task reads it.
+                task_content, agent_status, agent_output = None, '', ''
+                if ctx.task_file_stat is None or \
+                        self.task_manager.stat_task_file(ctx.task_file) != ctx.task_file_stat:
+                    task_content, agent_status, agent_output = self.task_manager.read_task_status(ctx.task_file)
+                agent_status = agent_status.upper()
+                agent_output = agent_output.strip()
+
                 # Validate output and determine final status
                 final_status = ctx.status
                 output_link = None
@@ -248,23 +494,20 @@ class ExecutionManager:
                     elif output_valid and output_link is None and agent.output_optional:
                         final_status = 'ignored'
 
-                self.task_manager.update_task_status(
+                # Attach execution summary to Process Log
+                summary = None
+                if ctx.log_file and ctx.log_file.exists():
+                    summary = f"Execution completed at {ctx.end_time.isoformat()}. See generation_log for details."
+
+                self.task_manager.finalize_task(
                     task_path=ctx.task_file,
                     status="IGNORE" if final_status == 'ignored' else
                            "PROCESSED" if final_status == 'completed' else "FAILED",
                     output=output_link,
-                    error_message=ctx.error_message
+                    error_message=ctx.error_message,
+                    process_log_summary=summary,
+                    content=task_content
                 )
-                
-                # Attach execution summary to Process Log
-                if ctx.log_file and ctx.log_file.exists():
-                    try:
-                        summary = f"Execution completed at {ctx.end_time.isoformat()}. See generation_log for details."
-                        content = ctx.task_file.read_text(encoding='utf-8')
-                        updated = self.task_manager._append_to_process_log(content, summary)
-                        ctx.task_file.write_text(updated, encoding='utf-8')
-                    except Exception as e:
-                        logger.warning(f"Failed to attach execution summary to task file: {e}")
 
             # Post-processing actions (e.g., remove trigger content)
             if ctx.status == 'completed' and agent.post_process_action:
@@ -272,25 +515,23 @@ class ExecutionManager:
 
             # Log result to file
             if ctx.log_file:
-                with open(ctx.log_file, 'w', encoding='utf-8') as f:
-                    f.write(f"# Execution Log: {agent.abbreviation}\n")
-                    f.write(f"# Start: {ctx.start_time}\n")
-                    f.write(f"# Execution ID: {ctx.execution_id}\n")
-                    f.write(f"# Status: {ctx.status}\n")
-                    f.write(f"# Prompt:\n{ctx.prompt}\n\n")
-                    f.write(f"# Response:\n{ctx.response}\n\n")
-                    if ctx.error_message:
-                        f.write(f"# Error Message:\n{ctx.error_message}\n\n")
+                log_text = (f"# Execution Log: {agent.abbreviation}\n"
+                            f"# Start: {ctx.start_time}\n"
+                            f"# Execution ID: {ctx.execution_id}\n"
+                            f"# Status: {ctx.status}\n"
+                            f"# Prompt:\n{ctx.prompt}\n\n"
+                            f"# Response:\n{ctx.response}\n\n")
+                if ctx.error_message:
+                    log_text += f"# Error Message:\n{ctx.error_message}\n\n"
+                try:
+                    ctx.log_file.write_text(log_text, encoding='utf-8')
+                except OSError as e:
+                    logger.error(f"Failed to write execution log {ctx.log_file}: {e}")
 
             # Decrement counters
-            with self._count_lock:
-                self._running_count -= 1
+            self.release_slot(agent)
 
-            with self._agent_lock:
-                self._agent_counts[agent.abbreviation] -= 1
-
-            with self._executions_lock:
-                del self._running_executions[ctx.execution_id]
+            self._unregister_execution(ctx.execution_id)
 
         return ctx
 
@@ -344,26 +585,40 @@ class ExecutionManager:
         """
         # Build prompt
         ctx.prompt = self._build_prompt(agent, trigger_data, ctx)
-        
+
+        # Add the prompt as the final argument
+        cmd = self._get_agent_cached(self._base_commands, agent, self._build_cursor_agent_command) + [ctx.prompt]
+
+        self._execute_subprocess(ctx, 'Cursor Agent', cmd, agent.timeout_minutes * 60)
+
+    def _build_cursor_agent_command(self, agent: AgentDefinition) -> List[str]:
+        """
+        Build Cursor Agent argv (without prompt) from agent_params.
+
+        Args:
+            agent: Agent definition
+
+        Returns:
+            Command line list
+        """
+        params = agent.agent_params or {}
+
         # Build command: cursor-agent --print --output-format text [prompt]
         cmd = ['cursor-agent', '--print', '--output-format', 'text']
-        
+
         # Add model if specified in agent_params
-        if agent.agent_params and 'model' in agent.agent_params:
-            cmd.extend(['--model', agent.agent_params['model']])
-        
+        if 'model' in params:
+            cmd.extend(['--model', params['model']])
+
         # Add MCP approval if specified in agent_params
-        if agent.agent_params and agent.agent_params.get('approve_mcps', False):
+        if params.get('approve_mcps', False):
             cmd.append('--approve-mcps')
-        
+
         # Add browser support if specified in agent_params
-        if agent.agent_params and agent.agent_params.get('browser', False):
+        if params.get('browser', False):
             cmd.append('--browser')
-        
-        # Add the prompt as the final argument
-        cmd.append(ctx.prompt)
-        
-        self._execute_subprocess(ctx, 'Cursor Agent', cmd, agent.timeout_minutes * 60)
+
+        return cmd
 
     def _execute_continue_cli(self, agent: AgentDefinition, ctx: ExecutionContext, trigger_data: Dict):
         """
@@ -376,60 +631,58 @@ class ExecutionManager:
         """
         # Build prompt
         ctx.prompt = self._build_prompt(agent, trigger_data, ctx)
-        
+
+        # Add the prompt as the final argument
+        cmd = self._get_agent_cached(self._base_commands, agent, self._build_continue_cli_command) + [ctx.prompt]
+
+        self._execute_subprocess(ctx, 'Continue CLI', cmd, agent.timeout_minutes * 60)
+
+    def _build_continue_cli_command(self, agent: AgentDefinition) -> List[str]:
+        """
+        Build Continue CLI argv (without prompt) from agent_params.
+
+        Args:
+            agent: Agent definition
+
+        Returns:
+            Command line list
+        """
+        params = agent.agent_params or {}
+
         # Build command: cn --print [options] [prompt]
-        cmd = ['cn', '--print']
-        
-        # Add format if specified in agent_params (default: json for structured output)
-        if agent.agent_params and 'format' in agent.agent_params:
-            output_format = agent.agent_params['format']
-            cmd.extend(['--format', output_format])
-        else:
-            # Default to json for structured output if not specified
-            cmd.extend(['--format', 'json'])
-        
+        # Default to json for structured output if format not specified
+        cmd = ['cn', '--print', '--format', params.get('format', 'json')]
+
         # Add silent flag if specified in agent_params
-        if agent.agent_params and agent.agent_params.get('silent', False):
+        if params.get('silent', False):
             cmd.append('--silent')
-        
+
         # Add model if specified in agent_params
-        if agent.agent_params and 'model' in agent.agent_params:
-            cmd.extend(['--model', agent.agent_params['model']])
-        
-        # Add MCP servers if specified in agent_params
-        if agent.agent_params and 'mcp' in agent.agent_params:
-            mcp_servers = agent.agent_params['mcp']
-            if isinstance(mcp_servers, list):
-                for mcp in mcp_servers:
-                    cmd.extend(['--mcp', mcp])
-            elif isinstance(mcp_servers, str):
-                cmd.extend(['--mcp', mcp_servers])
-        
-        # Add rules if specified in agent_params
-        if agent.agent_params and 'rule' in agent.agent_params:
-            rules = agent.agent_params['rule']
-            if isinstance(rules, list):
-                for rule in rules:
-                    cmd.extend(['--rule', rule])
-            elif isinstance(rules, str):
-                cmd.extend(['--rule', rules])
-        
+        if 'model' in params:
+            cmd.extend(['--model', params['model']])
+
+        # Add MCP servers and rules (single value or list)
+        for flag, key in (('--mcp', 'mcp'), ('--rule', 'rule')):
+            values = params.get(key)
+            if isinstance(values, str):
+                values = [values]
+            if isinstance(values, list):
+                for value in values:
+                    cmd.extend([flag, value])
+
         # Add config if specified in agent_params
-        if agent.agent_params and 'config' in agent.agent_params:
-            cmd.extend(['--config', agent.agent_params['config']])
-        
+        if 'config' in params:
+            cmd.extend(['--config', params['config']])
+
         # Add auto mode if specified in agent_params
-        if agent.agent_params and agent.agent_params.get('auto', False):
+        if params.get('auto', False):
             cmd.append('--auto')
-        
+
         # Add readonly mode if specified in agent_params
-        if agent.agent_params and agent.agent_params.get('readonly', False):
+        if params.get('readonly', False):
             cmd.append('--readonly')
-        
-        # Add the prompt as the final argument
-        cmd.append(ctx.prompt)
-        
-        self._execute_subprocess(ctx, 'Continue CLI', cmd, agent.timeout_minutes * 60)
+
+        return cmd
 
     def _execute_grok_cli(self, agent: AgentDefinition, ctx: ExecutionContext, trigger_data: Dict):
         """
@@ -445,100 +698,252 @@ class ExecutionManager:
         self._execute_subprocess(ctx, 'Grok CLI', ['grok', '--prompt', ctx.prompt], agent.timeout_minutes * 60)
 
     def _execute_subprocess(self, ctx: ExecutionContext, agent_name: str, cmd: List[str], timeout_seconds: int):
+        """
+        Run an agent CLI and collect its output.
+
+        The child process is supervised by the manager's shared asyncio event
+        loop; the calling worker thread just waits for the result. Progress
+        messages come from the manager's shared heartbeat thread.
+
+        Args:
+            ctx: Execution context (receives response or error_message)
+            agent_name: Display name of the agent CLI
+            cmd: Command line to execute
+            timeout_seconds: Seconds before the process is killed
+        """
         # On Windows, resolve .cmd/.bat files to their full paths
-        if platform.system() == 'Windows' and cmd:
-            executable = cmd[0]
-            # Try to find the executable (handles .cmd, .bat, .exe)
-            resolved = shutil.which(executable)
+        if _IS_WINDOWS and cmd:
+            resolved = self._resolve_executor_path(cmd[0])
             if resolved:
-                # Use the resolved full path
                 cmd = [resolved] + cmd[1:]
-            elif not os.path.splitext(executable)[1]:  # No extension
-                # Try .cmd extension explicitly
-                cmd_cmd = executable + '.cmd'
-                resolved_cmd = shutil.which(cmd_cmd)
-                if resolved_cmd:
-                    cmd = [resolved_cmd] + cmd[1:]
-        
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            cwd=str(self.working_dir)
-        )
 
         if ctx.task_file:
             task_identifier = ctx.task_file.name
         elif ctx.agent and ctx.agent.abbreviation:
             task_identifier = f"task for {ctx.agent.abbreviation}"
 
+        future = asyncio.run_coroutine_threadsafe(
+            self._run_subprocess(ctx, agent_name, cmd, timeout_seconds, task_identifier),
+            self._get_event_loop()
+        )
+        try:
+            logs = future.result()
+        except concurrent.futures.CancelledError:
+            raise RuntimeError(f"{agent_name} was stopped by shutdown")
+        ctx.response = "\n".join(logs)
+
+    def _resolve_executor_path(self, executable: str) -> Optional[str]:
+        """
+        Resolve an executable name to its full path (Windows .cmd/.bat shims).
+
+        Results are cached for the lifetime of the manager since PATH lookups
+        do not change between executions.
+
+        Args:
+            executable: Executable name, e.g. 'claude'
+
+        Returns:
+            Full path to the executable, or None if it cannot be found
+        """
+        with self._executor_path_lock:
+            if executable in self._executor_path_cache:
+                return self._executor_path_cache[executable]
+
+        # Try to find the executable (handles .cmd, .bat, .exe)
+        resolved = shutil.which(executable)
+        if not resolved and not os.path.splitext(executable)[1]:  # No extension
+            # Try .cmd extension explicitly
+            resolved = shutil.which(executable + '.cmd')
+
+        with self._executor_path_lock:
+            self._executor_path_cache[executable] = resolved
+        return resolved
+
+    async def _run_subprocess(self, ctx: ExecutionContext, agent_name: str, cmd: List[str],
+                              timeout_seconds: int, task_identifier: str) -> List[str]:
+        """
+        Spawn the agent process and wait for it on the event loop.
+
+        Args:
+            ctx: Execution context
+            agent_name: Display name of the agent CLI
+            cmd: Command line to execute
+            timeout_seconds: Seconds before the process is killed
+            task_identifier: Task name shown in heartbeat messages
+
+        Returns:
+            Captured output lines, prefixed with the agent name
+        """
+        task = asyncio.current_task()
+        self._run_tasks.add(task)
+        try:
+            return await self._supervise_subprocess(ctx, agent_name, cmd, timeout_seconds, task_identifier)
+        finally:
+            self._run_tasks.discard(task)
+
+    async def _supervise_subprocess(self, ctx: ExecutionContext, agent_name: str, cmd: List[str],
+                                    timeout_seconds: int, task_identifier: str) -> List[str]:
+        """Body of _run_subprocess: spawn, stream/collect output and enforce the timeout."""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=str(self.working_dir)
+        )
+        self._register_heartbeat(ctx.execution_id, process, agent_name, task_identifier)
+
         logs = []
-        def stream_stderr(proc):
-            for line in proc.stdout:
-                logs.append(f"[{agent_name}] {line.strip()}")
-                logger.info(logs[-1])
-
-        status_stop_event = threading.Event()
-        def print_status():
-            while not status_stop_event.is_set():
-                if process.poll() is None:
-                    logger.info(f"⏳ {agent_name} is running for {task_identifier}", console=True)
-                else:
-                    break
-                if status_stop_event.wait(5.0):
+        stream_logs = bool(ctx.agent and ctx.agent.stream_logs)
+
+        def log_line(line: bytes):
+            logs.append(f"[{agent_name}] {line.decode('utf-8', errors='replace').strip()}")
+            logger.info(logs[-1])
+
+        async def stream_output():
+            # Live line-by-line logging for stream_logs agents. Read whatever is
+            # available in large chunks and split lines ourselves, so one wakeup
+            # can handle many lines and long lines need no buffer limit.
+            pending = bytearray()
+            while True:
+                chunk = await process.stdout.read(STREAM_READ_SIZE)
+                if not chunk:
                     break
-
-        stderr_thread = threading.Thread(target=stream_stderr, args=(process,), daemon=True)
-        status_thread = threading.Thread(target=print_status, daemon=True)
-        
-        stderr_thread.start()
-        status_thread.start()
+                pending += chunk
+                end = pending.rfind(b"\n")
+                if end >= 0:
+                    for line in bytes(pending[:end]).split(b"\n"):
+                        log_line(line)
+                    del pending[:end + 1]
+            if pending:
+                log_line(bytes(pending))
+            await process.wait()
 
         try:
-            process.wait(timeout=timeout_seconds)
-        except subprocess.TimeoutExpired:
-            process.kill()
-            raise RuntimeError(f"{agent_name} timed out after {timeout_seconds} seconds")
+            try:
+                if stream_logs:
+                    await asyncio.wait_for(stream_output(), timeout=timeout_seconds)
+                else:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout_seconds)
+                    logs = [f"[{agent_name}] {line.strip()}"
+                            for line in stdout.decode('utf-8', errors='replace').splitlines()]
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise RuntimeError(f"{agent_name} timed out after {timeout_seconds} seconds")
+            except asyncio.CancelledError:
+                # Shutdown: don't leave the child running without a supervisor
+                if process.returncode is None:
+                    process.kill()
+                await process.wait()
+                raise
         finally:
-            status_stop_event.set()
-            status_thread.join()
-            stderr_thread.join()
+            self._unregister_heartbeat(ctx.execution_id)
 
-        
         if process.returncode != 0:
             ctx.error_message = "\n".join(logs)
             raise RuntimeError(f"{agent_name} execution failed")
-        else:
-            ctx.response = "\n".join(logs)
 
+        return logs
 
-    def _load_system_prompt(self) -> str:
+    def _register_heartbeat(self, execution_id: str, process, agent_name: str, task_identifier: str):
         """
-        Load system prompt from prompts_dir/System Prompt.md if it exists.
-        
+        Add a running process to the shared heartbeat.
+
+        Args:
+            execution_id: Execution ID (registry key)
+            process: Running agent process
+            agent_name: Display name of the agent CLI
+            task_identifier: Task name shown in heartbeat messages
+        """
+        logger.info(f"⏳ {agent_name} is running for {task_identifier}", console=True)
+        with self._heartbeat_lock:
+            self._heartbeats[execution_id] = (process, agent_name, task_identifier)
+            if self._heartbeat_stop.is_set() or self._heartbeat_thread is None or \
+                    not self._heartbeat_thread.is_alive():
+                # Each thread gets its own stop event, so one stopped by close()
+                # can wind down while a replacement starts
+                self._heartbeat_stop = threading.Event()
+                self._heartbeat_thread = threading.Thread(
+                    target=self._heartbeat_loop, args=(self._heartbeat_stop,),
+                    name="agent-heartbeat", daemon=True
+                )
+                self._heartbeat_thread.start()
+
+    def _unregister_heartbeat(self, execution_id: str):
+        """Remove a finished process from the shared heartbeat."""
+        with self._heartbeat_lock:
+            self._heartbeats.pop(execution_id, None)
+
+    def _heartbeat_loop(self, stop: threading.Event):
+        """Log a status line for every running agent process every few seconds."""
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            with self._heartbeat_lock:
+                entries = list(self._heartbeats.values())
+            for process, agent_name, task_identifier in entries:
+                if process.returncode is None:
+                    logger.info(f"⏳ {agent_name} is running for {task_identifier}", console=True)
+
+
+    def _get_system_prompt_path(self) -> Path:
+        """
+        Get path to prompts_dir/System Prompt.md.
+
         Uses prompts_dir from orchestrator_settings or falls back to config.
 
         Returns:
-            System prompt content or empty string if not found
+            Path to the system prompt file (may not exist)
         """
         # Get prompts_dir from orchestrator_settings or fallback to config
         if self.orchestrator_settings and 'prompts_dir' in self.orchestrator_settings:
             prompts_dir = self.orchestrator_settings['prompts_dir']
         else:
             prompts_dir = self.config.get_orchestrator_prompts_dir()
-        
-        system_prompt_path = self.vault_path / prompts_dir / "System Prompt.md"
-        if system_prompt_path.exists():
-            try:
-                from ..markdown_utils import extract_body
-                content = system_prompt_path.read_text(encoding='utf-8')
-                return extract_body(content)
-            except Exception as e:
-                logger.warning(f"Failed to load system prompt: {e}")
-                return ""
-        return ""
+
+        return self.vault_path / prompts_dir / "System Prompt.md"
+
+    def _load_system_prompt_block(self) -> str:
+        """
+        Load system prompt from prompts_dir/System Prompt.md if it exists.
+
+        Records the file's mtime so refresh_system_prompt() can skip
+        re-reading an unchanged file.
+
+        Returns:
+            System prompt followed by a blank line, or empty string if not found
+        """
+        system_prompt_path = self._get_system_prompt_path()
+        try:
+            self._system_prompt_mtime_ns = system_prompt_path.stat().st_mtime_ns
+        except OSError:
+            self._system_prompt_mtime_ns = None
+            return ""
+
+        try:
+            content = system_prompt_path.read_text(encoding='utf-8')
+            system_prompt = extract_body(content)
+        except Exception as e:
+            logger.warning(f"Failed to load system prompt: {e}")
+            return ""
+        return (system_prompt + "\n\n") if system_prompt else ""
+
+    def refresh_system_prompt(self) -> bool:
+        """
+        Reload the system prompt if the file changed since it was last read.
+
+        Returns:
+            True if the system prompt was reloaded
+        """
+        try:
+            mtime_ns = self._get_system_prompt_path().stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._system_prompt_mtime_ns:
+            return False
+
+        self._system_prompt_block = self._load_system_prompt_block()
+        logger.info("Reloaded system prompt")
+        return True
 
     def _build_prompt(self, agent: AgentDefinition, trigger_data: Dict, ctx: Optional[ExecutionContext] = None) -> str:
         """
@@ -552,60 +957,108 @@ class ExecutionManager:
         Returns:
             Formatted prompt string
         """
-        # Start with system prompt if available
-        prompt = ""
-        if self.system_prompt:
-            prompt = self.system_prompt + "\n\n"
-        
-        # Add agent prompt body
-        prompt += agent.prompt_body
-
-        # Add trigger context
-        prompt += "\n\n# Trigger Context\n"
-        prompt += f"- Event: {trigger_data.get('event_type', 'unknown')}\n"
-        prompt += f"- Input Path: {trigger_data.get('path', 'unknown')}\n"
-        
         # Add task file path if available
+        task_file = ""
         if ctx and ctx.task_file:
-            try:
-                rel_task = ctx.task_file.relative_to(self.vault_path)
-                task_link = f"[[{rel_task.parent}/{rel_task.stem}]]"
-                prompt += f"- Task File: {task_link}\n"
-                prompt += f"- **Update upon completion**: Set `status:` and `output:` fields\n"
-            except ValueError:
-                # If relative path fails, use absolute path as fallback
-                prompt += f"- Task File: {ctx.task_file}\n"
-                prompt += f"- **Update upon completion**: Set `status:` and `output:` fields\n"
+            # If relative path fails, use absolute path as fallback
+            task_link = _compute_wiki_link(str(self.vault_path), str(ctx.task_file)) or str(ctx.task_file)
+            task_file = (f"- Task File: {task_link}\n"
+                         f"- **Update upon completion**: Set `status:` and `output:` fields\n")
+
+        # Add frontmatter if available
+        file_metadata = ""
+        if 'frontmatter' in trigger_data:
+            file_metadata = "\n# File Metadata\n" + _format_items(trigger_data['frontmatter'])
+
+        # System prompt (if any), agent prompt body, then the rendered template
+        return "".join([
+            self._system_prompt_block,
+            agent.prompt_body,
+            self._get_prompt_template(agent).format(
+                event_type=trigger_data.get('event_type', 'unknown'),
+                input_path=trigger_data.get('path', 'unknown'),
+                task_file=task_file,
+                file_metadata=file_metadata
+            )
+        ])
+
+    def _get_prompt_template(self, agent: AgentDefinition) -> str:
+        """
+        Get the cached prompt template for an agent, building it on first use.
+
+        Args:
+            agent: Agent definition
+
+        Returns:
+            Template string for str.format()
+        """
+        return self._get_agent_cached(self._prompt_templates, agent, self._compile_prompt_template)
+
+    @staticmethod
+    def _get_agent_cached(cache: Dict[str, Tuple[AgentDefinition, Any]], agent: AgentDefinition, build) -> Any:
+        """
+        Look up a per-agent derived value, building it on first use.
+
+        Agent objects are replaced on reload, so entries match on identity,
+        not just abbreviation.
+
+        Args:
+            cache: Cache dict of abbreviation -> (agent, value)
+            agent: Agent definition
+            build: Callable taking the agent and returning the value
+
+        Returns:
+            Cached value
+        """
+        cached = cache.get(agent.abbreviation)
+        if cached is None or cached[0] is not agent:
+            cached = (agent, build(agent))
+            cache[agent.abbreviation] = cached
+        return cached[1]
+
+    def _compile_prompt_template(self, agent: AgentDefinition) -> str:
+        """
+        Build the per-agent prompt template.
+
+        Sections that depend only on the agent (output configuration, agent
+        parameters) are rendered once; per-trigger values are left as
+        {event_type}, {input_path}, {task_file} and {file_metadata} placeholders.
+
+        Args:
+            agent: Agent definition
+
+        Returns:
+            Template string for str.format()
+        """
+        def escape(text: str) -> str:
+            return text.replace('{', '{{').replace('}', '}}')
+
+        # Add trigger context
+        parts = ["\n\n# Trigger Context\n- Event: {event_type}\n- Input Path: {input_path}\n{task_file}"]
 
         # Add output configuration
         if agent.output_path:
-            prompt += f"\n# Output Configuration\n"
-            prompt += f"- Output Directory: {agent.output_path}\n"
-            prompt += f"- Output Type: {agent.output_type}\n"
+            section = (f"\n# Output Configuration\n"
+                       f"- Output Directory: {agent.output_path}\n"
+                       f"- Output Type: {agent.output_type}\n")
 
             # Add guidance based on output type
             if agent.output_type == "new_file":
-                prompt += f"\n**IMPORTANT**: Create a NEW file in the `{agent.output_path}` directory.\n"
-                prompt += f"Do NOT modify the input file inline. The output should be a separate file.\n"
+                section += (f"\n**IMPORTANT**: Create a NEW file in the `{agent.output_path}` directory.\n"
+                            f"Do NOT modify the input file inline. The output should be a separate file.\n")
                 if agent.output_naming:
-                    prompt += f"Use naming pattern: {agent.output_naming}\n"
+                    section += f"Use naming pattern: {agent.output_naming}\n"
             elif agent.output_type == "update_file":
-                prompt += f"\n**IMPORTANT**: Update the input file IN PLACE.\n"
-                prompt += f"Do NOT create a new file.\n"
+                section += "\n**IMPORTANT**: Update the input file IN PLACE.\nDo NOT create a new file.\n"
+            parts.append(escape(section))
 
-        # Add frontmatter if available
-        if 'frontmatter' in trigger_data:
-            prompt += "\n# File Metadata\n"
-            for key, value in trigger_data['frontmatter'].items():
-                prompt += f"- {key}: {value}\n"
+        parts.append("{file_metadata}")
 
         # Add agent parameters if available
         if agent.agent_params:
-            prompt += "\n# Agent Parameters\n"
-            for key, value in agent.agent_params.items():
-                prompt += f"- {key}: {value}\n"
+            parts.append(escape("\n# Agent Parameters\n" + _format_items(agent.agent_params)))
 
-        return prompt
+        return "".join(parts)
 
     def _validate_agent_output(self, agent_output: str, agent: AgentDefinition, trigger_data: Dict, ctx: ExecutionContext) -> tuple:
         """
@@ -621,8 +1074,7 @@ class ExecutionManager:
             Tuple of (is_valid, output_link, error_message)
         """
         # Extract file path from wiki link format [[path/to/file]]
-        import re
-        match = re.search(r'\[\[([^\]]+)\]\]', agent_output)
+        match = _WIKI_LINK_RE.search(agent_output) if '[[' in agent_output else None
         if not match:
             return False, None, f"Invalid output format: {agent_output}. Expected wiki link format [[path/to/file]]"
         
@@ -634,12 +1086,8 @@ class ExecutionManager:
         # Try to resolve the file path
         output_path = self.vault_path / file_path_str
         if output_path.exists():
-            try:
-                rel_path = output_path.relative_to(self.vault_path)
-                output_link = f"[[{rel_path.parent}/{rel_path.stem}]]"
-                return True, output_link, None
-            except ValueError:
-                return True, f"[[{file_path_str}]]", None
+            output_link = _compute_wiki_link(str(self.vault_path), str(output_path))
+            return True, output_link or _wiki_link(file_path_str), None
         else:
             return False, None, f"Output file not found: {file_path_str}"
 
@@ -662,7 +1110,7 @@ class ExecutionManager:
         if not agent.output_path:
             # Verify input file still exists
             if input_path and input_path.exists():
-                return True, f"[[{input_path_str}]]", None
+                return True, _wiki_link(input_path_str), None
             else:
                 return False, None, "Input file no longer exists"
 
@@ -672,43 +1120,49 @@ class ExecutionManager:
                 return False, None, f"Input file not found: {input_path_str}"
 
             # Check if file was modified during execution
-            file_mtime = input_path.stat().st_mtime
-            start_time = ctx.start_time.timestamp() - 5 if ctx.start_time else 0
-
-            if file_mtime >= start_time:
-                return True, f"[[{input_path_str}]]", None
+            if input_path.stat().st_mtime_ns >= self._mtime_threshold_ns(ctx):
+                return True, _wiki_link(input_path_str), None
             else:
-                return False, f"[[{input_path_str}]]", "Input file was not modified (update_file mode)"
+                return False, _wiki_link(input_path_str), "Input file was not modified (update_file mode)"
 
         # For new_file: verify output directory has new files
         if agent.output_type == "new_file":
             output_dir = self.vault_path / agent.output_path
-            if not output_dir.exists():
-                output_dir.mkdir(parents=True, exist_ok=True)
 
             # Look for markdown files created/modified after execution started
-            start_time = ctx.start_time.timestamp() - 5 if ctx.start_time else 0
+            start_time_ns = self._mtime_threshold_ns(ctx)
             input_filename = Path(input_path_str).stem if input_path_str else ''
 
-            recent_files = []
-            for md_file in output_dir.glob("*.md"):
-                if md_file.stat().st_mtime >= start_time:
-                    # Prioritize files with matching input filename
-                    if input_filename and input_filename in md_file.stem:
-                        recent_files.insert(0, md_file)
-                    else:
-                        recent_files.append(md_file)
+            # Single scandir pass; DirEntry caches the stat and only the winner becomes a Path.
+            # The directory's own mtime can't short-circuit this: overwriting an existing
+            # output file updates the file's mtime but not the directory's.
+            best_key = None
+            best_path = None
+            try:
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.endswith('.md') or name.startswith('.') or not entry.is_file():
+                            continue
+                        mtime_ns = entry.stat().st_mtime_ns
+                        if mtime_ns < start_time_ns:
+                            continue
+                        # Prioritize files with matching input filename, then the newest
+                        key = (bool(input_filename) and input_filename in name[:-3], mtime_ns)
+                        if best_key is None or key > best_key:
+                            best_key, best_path = key, entry.path
+            except FileNotFoundError:
+                # No output directory yet: nothing was written; create it for next time
+                output_dir.mkdir(parents=True, exist_ok=True)
 
-            if recent_files:
-                # Use the most relevant file (first in list)
-                output_file = recent_files[0]
-                try:
-                    rel_path = output_file.relative_to(self.vault_path)
-                    output_link = f"[[{rel_path.parent}/{rel_path.stem}]]"
-                    logger.info(f"Found output file: {rel_path}")
-                    return True, output_link, None
-                except ValueError:
-                    return True, f"[[{output_file}]]", None
+            if best_path is not None:
+                # Use the most relevant file
+                output_file = Path(best_path)
+                output_link = _compute_wiki_link(str(self.vault_path), str(output_file))
+                if output_link is None:
+                    return True, _wiki_link(output_file), None
+                logger.info(f"Found output file: {output_link}")
+                return True, output_link, None
             else:
                 # No output files found
                 if agent.output_optional:
@@ -719,7 +1173,24 @@ class ExecutionManager:
                     return False, None, f"No new file found in {agent.output_path} (new_file mode)"
 
         # Default: no validation
-        return True, f"[[{input_path_str}]]" if input_path_str else None, None
+        return True, _wiki_link(input_path_str) if input_path_str else None, None
+
+    @staticmethod
+    def _mtime_threshold_ns(ctx: ExecutionContext) -> int:
+        """
+        Earliest mtime (ns) that counts as written during this execution.
+
+        Allows 5 seconds of slack for filesystem timestamp granularity.
+
+        Args:
+            ctx: Execution context
+
+        Returns:
+            Threshold in nanoseconds since the epoch (0 if start is unknown)
+        """
+        if ctx.start_time_ns is not None:
+            return ctx.start_time_ns - 5_000_000_000
+        return 0
 
     def _prepare_log_path(self, agent: AgentDefinition, ctx: ExecutionContext) -> Path:
         """
@@ -753,14 +1224,35 @@ class ExecutionManager:
             except Exception as e:
                 logger.warning(f"Failed to parse existing log path: {e}")
         
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_dir = log_path.parent
+        if log_dir not in self._mkdir_cache:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(log_dir)
 
         # Create empty log file if it doesn't exist to ensure wiki links work
-        if not log_path.exists():
-            log_path.touch()
+        # (a single open with O_CREAT; existing files are left untouched)
+        try:
+            fd = os.open(log_path, _TOUCH_FLAGS, 0o644)
+        except FileNotFoundError:
+            # Directory was removed since we cached it
+            log_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(log_path, _TOUCH_FLAGS, 0o644)
+        os.close(fd)
 
         return log_path
 
+    def _register_execution(self, ctx: ExecutionContext) -> None:
+        """Add an execution to the running registry and refresh the snapshot."""
+        with self._executions_lock:
+            self._running_executions[ctx.execution_id] = ctx
+            self._running_snapshot = tuple(self._running_executions.values())
+
+    def _unregister_execution(self, execution_id: str) -> None:
+        """Remove an execution from the running registry and refresh the snapshot."""
+        with self._executions_lock:
+            self._running_executions.pop(execution_id, None)
+            self._running_snapshot = tuple(self._running_executions.values())
+
     def get_running_count(self) -> int:
         """
         Get current number of running executions.
@@ -768,8 +1260,9 @@ class ExecutionManager:
         Returns:
             Number of running executions
         """
-        with self._count_lock:
-            return self._running_count
+        # Writers hold _sched_lock; a lock-free read is atomic under the GIL but
+        # may be stale by one start/finish, which is fine for status reporting
+        return self._running_count
 
     def get_agent_running_count(self, agent_abbr: str) -> int:
         """
@@ -781,18 +1274,17 @@ class ExecutionManager:
         Returns:
             Number of running executions for this agent
         """
-        with self._agent_lock:
-            return self._agent_counts.get(agent_abbr, 0)
+        # Lock-free like get_running_count(); Counter.get doesn't insert missing keys
+        return self._agent_counts.get(agent_abbr, 0)
 
-    def get_running_executions(self) -> List[ExecutionContext]:
+    def get_running_executions(self) -> Tuple[ExecutionContext, ...]:
         """
-        Get list of currently running executions.
+        Get currently running executions.
 
         Returns:
-            List of ExecutionContext instances
+            Immutable snapshot of ExecutionContext instances
         """
-        with self._executions_lock:
-            return list(self._running_executions.values())
+        return self._running_snapshot
 
     def update_settings(self, max_concurrent: int) -> None:
         """
@@ -803,11 +1295,21 @@ class ExecutionManager:
         Args:
             max_concurrent: New maximum concurrent executions
         """
-        with self._count_lock:
+        with self._sched_lock:
             old_max = self.max_concurrent
             self.max_concurrent = max_concurrent
             logger.info(f"Updated max_concurrent: {old_max} -> {max_concurrent}")
 
+            # Grow the I/O pool so new executions never queue behind each other.
+            # Work already submitted finishes on the old pool.
+            if max_concurrent > old_max and self._io_executor is not None:
+                old_executor = self._io_executor
+                self._io_executor = self._create_io_executor(max_concurrent)
+                old_executor.shutdown(wait=False)
+
+        # Pick up System Prompt.md edits on hot-reload (no-op if unchanged)
+        self.refresh_system_prompt()
+
     def _apply_post_processing(self, agent: AgentDefinition, trigger_data: Dict):
         """
         Apply post-processing actions after successful execution.
@@ -842,23 +1344,27 @@ class ExecutionManager:
 
             file_path = self.vault_path / event_path
 
-            if not file_path.exists():
+            # One descriptor for read and rewrite: no exists() check, no second open
+            try:
+                fd = os.open(file_path, _RDWR_FLAGS)
+            except FileNotFoundError:
                 logger.warning(f"Source file not found for post-processing: {file_path}")
                 return
 
-            # Read file content
-            content = file_path.read_text(encoding='utf-8')
+            try:
+                content = _read_fd(fd).decode('utf-8')
 
-            # Remove trigger pattern
-            from ..markdown_utils import remove_pattern_from_content
-            updated_content = remove_pattern_from_content(content, agent.trigger_content_pattern)
+                # Remove trigger pattern
+                updated_content = remove_pattern_from_content(content, agent.trigger_content_pattern)
 
-            # Write back if changed
-            if updated_content != content:
-                file_path.write_text(updated_content, encoding='utf-8')
-                logger.info(f"Removed trigger content from: {event_path}")
-            else:
-                logger.debug(f"No trigger content found to remove in: {event_path}")
+                # Write back in place if changed
+                if updated_content != content:
+                    _rewrite_fd(fd, updated_content.encode('utf-8'))
+                    logger.info(f"Removed trigger content from: {event_path}")
+                else:
+                    logger.debug(f"No trigger content found to remove in: {event_path}")
+            finally:
+                os.close(fd)
 
         except Exception as e:
             logger.error(f"Error during post-processing: {e}")
@@ -4,19 +4,141 @@ File system monitor for orchestrator.
 Monitors vault for file changes and queues events for processing.
 Uses debouncing to group rapid file changes and process them after a delay.
 """
+import functools
+import heapq
+import itertools
+import os
+import sys
 import threading
+import time
+from collections import deque
 from pathlib import Path
-from queue import Queue
+from queue import Empty
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
-from ..markdown_utils import read_frontmatter
+from .models import TriggerEvent
+from ..markdown_utils import extract_frontmatter
 from ..logger import Logger
 
 logger = Logger()
 
+# Maximum number of trigger events held before new ones are rejected
+EVENT_QUEUE_MAXSIZE = 10000
+
+# Extensions always watched, whatever the agents declare
+DEFAULT_WATCHED_EXTENSIONS = frozenset({'.md'})
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_frontmatter(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a file's frontmatter, memoized on its path, mtime and size.
+
+    Read errors propagate (and so are not cached).
+    """
+    return extract_frontmatter(Path(path_str).read_text(encoding='utf-8'))
+
+
+class RingEventQueue:
+    """
+    Bounded multi-producer, single-consumer event queue.
+
+    Producers append to a deque (atomic under the GIL) and set a wakeup flag;
+    only the consumer ever waits. Mirrors the subset of queue.Queue used by
+    the orchestrator: put, get, get_nowait, empty, qsize.
+    """
+
+    def __init__(self, maxsize: int = EVENT_QUEUE_MAXSIZE):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued items
+        """
+        self.maxsize = maxsize
+        self._items: deque = deque()
+        self._has_items = threading.Event()
+
+    def put(self, item: Any) -> bool:
+        """
+        Add an item without blocking.
+
+        Args:
+            item: Item to enqueue
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        if len(self._items) >= self.maxsize:
+            return False
+        self._items.append(item)
+        self._has_items.set()
+        return True
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """
+        Remove and return the oldest item.
+
+        Args:
+            block: Wait for an item if the queue is empty
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            Oldest queued item
+
+        Raises:
+            queue.Empty: If no item arrived in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            if not block:
+                raise Empty
+            # Clear, then re-check so a put that raced the clear isn't missed
+            self._has_items.clear()
+            if self._items:
+                continue
+            if deadline is None:
+                self._has_items.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._has_items.wait(remaining):
+                    raise Empty
+
+    def put_many(self, items: List[Any]) -> int:
+        """
+        Add a batch of items with a single wakeup.
+
+        Args:
+            items: Items to enqueue in order
+
+        Returns:
+            Number of items queued (the rest are rejected once the queue is full)
+        """
+        accepted = items[:max(0, self.maxsize - len(self._items))]
+        if accepted:
+            self._items.extend(accepted)
+            self._has_items.set()
+        return len(accepted)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the oldest item, raising queue.Empty if there is none."""
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        """Check if the queue has no items."""
+        return not self._items
+
+    def qsize(self) -> int:
+        """Number of queued items."""
+        return len(self._items)
+
 
 class FileSystemMonitor:
     """
@@ -37,17 +159,63 @@ class FileSystemMonitor:
         """
         self.vault_path = Path(vault_path)
         self.agent_registry = agent_registry
+        self.watched_extensions = self._collect_watched_extensions(agent_registry)
         self.observer = Observer()
-        self.event_queue = Queue()
+        self.event_queue = RingEventQueue()
         self._running = False
         self.debounce_interval = debounce_interval
         
-        # Debouncing state: (path, event_type) -> (event_data, timer)
-        self._pending_events: Dict[Tuple[str, str], Tuple[dict, Optional[threading.Timer]]] = {}
-        self._pending_events_lock = threading.Lock()
+        # Debouncing state: (path, event_type) -> (seq, event_data) for the latest event.
+        # One worker thread waits on the earliest deadline in the heap; heap entries
+        # whose seq no longer matches _pending_events are stale and skipped.
+        self._pending_events: Dict[Tuple[str, str], Tuple[int, dict]] = {}
+        self._deadline_heap: List[Tuple[float, int, Tuple[str, str]]] = []
+        self._debounce_seq = itertools.count()
+        self._pending_cond = threading.Condition()
+        self._debounce_stopped = False
+
+        # Watchdog thread appends (key, deadline, seq, event_data) here without locking;
+        # the worker moves a whole burst into the heap in one lock acquisition.
+        # _inbox_signalled is cleared by the worker before each drain.
+        self._inbox: deque = deque()
+        self._inbox_signalled = False
+        self._debounce_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _collect_watched_extensions(agent_registry) -> frozenset:
+        """
+        Build the set of file extensions worth turning into events.
+
+        Args:
+            agent_registry: AgentRegistry instance (or None)
+
+        Returns:
+            Frozen set of extensions such as {'.md', '.pdf'}
+        """
+        if agent_registry is None:
+            return DEFAULT_WATCHED_EXTENSIONS
+        extensions = set(DEFAULT_WATCHED_EXTENSIONS)
+        for agent in agent_registry.agents.values():
+            extensions.update(agent.trigger_extensions)
+        return frozenset(extensions)
+
+    def set_agent_registry(self, agent_registry):
+        """
+        Switch to a reloaded agent registry and refresh the watched extensions.
+
+        Args:
+            agent_registry: New AgentRegistry instance
+        """
+        self.agent_registry = agent_registry
+        self.watched_extensions = self._collect_watched_extensions(agent_registry)
 
     def start(self):
         """Start monitoring file system."""
+        with self._pending_cond:
+            self._debounce_stopped = False
+        self._debounce_thread = threading.Thread(target=self._debounce_loop, name="fs-debounce", daemon=True)
+        self._debounce_thread.start()
+
         event_handler = _FileEventHandler(self, self.vault_path, self.debounce_interval)
         self.observer.schedule(event_handler, str(self.vault_path), recursive=True)
         self.observer.start()
@@ -58,54 +226,103 @@ class FileSystemMonitor:
         """Stop monitoring file system."""
         self._running = False
         
-        # Cancel all pending debounce timers
-        with self._pending_events_lock:
-            for event_key, (_, timer) in self._pending_events.items():
-                if timer:
-                    timer.cancel()
+        # Drop all pending debounced events and stop the debounce worker
+        with self._pending_cond:
+            self._debounce_stopped = True
             self._pending_events.clear()
-        
+            self._deadline_heap.clear()
+            self._inbox.clear()
+            self._inbox_signalled = False
+            self._pending_cond.notify()
+
         self.observer.stop()
         self.observer.join()
+        if self._debounce_thread:
+            self._debounce_thread.join()
+            self._debounce_thread = None
         logger.info("File system monitoring stopped")
     
-    def _process_debounced_event(self, event_key: Tuple[str, str], event_data: dict):
+    def _debounce_loop(self):
+        """Worker loop: emit events once their debounce deadline has passed."""
+        while True:
+            with self._pending_cond:
+                while True:
+                    if self._debounce_stopped:
+                        return
+                    self._drain_inbox()
+                    ready = self._pop_due_events()
+                    if ready:
+                        break
+                    timeout = self._deadline_heap[0][0] - time.monotonic() if self._deadline_heap else None
+                    self._pending_cond.wait(timeout)
+
+            # Read frontmatter and queue outside the lock, as one batch
+            trigger_events = [self._build_trigger_event(event_data) for event_data in ready]
+            accepted = self.event_queue.put_many(trigger_events)
+            for trigger_event in trigger_events[accepted:]:
+                logger.warning(f"Event queue full, dropping {trigger_event.event_type} event: {trigger_event.path}")
+
+    def _drain_inbox(self):
+        """Move newly debounced events from the inbox into the heap (caller holds _pending_cond)."""
+        self._inbox_signalled = False
+        inbox = self._inbox
+        while inbox:
+            event_key, deadline, seq, event_data = inbox.popleft()
+            # Replace any pending event for this key; its heap entry becomes stale
+            self._pending_events[event_key] = (seq, event_data)
+            heapq.heappush(self._deadline_heap, (deadline, seq, event_key))
+
+    def _pop_due_events(self) -> List[dict]:
         """
-        Process a debounced event after delay.
-        
+        Pop events whose deadline has passed (caller holds _pending_cond).
+
+        Returns:
+            Event data for each event that is still the latest for its key
+        """
+        now = time.monotonic()
+        heap = self._deadline_heap
+        ready = []
+        while heap and heap[0][0] <= now:
+            _, seq, event_key = heapq.heappop(heap)
+            pending = self._pending_events.get(event_key)
+            if pending is not None and pending[0] == seq:
+                del self._pending_events[event_key]
+                ready.append(pending[1])
+        return ready
+
+    def _build_trigger_event(self, event_data: dict):
+        """
+        Build the TriggerEvent for a debounced event, reading its frontmatter.
+
         Args:
-            event_key: (path, event_type) tuple
             event_data: Event data dictionary
+
+        Returns:
+            TriggerEvent ready to be queued
         """
-        with self._pending_events_lock:
-            # Check if this event is still the latest (might have been replaced)
-            if event_key in self._pending_events:
-                stored_data, _ = self._pending_events[event_key]
-                if stored_data is event_data:  # Still the latest event
-                    del self._pending_events[event_key]
-                    
-                    # Read frontmatter now (file should be stable after debounce delay)
-                    frontmatter = {}
-                    if event_data['event_type'] != 'deleted' and 'file_path' in event_data:
-                        file_path = event_data['file_path']
-                        if file_path.exists():
-                            try:
-                                frontmatter = read_frontmatter(file_path)
-                            except Exception as e:
-                                logger.debug(f"Failed to read frontmatter for {event_data['path']}: {e}")
-                    
-                    # Create TriggerEvent and queue it
-                    from .models import TriggerEvent
-                    trigger_event = TriggerEvent(
-                        path=event_data['path'],
-                        event_type=event_data['event_type'],
-                        is_directory=event_data['is_directory'],
-                        timestamp=event_data['timestamp'],
-                        frontmatter=frontmatter
-                    )
-                    
-                    self.event_queue.put(trigger_event)
-                    logger.debug(f"Processed debounced {event_data['event_type']} event: {event_data['path']}")
+        # Read frontmatter now (file should be stable after debounce delay)
+        frontmatter = {}
+        if event_data['event_type'] != 'deleted' and 'file_path' in event_data \
+                and event_data['path'].endswith('.md'):
+            file_path = event_data['file_path']
+            try:
+                st = file_path.stat()
+            except OSError:
+                st = None
+            if st is not None:
+                try:
+                    # Repeated saves of unchanged content hit the cache; copy so callers can't mutate it
+                    frontmatter = dict(_cached_frontmatter(str(file_path), st.st_mtime_ns, st.st_size))
+                except Exception as e:
+                    logger.debug(f"Failed to read frontmatter for {event_data['path']}: {e}")
+
+        return TriggerEvent(
+            path=event_data['path'],
+            event_type=event_data['event_type'],
+            is_directory=event_data['is_directory'],
+            timestamp=datetime.fromtimestamp(event_data['timestamp_ns'] / 1e9),
+            frontmatter=frontmatter
+        )
     
     def _debounce_event(self, relative_path: str, event_type: str, event_data: dict):
         """
@@ -116,29 +333,21 @@ class FileSystemMonitor:
             event_type: Event type (created, modified, deleted, config_reload)
             event_data: Event data dictionary
         """
-        event_key = (relative_path, event_type)
-        
-        with self._pending_events_lock:
-            # Cancel existing timer for this event if any
-            if event_key in self._pending_events:
-                _, old_timer = self._pending_events[event_key]
-                if old_timer:
-                    old_timer.cancel()
-            
-            # Create new timer to process event after debounce interval
-            timer = threading.Timer(
-                self.debounce_interval,
-                self._process_debounced_event,
-                args=(event_key, event_data)
-            )
-            timer.daemon = True
-            timer.start()
-            
-            # Store event data and timer
-            self._pending_events[event_key] = (event_data, timer)
-            
-            logger.debug(f"Debouncing {event_type} event for {relative_path} "
-                        f"(will process after {self.debounce_interval}s)")
+        # Interned path: repeat events for one file hash/compare by identity
+        event_key = (sys.intern(relative_path), event_type)
+        deadline = time.monotonic() + self.debounce_interval
+
+        self._inbox.append((event_key, deadline, next(self._debounce_seq), event_data))
+
+        # Only the first event of a burst takes the lock to wake the worker;
+        # the rest ride along with the same drain
+        if not self._inbox_signalled:
+            with self._pending_cond:
+                self._inbox_signalled = True
+                self._pending_cond.notify()
+
+        logger.debug(f"Debouncing {event_type} event for {relative_path} "
+                    f"(will process after {self.debounce_interval}s)")
 
     @property
     def is_running(self) -> bool:
@@ -153,96 +362,77 @@ class _FileEventHandler(FileSystemEventHandler):
         self.file_monitor = file_monitor
         self.vault_path = vault_path
         self.debounce_interval = debounce_interval
+        # Watchdog reports paths under the scheduled root string, so a prefix slice
+        # gives the vault-relative path without Path.relative_to
+        self._vault_prefix = str(vault_path).rstrip('/\\') + os.sep
+
+    def _relative_path(self, path_str: str) -> str:
+        """Make a watchdog path relative to the vault (unchanged if outside it)."""
+        if path_str.startswith(self._vault_prefix):
+            return path_str[len(self._vault_prefix):]
+        return path_str
+
+    def _is_watched(self, path_str: str) -> bool:
+        """Check a path's extension against the monitor's watched set (one set lookup)."""
+        # Plain suffix/set checks: far cheaper than a regex scan of the whole path
+        dot = path_str.rfind('.')
+        # A dot in a directory name yields a "suffix" containing a separator, which never matches
+        return dot >= 0 and path_str[dot:] in self.file_monitor.watched_extensions
 
     def on_created(self, event: FileSystemEvent):
         """Handle file creation events."""
-        file_path = Path(event.src_path)
-        
-        # Make path relative to vault
-        try:
-            relative_path = file_path.relative_to(self.vault_path)
-        except ValueError:
-            relative_path = file_path
-        
-        # Check if this is orchestrator.yaml (special handling for hot-reload)
-        if str(relative_path) == "orchestrator.yaml":
+        src_path = event.src_path
+        if src_path.endswith('orchestrator.yaml') and self._relative_path(src_path) == "orchestrator.yaml":
+            # Special handling for hot-reload
             self._debounce_reload_event(event)
-        elif not event.is_directory and event.src_path.endswith('.md'):
+        elif not event.is_directory and self._is_watched(src_path):
             self._debounce_file_event(event, 'created')
 
     def on_modified(self, event: FileSystemEvent):
         """Handle file modification events."""
-        file_path = Path(event.src_path)
-        
-        # Make path relative to vault
-        try:
-            relative_path = file_path.relative_to(self.vault_path)
-        except ValueError:
-            relative_path = file_path
-        
-        # Check if this is orchestrator.yaml (special handling for hot-reload)
-        if str(relative_path) == "orchestrator.yaml":
+        src_path = event.src_path
+        if src_path.endswith('orchestrator.yaml') and self._relative_path(src_path) == "orchestrator.yaml":
+            # Special handling for hot-reload
             self._debounce_reload_event(event)
-        elif not event.is_directory and event.src_path.endswith('.md'):
+        elif not event.is_directory and self._is_watched(src_path):
             self._debounce_file_event(event, 'modified')
 
     def on_deleted(self, event: FileSystemEvent):
         """Handle file deletion events."""
-        if not event.is_directory and event.src_path.endswith('.md'):
+        if not event.is_directory and self._is_watched(event.src_path):
             self._debounce_file_event(event, 'deleted')
 
     def on_moved(self, event: FileSystemEvent):
         """Handle file move/rename events (e.g., atomic writes)."""
-        if not event.is_directory and event.dest_path.endswith('.md'):
+        if not event.is_directory and self._is_watched(event.dest_path):
             # Treat destination of move as a creation event
             # This handles atomic writes (temp file -> final file)
-            self._debounce_file_event_for_moved(event, 'created')
+            self._debounce_file_event(event, 'created', use_dest=True)
 
-    def _debounce_file_event(self, event: FileSystemEvent, event_type: str):
-        """Debounce a file event - will process after delay."""
-        file_path = Path(event.src_path)
+    def _debounce_file_event(self, event: FileSystemEvent, event_type: str, use_dest: bool = False):
+        """
+        Debounce a file event - will process after delay.
 
-        # Make path relative to vault
-        try:
-            relative_path = file_path.relative_to(self.vault_path)
-        except ValueError:
-            relative_path = file_path
+        Args:
+            event: Watchdog event
+            event_type: Event type to report (created, modified, deleted)
+            use_dest: Use the move destination instead of the source path
+        """
+        path_str = event.dest_path if use_dest else event.src_path
+        relative_path = self._relative_path(path_str)
 
         # Prepare event data (frontmatter will be read when event is processed)
         event_data = {
-            'path': str(relative_path),
-            'event_type': event_type,
-            'is_directory': event.is_directory,
-            'timestamp': datetime.now(),
-            'file_path': file_path,  # Store for later reading
-            'frontmatter': {}  # Will be populated when processed
-        }
-
-        # Debounce the event
-        self.file_monitor._debounce_event(str(relative_path), event_type, event_data)
-
-    def _debounce_file_event_for_moved(self, event: FileSystemEvent, event_type: str):
-        """Debounce a move event using the destination path."""
-        file_path = Path(event.dest_path)  # Use destination path
-
-        # Make path relative to vault
-        try:
-            relative_path = file_path.relative_to(self.vault_path)
-        except ValueError:
-            relative_path = file_path
-
-        # Prepare event data
-        event_data = {
-            'path': str(relative_path),
+            'path': relative_path,
             'event_type': event_type,
             'is_directory': event.is_directory,
-            'timestamp': datetime.now(),
-            'file_path': file_path,  # Store for later reading
+            'timestamp_ns': time.time_ns(),
+            'file_path': Path(path_str),  # Store for later reading
             'frontmatter': {}  # Will be populated when processed
         }
 
         # Debounce the event
-        self.file_monitor._debounce_event(str(relative_path), event_type, event_data)
+        self.file_monitor._debounce_event(relative_path, event_type, event_data)
 
     def _debounce_reload_event(self, event: FileSystemEvent):
         """Debounce a config reload event for orchestrator.yaml changes."""
@@ -250,7 +440,7 @@ class _FileEventHandler(FileSystemEventHandler):
             'path': "orchestrator.yaml",
             'event_type': "config_reload",
             'is_directory': False,
-            'timestamp': datetime.now(),
+            'timestamp_ns': time.time_ns(),
             'frontmatter': {}
         }
 
@@ -1,14 +1,40 @@
 """
 Data models for orchestrator components.
 """
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, FrozenSet, Optional, Any, Tuple
 import uuid
 
+# __slots__ instances (no per-instance __dict__) where dataclasses support it
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _ns_to_datetime(value: Optional[int]) -> Optional[datetime]:
+    """Convert a time.time_ns() value to a local datetime."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value / 1e9)
+
+
+def _datetime_to_ns(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to nanoseconds since the epoch (microsecond precision)."""
+    if value is None:
+        return None
+    return round(value.timestamp() * 1_000_000) * 1000
+
+
+def _strip_prompt_frontmatter(prompt_body: str) -> str:
+    """Drop a leading '---' frontmatter block from a prompt body, if present."""
+    if not prompt_body.startswith('---'):
+        return prompt_body
+    _, closing, rest = prompt_body[3:].partition('---')
+    return rest.strip() if closing else prompt_body
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AgentDefinition:
     """Represents a loaded agent definition."""
     # Basic identity
@@ -35,11 +61,13 @@ class AgentDefinition:
 
     # Execution
     prompt_body: str = ""
+    task_prompt_body: str = field(default="", init=False, repr=False, compare=False)  # prompt_body without frontmatter
     skills: List[str] = field(default_factory=list)
     mcp_servers: List[str] = field(default_factory=list)
     executor: str = "claude_code"
     max_parallel: int = 1
     timeout_minutes: int = 30
+    stream_logs: bool = False  # Log subprocess output line-by-line while the agent runs
 
     # Post-processing
     post_process_action: Optional[str] = None  # e.g., "remove_trigger_content"
@@ -61,16 +89,36 @@ class AgentDefinition:
     # Agent-specific parameters from orchestrator.yaml
     agent_params: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Intern hot dict keys (counter lookups, executor dispatch)
+        self.abbreviation = sys.intern(self.abbreviation)
+        self.executor = sys.intern(self.executor)
+        self.task_prompt_body = _strip_prompt_frontmatter(self.prompt_body)
 
-@dataclass
+    @property
+    def trigger_extensions(self) -> FrozenSet[str]:
+        """File extensions (e.g. '.md') this agent's trigger pattern can match; empty if not literal."""
+        if not self.trigger_pattern:
+            return frozenset()
+        name = self.trigger_pattern.rsplit('/', 1)[-1]
+        dot = name.rfind('.')
+        ext = name[dot:] if dot >= 0 else ''
+        if len(ext) < 2 or any(ch in ext for ch in '*?['):
+            return frozenset()
+        return frozenset({ext})
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ExecutionContext:
     """Context for a single agent execution."""
     execution_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     agent: Optional[AgentDefinition] = None
     trigger_data: Dict[str, Any] = field(default_factory=dict)
 
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    # Timestamps are kept as time.time_ns() values (comparable with st_mtime_ns);
+    # start_time/end_time convert to datetime on demand
+    start_time_ns: Optional[int] = None
+    end_time_ns: Optional[int] = None
 
     # Execution results
     status: str = "pending"  # pending, completed, failed, timeout
@@ -81,12 +129,31 @@ class ExecutionContext:
     # File paths
     log_file: Optional[Path] = None
     task_file: Optional[Path] = None  # Path to task tracking file in AI/Tasks/
+    task_file_stat: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size) after our last write
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Execution start as a local datetime."""
+        return _ns_to_datetime(self.start_time_ns)
+
+    @start_time.setter
+    def start_time(self, value: Optional[datetime]):
+        self.start_time_ns = _datetime_to_ns(value)
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Execution end as a local datetime."""
+        return _ns_to_datetime(self.end_time_ns)
+
+    @end_time.setter
+    def end_time(self, value: Optional[datetime]):
+        self.end_time_ns = _datetime_to_ns(value)
 
     @property
     def duration(self) -> Optional[float]:
         """Execution duration in seconds."""
-        if self.start_time and self.end_time:
-            return (self.end_time - self.start_time).total_seconds()
+        if self.start_time_ns is not None and self.end_time_ns is not None:
+            return (self.end_time_ns - self.start_time_ns) / 1e9
         return None
 
     @property
@@ -95,7 +162,7 @@ class ExecutionContext:
         return self.status == "completed" and self.error_message is None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TriggerEvent:
     """Represents a trigger event (file system or scheduled)."""
     path: str
@@ -1,11 +1,95 @@
 """Poller manager for orchestrator - manages enabled pollers."""
 
+import concurrent.futures
+import importlib
+import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from ..logger import Logger
 
 logger = Logger()
 
+# Poller name -> (module relative to this package, class name).
+# Modules are imported only for enabled pollers, since some pull in heavy
+# platform bridges (Photos, Notes).
+_POLLER_SPECS = {
+    'apple_photos': ('..pollers.apple_photos', 'ApplePhotosPoller'),
+    'apple_notes': ('..pollers.apple_notes', 'AppleNotesPoller'),
+    'gobi': ('..pollers.gobi', 'GobiPoller'),
+    'gobi_by_tags': ('..pollers.gobi_by_tags', 'GobiByTagsPoller'),
+    'limitless': ('..pollers.limitless', 'LimitlessPoller'),
+}
+
+
+def _import_poller_class(poller_name: str) -> type:
+    """
+    Import and return the poller class for a poller name.
+
+    Args:
+        poller_name: Key in _POLLER_SPECS
+
+    Returns:
+        Poller class (repeat calls are served from sys.modules)
+    """
+    module_name, class_name = _POLLER_SPECS[poller_name]
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
+
+
+def _config_fingerprint(poller_config: Any) -> str:
+    """Canonical form of a poller's config subtree, for change detection."""
+    return json.dumps(poller_config, sort_keys=True, default=str)
+
+
+def _partition_pollers(
+    pollers_config: Dict[str, Any], skip: Iterable[str] = ()
+) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str], List[str]]:
+    """
+    Split the pollers config section by what PollerManager should do with each entry.
+
+    Args:
+        pollers_config: 'pollers' section of orchestrator.yaml
+        skip: Poller names to leave out entirely
+
+    Returns:
+        Tuple of ([(name, config)] enabled and known, disabled names, enabled but unknown names)
+    """
+    known, disabled, unknown = [], [], []
+    for poller_name, poller_config in pollers_config.items():
+        if poller_name in skip:
+            continue
+        if not poller_config.get('enabled', False):
+            disabled.append(poller_name)
+        elif poller_name not in _POLLER_SPECS:
+            unknown.append(poller_name)
+        else:
+            known.append((poller_name, poller_config))
+    return known, disabled, unknown
+
+
+def describe_enabled_pollers(config: 'Config') -> List[Dict[str, Any]]:
+    """
+    Summarize the pollers PollerManager would load, without importing them.
+
+    Args:
+        config: Config instance
+
+    Returns:
+        List of dicts with name, target_dir and poll_interval, sorted by name
+    """
+    pollers = []
+    known, _, _ = _partition_pollers(config.get_pollers_config() or {})
+    for poller_name, poller_config in known:
+        target_dir = poller_config.get('target_dir')
+        if not target_dir:
+            continue
+        pollers.append({
+            'name': poller_name,
+            'target_dir': target_dir,
+            'poll_interval': poller_config.get('poll_interval', 3600),
+        })
+    return sorted(pollers, key=lambda p: p['name'])
+
 
 class PollerManager:
     """Manages poller instances based on orchestrator.yaml configuration."""
@@ -25,43 +109,34 @@ class PollerManager:
         
         # Map of poller name -> poller instance
         self.pollers: Dict[str, 'BasePoller'] = {}
+
+        # Map of poller name -> fingerprint of the config it was created from
+        self._config_fingerprints: Dict[str, str] = {}
         
         # Load and initialize enabled pollers
         self._load_pollers()
 
-    def _load_pollers(self) -> None:
-        """Load and initialize enabled pollers from config."""
+    def _load_pollers(self, skip: Iterable[str] = ()) -> None:
+        """
+        Load and initialize enabled pollers from config.
+
+        Args:
+            skip: Poller names to leave alone (already loaded with the same config)
+        """
         pollers_config = self.config.get_pollers_config()
         
         if not pollers_config:
             self.logger.debug("No pollers configuration found")
             return
         
-        # Import poller classes
-        from ..pollers.apple_photos import ApplePhotosPoller
-        from ..pollers.apple_notes import AppleNotesPoller
-        from ..pollers.gobi import GobiPoller
-        from ..pollers.gobi_by_tags import GobiByTagsPoller
-        from ..pollers.limitless import LimitlessPoller
-        
-        # Map poller names to classes
-        poller_classes = {
-            'apple_photos': ApplePhotosPoller,
-            'apple_notes': AppleNotesPoller,
-            'gobi': GobiPoller,
-            'gobi_by_tags': GobiByTagsPoller,
-            'limitless': LimitlessPoller,
-        }
-        
-        for poller_name, poller_config in pollers_config.items():
-            if not poller_config.get('enabled', False):
-                self.logger.debug(f"Poller '{poller_name}' is disabled, skipping")
-                continue
-            
-            if poller_name not in poller_classes:
-                self.logger.warning(f"Unknown poller name: {poller_name}")
-                continue
-            
+        # Filter down to enabled, known pollers before doing any per-poller work
+        known, disabled, unknown = _partition_pollers(pollers_config, skip)
+        if disabled:
+            self.logger.debug(f"Pollers disabled, skipping: {', '.join(disabled)}")
+        if unknown:
+            self.logger.warning(f"Unknown poller name(s): {', '.join(unknown)}")
+
+        for poller_name, poller_config in known:
             try:
                 target_dir = poller_config.get('target_dir')
                 if not target_dir:
@@ -70,14 +145,15 @@ class PollerManager:
                 
                 poll_interval = poller_config.get('poll_interval', 3600)
                 
-                # Instantiate poller (each poller uses its own module-level logger)
-                poller_class = poller_classes[poller_name]
+                # Import lazily, then instantiate (each poller uses its own module-level logger)
+                poller_class = _import_poller_class(poller_name)
                 poller = poller_class(
                     poller_config=poller_config,
                     vault_path=self.vault_path
                 )
                 
                 self.pollers[poller_name] = poller
+                self._config_fingerprints[poller_name] = _config_fingerprint(poller_config)
                 self.logger.info(f"Loaded poller: {poller_name} (target: {target_dir}, interval: {poll_interval}s)")
                 
             except Exception as e:
@@ -90,11 +166,41 @@ class PollerManager:
             return
         
         self.logger.info(f"Starting {len(self.pollers)} poller(s)...")
-        for name, poller in self.pollers.items():
-            try:
-                poller.start()
-            except Exception as e:
-                self.logger.error(f"Failed to start poller '{name}': {e}", exc_info=True)
+        self._start_pollers(self.pollers)
+
+    def _start_pollers(self, names: Iterable[str]) -> None:
+        """
+        Start the named pollers, logging (not raising) failures.
+
+        Args:
+            names: Names of loaded pollers to start
+        """
+        self._call_pollers(names, 'start')
+
+    def _call_pollers(self, names: Iterable[str], action: str) -> None:
+        """
+        Call start() or stop() on the named pollers concurrently.
+
+        Poller start/stop mostly waits on network or database handshakes, so
+        fanning out makes the total wait the slowest poller, not the sum.
+
+        Args:
+            names: Names of loaded pollers
+            action: Method to call ('start' or 'stop')
+        """
+        names = list(names)
+        if not names:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(names),
+                                                   thread_name_prefix=f"poller-{action}") as pool:
+            futures = {pool.submit(getattr(self.pollers[name], action)): name for name in names}
+            for future in concurrent.futures.as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to {action} poller '{name}': {e}", exc_info=True)
 
     def stop_all(self) -> None:
         """Stop all running pollers."""
@@ -102,11 +208,7 @@ class PollerManager:
             return
         
         self.logger.info(f"Stopping {len(self.pollers)} poller(s)...")
-        for name, poller in self.pollers.items():
-            try:
-                poller.stop()
-            except Exception as e:
-                self.logger.error(f"Failed to stop poller '{name}': {e}", exc_info=True)
+        self._call_pollers(self.pollers, 'stop')
 
     def get_status(self) -> Dict[str, Dict]:
         """
@@ -139,23 +241,31 @@ class PollerManager:
 
     def reload(self) -> None:
         """
-        Reload poller configuration from config and restart pollers.
+        Reload poller configuration from config and restart changed pollers.
         
-        Stops all running pollers, reloads config, and starts newly configured pollers.
+        Pollers whose config subtree is unchanged keep running; pollers that were
+        changed or removed are stopped, and changed or new ones are (re)started.
         """
         self.logger.info("Reloading poller configuration...")
-        
-        # Stop all running pollers
-        self.stop_all()
-        
-        # Clear existing pollers
-        self.pollers.clear()
-        
-        # Reload pollers from config
-        self._load_pollers()
-        
-        # Start all newly configured pollers
-        self.start_all()
-        
-        self.logger.info(f"Poller reload complete: {len(self.pollers)} poller(s) loaded")
+
+        pollers_config = self.config.get_pollers_config() or {}
+        unchanged: Set[str] = {
+            name for name in self.pollers
+            if name in pollers_config and
+            _config_fingerprint(pollers_config[name]) == self._config_fingerprints.get(name)
+        }
+
+        # Stop and drop pollers whose config changed or disappeared
+        stale = [name for name in self.pollers if name not in unchanged]
+        self._call_pollers(stale, 'stop')
+        for name in stale:
+            del self.pollers[name]
+            self._config_fingerprints.pop(name, None)
+
+        # Load changed/new pollers and start only those
+        self._load_pollers(skip=unchanged)
+        self._start_pollers([name for name in self.pollers if name not in unchanged])
+
+        self.logger.info(f"Poller reload complete: {len(self.pollers)} poller(s) loaded "
+                         f"({len(unchanged)} unchanged)")
 
@@ -3,15 +3,120 @@ Task file manager for orchestrator.
 
 Creates and updates task tracking files in _Tasks_/ directory.
 """
+import os
+import re
+import tempfile
+import threading
+from io import StringIO
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ruamel.yaml import YAML
+from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
 from .models import AgentDefinition, ExecutionContext
 from ..logger import Logger
 
 logger = Logger()
 
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_STATUS_OUTPUT_RE = re.compile(r'^(status|output):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# Scalars the line scan can read without YAML: quoted strings without escapes,
+# or bare words that YAML would not turn into null/bool
+_QUOTED_SCALAR_RE = re.compile(r'"([^"\\]*)"|\'([^\']*)\'')
+_BARE_SCALAR_RE = re.compile(r'[A-Za-z][\w-]*')
+_YAML_BARE_KEYWORDS = frozenset({'null', 'true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n'})
+
+# Top-level double-quoted status line, and the status values written into it as-is
+_QUOTED_STATUS_LINE_RE = re.compile(r'^status:[ \t]*"[^"\\\n]*"[ \t]*$', re.MULTILINE)
+_STATUS_WORD_RE = re.compile(r'[A-Za-z_]+')
+
+# Delay before buffered status writes are fsync'ed (seconds)
+SYNC_INTERVAL = 0.05
+
+# mkstemp creates files readable only by the owner; task files get the
+# mode a plain open() would give them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_TASK_FILE_MODE = 0o666 & ~_UMASK
+
+# Upper bound on threads used by create_task_files
+TASK_WRITE_WORKERS = 8
+
+_PROCESS_LOG_HEADING = "## Process Log"
+
+_PATH_SEPARATORS = '\\/' if os.name == 'nt' else '/'
+
+# Statuses after which a task file is still expected to be updated again
+_ACTIVE_STATUSES = frozenset({'QUEUED', 'IN_PROGRESS'})
+
+# One dumper for all task frontmatter: building a YAML() is most of the cost
+# of a dump, and a dumper may only be used by one thread at a time
+_FRONTMATTER_YAML = YAML()
+_FRONTMATTER_YAML.preserve_quotes = True
+_FRONTMATTER_YAML.width = 4096
+_FRONTMATTER_YAML_LOCK = threading.Lock()
+
+
+def _replace_status_line(content: str, status: str) -> Optional[str]:
+    """
+    Set the frontmatter status by rewriting its line in place.
+
+    Args:
+        content: Task file content
+        status: New status value
+
+    Returns:
+        Updated content, or None if the frontmatter doesn't have exactly one
+        plain double-quoted status line (callers then use the YAML round-trip)
+    """
+    match = _FRONTMATTER_RE.match(content)
+    if not match or not _STATUS_WORD_RE.fullmatch(status):
+        return None
+    lines = list(_QUOTED_STATUS_LINE_RE.finditer(content, match.start(1), match.end(1)))
+    if len(lines) != 1:
+        return None
+
+    start, end = lines[0].span()
+    return f'{content[:start]}status: "{status}"{content[end:]}'
+
+
+def _path_stem(path: str) -> str:
+    """
+    Final path component without its suffix, as Path(path).stem computes it.
+
+    Args:
+        path: File path string (trigger data paths)
+
+    Returns:
+        Stem of the last path component
+    """
+    name = os.path.basename(path.rstrip(_PATH_SEPARATORS))
+    if name == '.':
+        # Path drops '.' components; leave such paths to it
+        return Path(path).stem
+    dot = name.rfind('.')
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+def _fsync_directory(directory: Path):
+    """Fsync a directory so renames inside it survive a crash (no-op on Windows)."""
+    if os.name == 'nt':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.warning(f"Failed to sync directory {directory}: {e}")
+    finally:
+        os.close(fd)
+
 
 class TaskFileManager:
     """Manages task file creation and updates."""
@@ -40,6 +145,30 @@ class TaskFileManager:
         self.tasks_dir = self.vault_path / tasks_dir
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
 
+        # Task files written by update_task_status but not yet fsync'ed
+        self._unsynced: Set[Path] = set()
+        self._sync_lock = threading.Lock()
+        self._sync_timer: Optional[threading.Timer] = None
+
+        # Last content written for active tasks: path -> (stat signature, content).
+        # Reused by update_task_status while the file on disk is unchanged.
+        self._content_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+    def get_task_path(self, ctx: ExecutionContext, agent: AgentDefinition) -> Optional[Path]:
+        """
+        Get the path a task file for this execution will be written to.
+
+        Args:
+            ctx: Execution context
+            agent: Agent definition
+
+        Returns:
+            Path to task file, or None if task creation disabled
+        """
+        if not agent.task_create:
+            return None
+        return self.tasks_dir / self._generate_task_filename(ctx, agent)
+
     def create_task_file(
         self,
         ctx: ExecutionContext,
@@ -64,9 +193,7 @@ class TaskFileManager:
             return None
 
         try:
-            # Generate task filename
-            task_filename = self._generate_task_filename(ctx, agent)
-            task_path = self.tasks_dir / task_filename
+            task_path = self.get_task_path(ctx, agent)
 
             # Check if task file already exists (prevent duplicates)
             if task_path.exists():
@@ -75,7 +202,6 @@ class TaskFileManager:
 
             # Get input file info
             input_file_path = ctx.trigger_data.get('path', 'unknown')
-            input_file_name = Path(input_file_path).stem
 
             # Get generation log link
             log_link = ""
@@ -98,7 +224,9 @@ class TaskFileManager:
             )
 
             # Write task file
-            task_path.write_text(task_content, encoding='utf-8')
+            self._write_task_file(task_path, task_content, durable=False)
+            ctx.task_file_stat = self.stat_task_file(task_path)
+            self._cache_content(task_path, initial_status, ctx.task_file_stat, task_content)
             logger.info(f"💾 Created task file: {task_path.name}", console=True)
 
             return task_path
@@ -107,29 +235,59 @@ class TaskFileManager:
             logger.error(f"Failed to create task file: {e}")
             return None
 
+    def create_task_files(
+        self,
+        tasks: List[Tuple[ExecutionContext, AgentDefinition, str, Optional[str]]]
+    ) -> List[Optional[Path]]:
+        """
+        Create several task files, writing them concurrently.
+
+        Args:
+            tasks: (ctx, agent, initial_status, trigger_data_json) per task file
+
+        Returns:
+            Result of create_task_file for each entry, in order
+        """
+        if len(tasks) <= 1:
+            return [self.create_task_file(*task) for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=min(len(tasks), TASK_WRITE_WORKERS),
+                                thread_name_prefix="task-write") as pool:
+            return list(pool.map(lambda task: self.create_task_file(*task), tasks))
+
     def update_task_status(
         self,
         task_path: Path,
         status: str,
         output: Optional[str] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        durable: bool = False
     ):
         """
         Update task file status and output.
 
+        The file is written immediately; the fsync is batched with other
+        updates unless durable is set.
+
         Args:
             task_path: Path to task file
             status: New status (IN_PROGRESS, PROCESSED, FAILED, etc.)
             output: Optional output file link
             error_message: Optional error message for failed tasks
+            durable: If True, fsync before returning
         """
-        if not task_path or not task_path.exists():
+        signature = self.stat_task_file(task_path) if task_path else None
+        if signature is None:
             logger.warning(f"Task file not found: {task_path}")
             return
 
         try:
-            # Read current content
-            content = task_path.read_text(encoding='utf-8')
+            # Reuse our last write unless the file changed since
+            cached = self._content_cache.get(task_path)
+            if cached is not None and cached[0] == signature:
+                content = cached[1]
+            else:
+                content = task_path.read_text(encoding='utf-8')
 
             # Update frontmatter
             from ..markdown_utils import update_frontmatter_fields
@@ -141,18 +299,256 @@ class TaskFileManager:
                 # Add error to Process Log section instead of frontmatter
                 content = self._append_to_process_log(content, f"Error: {error_message}")
 
-            content = update_frontmatter_fields(content, updates)
+            # Status-only updates rewrite the one line instead of round-tripping the YAML
+            updated = _replace_status_line(content, status) if len(updates) == 1 else None
+            content = updated if updated is not None else update_frontmatter_fields(content, updates)
+
+            self._write_task_file(task_path, content, durable=durable)
+            self._cache_content(task_path, status, self.stat_task_file(task_path), content)
+            logger.info(f"🔄 Updated task file ({status}): {task_path.name}", console=True)
+
+        except Exception as e:
+            self._content_cache.pop(task_path, None)
+            logger.error(f"❌ Failed to update task file: {e}")
+
+    def _cache_content(self, task_path: Path, status: str, signature: Optional[Tuple[int, int]], content: str):
+        """
+        Remember written content for a task that will be updated again.
+
+        Args:
+            task_path: Path to task file
+            status: Status just written
+            signature: stat_task_file() of the file after the write
+            content: Content just written
+        """
+        if status in _ACTIVE_STATUSES and signature is not None:
+            self._content_cache[task_path] = (signature, content)
+        else:
+            self._content_cache.pop(task_path, None)
 
-            # Write back with explicit flush and sync to ensure disk write
-            import os
+    def _write_task_file(self, task_path: Path, content: str, durable: bool):
+        """
+        Replace a task file's content atomically.
+
+        Writes a uniquely named sibling temp file and renames it over the task
+        file, so a crash never leaves a half-written task and concurrent
+        writers never share a temp file. Non-durable writes queue the file for
+        the next batched fsync.
+
+        Args:
+            task_path: Path to task file
+            content: New file content
+            durable: If True, fsync the data and directory before returning
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=task_path.parent, prefix='.', suffix='.tmp')
+        tmp_path = Path(tmp_name)
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(f.fileno(), _TASK_FILE_MODE)
+                f.write(content)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, task_path)
+        except PermissionError:
+            # Windows refuses to replace a file another process has open
+            tmp_path.unlink(missing_ok=True)
             with open(task_path, 'w', encoding='utf-8') as f:
                 f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if durable:
+            _fsync_directory(task_path.parent)
+        else:
+            self._schedule_sync(task_path)
+
+    def _schedule_sync(self, task_path: Path):
+        """
+        Queue a written task file for the next batched fsync.
+
+        Args:
+            task_path: Path to task file
+        """
+        with self._sync_lock:
+            self._unsynced.add(task_path)
+            if self._sync_timer is None:
+                self._sync_timer = threading.Timer(SYNC_INTERVAL, self.flush)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def flush(self):
+        """Fsync all task files with buffered status updates."""
+        with self._sync_lock:
+            paths, self._unsynced = self._unsynced, set()
+            timer, self._sync_timer = self._sync_timer, None
+        if timer is not None:
+            timer.cancel()
+
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDWR)
+            except OSError:
+                # Moved or deleted since the write; nothing left to sync
+                continue
+            try:
+                os.fsync(fd)
+            except OSError as e:
+                logger.error(f"❌ Failed to sync task file {path.name}: {e}")
+            finally:
+                os.close(fd)
+
+        # Persist the renames that put the synced files in place
+        for directory in {path.parent for path in paths}:
+            _fsync_directory(directory)
+
+    @staticmethod
+    def stat_task_file(task_path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Get a cheap change signature for a task file.
+
+        Args:
+            task_path: Path to task file
+
+        Returns:
+            Tuple of (st_mtime_ns, st_size), or None if the file can't be stat'ed
+        """
+        try:
+            st = task_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def read_task_file(self, task_path: Path) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Read a task file and parse its frontmatter.
+
+        Args:
+            task_path: Path to task file
+
+        Returns:
+            Tuple of (content, frontmatter); (None, {}) if the file can't be read
+        """
+        from ..markdown_utils import extract_frontmatter
+
+        try:
+            content = task_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None, {}
+        return content, extract_frontmatter(content)
+
+    def read_task_status(self, task_path: Path) -> Tuple[Optional[str], str, str]:
+        """
+        Read a task file and extract its status and output fields.
+
+        Scans the frontmatter lines for the two keys and only falls back to a
+        full YAML parse when a value isn't a simple scalar.
+
+        Args:
+            task_path: Path to task file
+
+        Returns:
+            Tuple of (content, status, output); (None, "", "") if the file can't be read
+        """
+        try:
+            content = task_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None, "", ""
+
+        fields = self.quick_read_status_output(content)
+        if fields is None:
+            from ..markdown_utils import extract_frontmatter
+
+            frontmatter = extract_frontmatter(content)
+            fields = tuple(str(frontmatter.get(key) or '') for key in ('status', 'output'))
+        return (content,) + fields
+
+    @staticmethod
+    def quick_read_status_output(content: str) -> Optional[Tuple[str, str]]:
+        """
+        Extract status and output from frontmatter with a line scan.
+
+        Args:
+            content: Task file content
+
+        Returns:
+            Tuple of (status, output) ("" when a key is absent), or None if a
+            value needs a real YAML parse
+        """
+        match = _FRONTMATTER_RE.match(content)
+        if not match:
+            return "", ""
+
+        values = {'status': '', 'output': ''}
+        for key, raw in _STATUS_OUTPUT_RE.findall(match.group(1)):
+            if not raw:
+                # Could be null or the start of a nested block
+                return None
+            if raw[0] in '"\'':
+                quoted = _QUOTED_SCALAR_RE.fullmatch(raw)
+                if not quoted:
+                    return None
+                value = quoted.group(1) if quoted.group(1) is not None else quoted.group(2)
+            elif _BARE_SCALAR_RE.fullmatch(raw) and raw.lower() not in _YAML_BARE_KEYWORDS:
+                value = raw
+            else:
+                return None
+            values[key] = value
+        return values['status'], values['output']
+
+    def finalize_task(
+        self,
+        task_path: Path,
+        status: str,
+        output: Optional[str] = None,
+        error_message: Optional[str] = None,
+        process_log_summary: Optional[str] = None,
+        content: Optional[str] = None
+    ):
+        """
+        Write the final status of a task in a single read-modify-write.
+
+        Args:
+            task_path: Path to task file
+            status: Final status (PROCESSED, FAILED, IGNORE)
+            output: Optional output file link
+            error_message: Optional error message for failed tasks
+            process_log_summary: Optional execution summary for the Process Log
+            content: Current file content if the caller already read it
+        """
+        self._content_cache.pop(task_path, None)
+        try:
+            # Read current content unless the caller already has it
+            if content is None:
+                if not task_path or not task_path.exists():
+                    logger.warning(f"Task file not found: {task_path}")
+                    return
+                content = task_path.read_text(encoding='utf-8')
+
+            from ..markdown_utils import update_frontmatter_fields
+
+            updates = {'status': status}
+            if output:
+                updates['output'] = output
+            if error_message:
+                # Add error to Process Log section instead of frontmatter
+                content = self._append_to_process_log(content, f"Error: {error_message}")
+            if process_log_summary:
+                content = self._append_to_process_log(content, process_log_summary)
+
+            content = update_frontmatter_fields(content, updates)
+
+            # Write back and sync to ensure disk write
+            self._write_task_file(task_path, content, durable=True)
             logger.info(f"🔄 Updated task file ({status}): {task_path.name}", console=True)
 
         except Exception as e:
-            logger.error(f"❌ Failed to update task file: {e}")
+            logger.error(f"❌ Failed to finalize task file: {e}")
 
     def update_task_status_with_trigger_data(
         self,
@@ -170,6 +566,7 @@ class TaskFileManager:
             status: New status (typically "QUEUED")
             trigger_data_json: JSON-encoded trigger data to add to frontmatter
         """
+        self._content_cache.pop(task_path, None)
         if not task_path or not task_path.exists():
             logger.warning(f"Task file not found: {task_path}")
             return
@@ -238,12 +635,8 @@ class TaskFileManager:
             # Update status
             content = update_frontmatter_fields(content, updates)
 
-            # Write back with explicit flush and sync to ensure disk write
-            import os
-            with open(task_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())
+            # Write back and sync to ensure disk write
+            self._write_task_file(task_path, content, durable=True)
             logger.info(f"🔄 Updated task file ({status} with trigger_data): {task_path.name}", console=True)
 
         except Exception as e:
@@ -263,11 +656,19 @@ class TaskFileManager:
         Returns:
             Truncated filename that fits within byte limit
         """
+        # ASCII names (the common case) have one byte per character
+        ascii_only = filename.isascii()
+        if ascii_only and len(filename) <= max_bytes:
+            return filename
+
         # Split into stem and extension
         path = Path(filename)
         stem = path.stem
         ext = path.suffix
 
+        if ascii_only:
+            return f"{stem[:max_bytes - len(ext) - 3]}...{ext}"
+
         # Calculate current byte length
         current_bytes = len(filename.encode('utf-8'))
 
@@ -299,16 +700,17 @@ class TaskFileManager:
         Returns:
             Task filename (truncated to fit macOS 255-byte limit)
         """
-        date_str = ctx.start_time.strftime('%Y-%m-%d') if ctx.start_time else datetime.now().strftime('%Y-%m-%d')
+        # start_time is derived from start_time_ns on every access; read it once
+        start_time = ctx.start_time or datetime.now()
+        date_str = start_time.date().isoformat()
 
         # Extract input filename from trigger data
         input_path = ctx.trigger_data.get('path', '')
         if input_path:
-            input_name = Path(input_path).stem
+            input_name = _path_stem(input_path)
         else:
             # For scheduled agents, use 'scheduled' with timestamp
-            timestamp = ctx.start_time.strftime('%H%M') if ctx.start_time else datetime.now().strftime('%H%M')
-            input_name = f'scheduled-{timestamp}'
+            input_name = f'scheduled-{start_time.hour:02d}{start_time.minute:02d}'
 
         filename = f"{date_str} {agent.abbreviation} - {input_name}.md"
 
@@ -338,14 +740,10 @@ class TaskFileManager:
         Returns:
             Task file content
         """
-        from ruamel.yaml import YAML
-        from ruamel.yaml.scalarstring import DoubleQuotedScalarString
-        from io import StringIO
-        
         # Build frontmatter data structure
-        created_time = ctx.start_time.isoformat() if ctx.start_time else datetime.now().isoformat()
+        created_time = (ctx.start_time or datetime.now()).isoformat()
         
-        title = f"{agent.abbreviation} - {Path(input_file_path).stem}"
+        title = f"{agent.abbreviation} - {_path_stem(input_file_path)}"
         
         frontmatter_data = {
             'title': title,
@@ -366,39 +764,15 @@ class TaskFileManager:
         # Add trigger data for QUEUED tasks
         if trigger_data_json:
             frontmatter_data['trigger_data_json'] = trigger_data_json
-        
-        # Use ruamel.yaml to generate properly quoted YAML
-        yaml_parser = YAML()
-        yaml_parser.preserve_quotes = True
-        yaml_parser.width = 4096
-        
-        # Convert ALL string values to DoubleQuotedScalarString for consistency
-        for key, value in frontmatter_data.items():
-            if isinstance(value, str):
-                # Always quote ALL string fields for consistency
-                frontmatter_data[key] = DoubleQuotedScalarString(value)
-            elif isinstance(value, dict):
-                # Handle nested dicts (like agent_params)
-                for nested_key, nested_value in value.items():
-                    if isinstance(nested_value, str):
-                        value[nested_key] = DoubleQuotedScalarString(nested_value)
-        
-        # Generate YAML frontmatter
-        stream = StringIO()
-        yaml_parser.dump(frontmatter_data, stream)
-        frontmatter = "---\n" + stream.getvalue() + "---"
+
+        frontmatter = self._render_frontmatter(frontmatter_data)
 
         # Build body
         event_type = ctx.trigger_data.get('event_type', 'unknown')
         event_desc = f"{event_type.capitalize()} file event triggered {agent.name} processing"
 
-        # Remove frontmatter from prompt body if present
-        prompt_body = agent.prompt_body
-        if prompt_body.startswith('---'):
-            # Skip frontmatter in agent definition
-            parts = prompt_body.split('---', 2)
-            if len(parts) >= 3:
-                prompt_body = parts[2].strip()
+        # Prompt body with any frontmatter removed (computed once per agent)
+        prompt_body = agent.task_prompt_body
 
         body = f"""
 ## Input
@@ -423,6 +797,33 @@ Target file: `[[{input_file_path}]]`
 
         return frontmatter + "\n" + body
 
+    def _render_frontmatter(self, frontmatter_data: Dict[str, Any]) -> str:
+        """
+        Render task frontmatter with every string value double-quoted.
+
+        Args:
+            frontmatter_data: Frontmatter fields (one level of nested dicts)
+
+        Returns:
+            Frontmatter block including the --- delimiters
+        """
+        # Convert ALL string values to DoubleQuotedScalarString for consistency
+        for key, value in frontmatter_data.items():
+            if isinstance(value, str):
+                # Always quote ALL string fields for consistency
+                frontmatter_data[key] = DoubleQuotedScalarString(value)
+            elif isinstance(value, dict):
+                # Handle nested dicts (like agent_params)
+                for nested_key, nested_value in value.items():
+                    if isinstance(nested_value, str):
+                        value[nested_key] = DoubleQuotedScalarString(nested_value)
+
+        # Generate YAML frontmatter
+        stream = StringIO()
+        with _FRONTMATTER_YAML_LOCK:
+            _FRONTMATTER_YAML.dump(frontmatter_data, stream)
+        return "---\n" + stream.getvalue() + "---"
+
     def _append_to_process_log(self, content: str, log_entry: str) -> str:
         """
         Append entry to Process Log section.
@@ -434,10 +835,11 @@ Target file: `[[{input_file_path}]]`
         Returns:
             Updated content
         """
-        # Find Process Log section
-        if "## Process Log" in content:
+        # Find Process Log section and splice the entry in right after the heading
+        idx = content.find(_PROCESS_LOG_HEADING)
+        if idx != -1:
+            idx += len(_PROCESS_LOG_HEADING)
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_line = f"\n- [{timestamp}] {log_entry}\n"
-            content = content.replace("## Process Log", f"## Process Log{log_line}", 1)
+            content = f"{content[:idx]}\n- [{timestamp}] {log_entry}\n{content[idx:]}"
 
         return content
@@ -6,14 +6,273 @@ import os
 import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base_poller import BasePoller
 from ..logger import Logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import html2text
+except ImportError:
+    html2text = None
+
 logger = Logger()
 
+# Maximum number of notes converted concurrently per poll
+NOTE_PROCESS_WORKERS = 4
+
+# Characters not allowed in exported filenames, mapped to '-'
+_TITLE_TRANSLATION = str.maketrans(dict.fromkeys('/\\:*?"<>|', '-'))
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+# Existing-note scan
+_ID_VALUE_RE = re.compile(r'\s*["\']?([^"\'\n]+)')
+
+# Note processing
+# export_notes.applescript writes the id unescaped: "id": "<id>"
+_METADATA_ID_RE = re.compile(rb'"id"\s*:\s*"([^"\\]*)"')
+_DATE_PREFIX_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})')
+_DATA_URL_RE = re.compile(rb'data:image/([^;]+);base64,([^"\'>\s]+)')
+_EMPTY_IMAGE_RE = re.compile(r'!\[\]\(\)')
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to a file with os.write, without a buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _remove_export_folder(folder: str) -> None:
+    """
+    Delete the temporary export folder.
+
+    The export is flat (one JSON and one HTML file per note), so files are
+    unlinked straight from a single scandir pass instead of a recursive walk.
+
+    Args:
+        folder: Export folder to delete
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(folder)
+
+
+def _read_frontmatter_id(filepath: str) -> Optional[str]:
+    """
+    Read the ``id:`` value from a note's frontmatter.
+
+    Only the frontmatter lines are read; the note body is never loaded.
+
+    Args:
+        filepath: Path to the markdown note
+
+    Returns:
+        The note id, or None if the note is unreadable or has no closed frontmatter with an id
+    """
+    note_id = None
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            if f.readline() != '---\n':
+                return None
+            for line in f:
+                if line.startswith('---'):
+                    return note_id
+                if note_id is None and line.startswith('id:'):
+                    id_match = _ID_VALUE_RE.match(line, 3)
+                    if id_match:
+                        note_id = id_match.group(1)
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+# Basic HTML to markdown: one alternation scanned once, nested bodies converted recursively
+_HTML_TOKEN_RE = re.compile(
+    r'(?P<br><br\s*/?>)'
+    r'|<(?P<tag>p|b|strong|i|em|h[1-6])(?:\s[^>]*)?>(?P<body>.*?)</(?P=tag)\s*>'
+    r'|<[^>]+>',
+    re.DOTALL,
+)
+_HTML_TAG_MARKUP = {
+    'p': ('', '\n\n'),
+    'b': ('**', '**'),
+    'strong': ('**', '**'),
+    'i': ('*', '*'),
+    'em': ('*', '*'),
+    'h1': ('# ', '\n\n'),
+    'h2': ('## ', '\n\n'),
+    'h3': ('### ', '\n\n'),
+    'h4': ('#### ', '\n\n'),
+    'h5': ('##### ', '\n\n'),
+    'h6': ('###### ', '\n\n'),
+}
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+
+def _replace_html_token(match) -> str:
+    """Render one _HTML_TOKEN_RE match as markdown; empty elements and other tags are dropped."""
+    if match.group('br'):
+        return '\n'
+    tag = match.group('tag')
+    if tag is None:
+        return ''
+    inner = _HTML_TOKEN_RE.sub(_replace_html_token, match.group('body')).strip()
+    if not inner:
+        return ''
+    prefix, suffix = _HTML_TAG_MARKUP[tag]
+    return f'{prefix}{inner}{suffix}'
+
+# Markdown cleanup
+_EMPTY_BOLD_RE = re.compile(r'\*\*\s*\*\*')
+_EMPTY_ITALIC_RE = re.compile(r'\*\s*\*(?!\*)')
+_EMPTY_HEADING_RE = re.compile(r'^#+\s*$', re.MULTILINE)
+_EMPTY_QUOTE_RE = re.compile(r'^>\s*$', re.MULTILINE)
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
+
+# selectolax markdown emitter
+_INLINE_MARKERS = {
+    'b': '**', 'strong': '**',
+    'i': '_', 'em': '_', 'u': '_',
+    's': '~~', 'strike': '~~', 'del': '~~',
+    'code': '`', 'tt': '`',
+}
+_HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+_BLOCK_TAGS = frozenset({'p', 'div', 'pre', 'section', 'article'})
+_TABLE_SECTION_TAGS = frozenset({'thead', 'tbody', 'tfoot'})
+_SKIPPED_TAGS = frozenset({'head', 'script', 'style', 'title', '-comment'})
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _selectolax_to_markdown(html_content: str) -> str:
+    """
+    Convert HTML to markdown with the selectolax (lexbor) parser.
+
+    Emits the same markers as html2text for the elements Apple Notes exports;
+    hard line breaks become plain newlines.
+
+    Args:
+        html_content: Note HTML
+
+    Returns:
+        Markdown text
+    """
+    tree = LexborHTMLParser(html_content)
+    root = tree.body or tree.root
+    if root is None:
+        return ''
+    parts: List[str] = []
+    _emit_markdown(root, parts, 0)
+    lines = [line.rstrip() for line in ''.join(parts).split('\n')]
+    return _EXTRA_NEWLINES_RE.sub('\n\n', '\n'.join(lines)).strip()
+
+
+def _render_markdown(node, list_depth: int) -> str:
+    """Render a node's children to markdown."""
+    parts: List[str] = []
+    _emit_markdown(node, parts, list_depth)
+    return ''.join(parts)
+
+
+def _table_rows(table) -> List:
+    """Collect a table's own rows (not those of nested tables)."""
+    rows = []
+    for child in table.iter():
+        if child.tag == 'tr':
+            rows.append(child)
+        elif child.tag in _TABLE_SECTION_TAGS:
+            rows.extend(row for row in child.iter() if row.tag == 'tr')
+    return rows
+
+
+def _emit_markdown(node, parts: List[str], list_depth: int) -> None:
+    """Append markdown for each child of ``node`` to ``parts``."""
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == '-text':
+            text = _WHITESPACE_RE.sub(' ', child.text(deep=False))
+            if not parts or parts[-1].endswith('\n'):
+                text = text.lstrip()
+            if text:
+                parts.append(text)
+        elif tag in _SKIPPED_TAGS:
+            continue
+        elif tag == 'br':
+            parts.append('\n')
+        elif tag in _INLINE_MARKERS:
+            inner = _render_markdown(child, list_depth).strip()
+            if inner:
+                marker = _INLINE_MARKERS[tag]
+                parts.append(f'{marker}{inner}{marker}')
+        elif tag == 'a':
+            inner = _render_markdown(child, list_depth).strip()
+            href = child.attributes.get('href') or ''
+            parts.append(f'[{inner}]({href})' if href else inner)
+        elif tag == 'img':
+            parts.append(f"![{child.attributes.get('alt') or ''}]({child.attributes.get('src') or ''})")
+        elif tag in _HEADING_TAGS:
+            inner = _render_markdown(child, list_depth).strip()
+            if inner:
+                parts.append(f"\n\n{'#' * _HEADING_TAGS[tag]} {inner}\n\n")
+        elif tag in ('ul', 'ol'):
+            parts.append('\n\n' if list_depth == 0 else '\n')
+            index = 0
+            for item in child.iter():
+                if item.tag != 'li':
+                    continue
+                index += 1
+                marker = f'{index}. ' if tag == 'ol' else '* '
+                inner = _render_markdown(item, list_depth + 1).strip()
+                parts.append(f"{'  ' * (list_depth + 1)}{marker}{inner}\n")
+            if list_depth == 0:
+                parts.append('\n')
+        elif tag == 'blockquote':
+            inner = _render_markdown(child, list_depth).strip()
+            if inner:
+                quoted = '\n'.join(f'> {line}' if line else '>' for line in inner.split('\n'))
+                parts.append(f'\n\n{quoted}\n\n')
+        elif tag in _BLOCK_TAGS:
+            parts.append('\n\n')
+            _emit_markdown(child, parts, list_depth)
+            parts.append('\n\n')
+        elif tag == 'table':
+            # Like html2text, the first row is the header row
+            parts.append('\n\n')
+            for index, row in enumerate(_table_rows(child)):
+                cells = [
+                    _render_markdown(cell, list_depth).strip().replace('\n', ' ')
+                    for cell in row.iter() if cell.tag in ('td', 'th')
+                ]
+                parts.append(' | '.join(cells) + '\n')
+                if index == 0:
+                    parts.append('|'.join(['---'] * len(cells)) + '\n')
+            parts.append('\n')
+        else:
+            _emit_markdown(child, parts, list_depth)
+
 
 class AppleNotesPoller(BasePoller):
     """Poller for processing Apple Notes with configurable destination folders."""
@@ -34,6 +293,14 @@ class AppleNotesPoller(BasePoller):
         
         self.destination_folder = str(self.target_dir)
         self.days = self.poller_config.get("days", 7)
+        
+        export_script = _SCRIPTS_DIR / "export_notes.applescript"
+        if not export_script.exists():
+            raise FileNotFoundError(f"AppleScript not found: {export_script}")
+        self._export_script = str(export_script)
+        
+        if LexborHTMLParser is None and html2text is None:
+            self.logger.debug("html2text not available, using basic conversion")
 
     def poll(self) -> bool:
         """
@@ -47,21 +314,15 @@ class AppleNotesPoller(BasePoller):
         
         existing_note_ids = set()
         if os.path.exists(self.destination_folder):
-            for filename in os.listdir(self.destination_folder):
-                if filename.endswith('.md'):
-                    filepath = os.path.join(self.destination_folder, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            if content.startswith('---'):
-                                frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-                                if frontmatter_match:
-                                    frontmatter = frontmatter_match.group(1)
-                                    id_match = re.search(r'^id:\s*["\']?([^"\'\n]+)', frontmatter, re.MULTILINE)
-                                    if id_match:
-                                        existing_note_ids.add(id_match.group(1))
-                    except Exception:
-                        continue
+            with os.scandir(self.destination_folder) as entries:
+                note_paths = [
+                    entry.path for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()
+                ]
+            if note_paths:
+                # Cold-cache reads are latency-bound; keep several in flight at once
+                with ThreadPoolExecutor(max_workers=min(NOTE_PROCESS_WORKERS, len(note_paths))) as executor:
+                    existing_note_ids.update(filter(None, executor.map(_read_frontmatter_id, note_paths)))
         
         self.logger.info(f"Found {len(existing_note_ids)} existing processed notes")
 
@@ -70,28 +331,13 @@ class AppleNotesPoller(BasePoller):
         try:
             self.logger.info("Exporting notes from Apple Notes app...")
             
-            script_path = os.path.join(
-                os.path.dirname(__file__), "..", "scripts", "export_notes.applescript"
-            )
-            script_path = os.path.abspath(script_path)
-            
-            if not os.path.exists(script_path):
-                self.logger.error(f"AppleScript not found: {script_path}")
-                return False
-
-            result = subprocess.run(
-                ["osascript", script_path, temp_folder, str(self.days)], 
-                capture_output=True, text=True, check=True
-            )
-            
-            if result.stderr:
-                for line in result.stderr.strip().split('\n'):
-                    line = line.strip()
-                    if line:
-                        if any(keyword in line for keyword in ["Exported:", "Export completed:", "Total notes"]):
-                            self.logger.info(f"AppleScript: {line}")
-                        else:
-                            self.logger.debug(f"AppleScript: {line}")
+            for line in self._iter_stderr_lines(
+                ["osascript", self._export_script, temp_folder, str(self.days)]
+            ):
+                if any(keyword in line for keyword in ["Exported:", "Export completed:", "Total notes"]):
+                    self.logger.info(f"AppleScript: {line}")
+                else:
+                    self.logger.debug(f"AppleScript: {line}")
                             
             self.logger.info("Notes export completed successfully")
             
@@ -119,18 +365,25 @@ class AppleNotesPoller(BasePoller):
             
             processed_count = 0
             skipped_count = 0
+            pending = []
             
             for json_file in json_files:
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        metadata = json.load(f)
+                    with open(json_file, 'rb') as f:
+                        raw_metadata = f.read()
                     
                     base_name = os.path.splitext(os.path.basename(json_file))[0]
-                    html_file = os.path.join(temp_folder, base_name + ".html")
                     
-                    if not os.path.exists(html_file):
-                        self.logger.warning(f"HTML file not found for: {base_name}")
-                        continue
+                    # On re-runs most notes are already imported; check the raw id before parsing
+                    id_match = _METADATA_ID_RE.search(raw_metadata)
+                    if id_match:
+                        note_id = id_match.group(1).decode('utf-8')
+                        if note_id in existing_note_ids:
+                            skipped_count += 1
+                            self.logger.debug(f"Already processed: {base_name} (id: {note_id})")
+                            continue
+                    
+                    metadata = orjson.loads(raw_metadata) if orjson is not None else json.loads(raw_metadata)
                     
                     note_id = metadata.get('id')
                     if note_id and note_id in existing_note_ids:
@@ -138,16 +391,35 @@ class AppleNotesPoller(BasePoller):
                         self.logger.debug(f"Already processed: {metadata.get('title', 'Untitled')} (id: {note_id})")
                         continue
                     
-                    self._process_single_note(metadata, html_file, self.destination_folder, files_folder)
-                    processed_count += 1
+                    html_file = os.path.join(temp_folder, base_name + ".html")
+                    if not os.path.exists(html_file):
+                        self.logger.warning(f"HTML file not found for: {base_name}")
+                        continue
                     
-                    final_filename = base_name + ".md"
-                    self.logger.info(f"Processed: {final_filename}")
+                    pending.append((json_file, base_name, metadata, html_file))
                     
                 except Exception as e:
                     self.logger.error(f"Error processing {json_file}: {e}")
                     continue
             
+            if pending:
+                # Notes are independent; convert them concurrently and report in export order
+                with ThreadPoolExecutor(max_workers=min(NOTE_PROCESS_WORKERS, len(pending))) as executor:
+                    futures = [
+                        (json_file, base_name, executor.submit(
+                            self._process_single_note, metadata, html_file, self.destination_folder, files_folder
+                        ))
+                        for json_file, base_name, metadata, html_file in pending
+                    ]
+                    for json_file, base_name, future in futures:
+                        try:
+                            future.result()
+                        except Exception as e:
+                            self.logger.error(f"Error processing {json_file}: {e}")
+                            continue
+                        processed_count += 1
+                        self.logger.info(f"Processed: {base_name}.md")
+            
             self.logger.info(f"Notes processing completed: {processed_count} processed, {skipped_count} skipped")
             
             return True
@@ -158,17 +430,16 @@ class AppleNotesPoller(BasePoller):
         finally:
             try:
                 if os.path.exists(temp_folder):
-                    shutil.rmtree(temp_folder)
+                    _remove_export_folder(temp_folder)
                     self.logger.debug("Cleaned up temporary export folder")
             except Exception as e:
                 self.logger.warning(f"Could not clean up temp folder: {e}")
 
-    def _sanitize_title(self, title: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _sanitize_title(title: str) -> str:
         """Sanitize title to match the format used in filenames."""
-        safe_title = title.replace("/", "-").replace("\\", "-").replace(":", "-")
-        safe_title = safe_title.replace("*", "-").replace("?", "-").replace("\"", "-")
-        safe_title = safe_title.replace("<", "-").replace(">", "-").replace("|", "-")
-        safe_title = safe_title.replace("  ", " ").strip()
+        safe_title = title.translate(_TITLE_TRANSLATION).replace("  ", " ").strip()
         
         if len(safe_title) > 100:
             safe_title = safe_title[:100]
@@ -177,24 +448,27 @@ class AppleNotesPoller(BasePoller):
 
     def _process_single_note(self, metadata: Dict, html_file: str, destination_folder: str, files_folder: str) -> None:
         """Process a single note: convert to markdown and handle attachments."""
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Read raw bytes so base64 image data is decoded without a str round trip
+        with open(html_file, 'rb') as f:
+            html_bytes = f.read()
         
         filename = metadata.get('filename', '')
-        date_match = re.match(r'^(\d{4}-\d{2}-\d{2})', filename)
+        date_match = _DATE_PREFIX_RE.match(filename)
         date_prefix = date_match.group(1) if date_match else metadata.get('created', '').split('T')[0]
         
-        note_title = metadata.get('title', 'Untitled')
-        html_content = self._process_attachments_html(html_content, note_title, date_prefix, files_folder)
+        safe_title = self._sanitize_title(metadata.get('title', 'Untitled'))
+        html_content, extracted_images = self._process_attachments_html(
+            html_bytes, safe_title, date_prefix, files_folder
+        )
         
         markdown_content = self._html_to_markdown(html_content)
         
-        markdown_content = re.sub(r'!\[\]\(\)', '', markdown_content)
+        markdown_content = _EMPTY_IMAGE_RE.sub('', markdown_content)
         
-        if hasattr(self, '_extracted_images') and self._extracted_images:
+        if extracted_images:
             if markdown_content.strip():
                 markdown_content += "\n\n---\n\n"
-            markdown_content += "\n".join(self._extracted_images)
+            markdown_content += "\n".join(extracted_images)
         
         frontmatter = self._create_frontmatter(metadata)
         
@@ -210,77 +484,77 @@ class AppleNotesPoller(BasePoller):
 
     def _html_to_markdown(self, html_content: str) -> str:
         """Convert HTML content to markdown."""
-        try:
-            import html2text
-            converter = html2text.HTML2Text()
-            converter.ignore_links = False
-            converter.body_width = 0
-            converter.unicode_snob = True
-            return converter.handle(html_content).strip()
-        except ImportError:
-            self.logger.debug("html2text not available, using basic conversion")
+        if LexborHTMLParser is not None:
+            return _selectolax_to_markdown(html_content)
+        if html2text is None:
             return self._basic_html_to_markdown(html_content)
+        # HTML2Text keeps parser state between handle() calls, so each note needs a fresh one
+        converter = html2text.HTML2Text(bodywidth=0)
+        converter.ignore_links = False
+        converter.unicode_snob = True
+        return converter.handle(html_content).strip()
 
     def _basic_html_to_markdown(self, html_content: str) -> str:
         """Basic HTML to markdown conversion without external dependencies."""
         import html
         
         content = html.unescape(html_content)
-        content = re.sub(r'<[^>]*>\s*</[^>]*>', '', content)
-        content = re.sub(r'<br\s*/?>', '\n', content)
-        content = re.sub(r'<p[^>]*>(.*?)</p>', lambda m: m.group(1).strip() + '\n\n' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<b[^>]*>(.*?)</b>', lambda m: f'**{m.group(1).strip()}**' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<strong[^>]*>(.*?)</strong>', lambda m: f'**{m.group(1).strip()}**' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<i[^>]*>(.*?)</i>', lambda m: f'*{m.group(1).strip()}*' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<em[^>]*>(.*?)</em>', lambda m: f'*{m.group(1).strip()}*' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<h1[^>]*>(.*?)</h1>', lambda m: f'# {m.group(1).strip()}\n\n' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<h2[^>]*>(.*?)</h2>', lambda m: f'## {m.group(1).strip()}\n\n' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<h3[^>]*>(.*?)</h3>', lambda m: f'### {m.group(1).strip()}\n\n' if m.group(1).strip() else '', content, flags=re.DOTALL)
-        content = re.sub(r'<[^>]+>', '', content)
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+        content = _HTML_TOKEN_RE.sub(_replace_html_token, content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
         return content.strip()
 
-    def _process_attachments_html(self, html_content: str, note_title: str, date_prefix: str, files_folder: str) -> str:
-        """Extract images from data URLs in HTML and save them as files."""
+    def _process_attachments_html(
+        self, html_bytes: bytes, safe_title: str, date_prefix: str, files_folder: str
+    ) -> Tuple[str, List[str]]:
+        """
+        Extract images from data URLs in HTML and save them as files.
+
+        Args:
+            html_bytes: Raw UTF-8 note HTML
+            safe_title: Sanitized note title used in image filenames
+            date_prefix: Date prefix used in image filenames
+            files_folder: Folder the images are written to
+
+        Returns:
+            Tuple of (decoded HTML with data URLs removed, embed links for the extracted images)
+        """
         import base64
         
-        safe_title = self._sanitize_title(note_title)
-        data_url_pattern = r'data:image/([^;]+);base64,([^"\'>\s]+)'
-        
         image_count = 0
-        extracted_images = []
+        decoded_images = []
         
         def extract_data_url(match):
             nonlocal image_count
-            image_format = match.group(1)
-            image_data = match.group(2)
+            image_format = match.group(1).decode('utf-8')
             
             try:
-                decoded_data = base64.b64decode(image_data)
-                image_count += 1
-                filename = f"{date_prefix} {safe_title}-image{image_count:02d}.{image_format}"
-                image_path = os.path.join(files_folder, filename)
-                
-                os.makedirs(files_folder, exist_ok=True)
-                
-                with open(image_path, 'wb') as f:
-                    f.write(decoded_data)
-                
-                extracted_images.append(f"![[{filename}]]")
-                return ""
+                decoded_data = base64.b64decode(match.group(2))
             except Exception as e:
                 self.logger.warning(f"Could not extract image: {e}")
-                return ""
+                return b""
+            image_count += 1
+            filename = f"{date_prefix} {safe_title}-image{image_count:02d}.{image_format}"
+            decoded_images.append((filename, decoded_data))
+            return b""
         
-        processed_content = re.sub(data_url_pattern, extract_data_url, html_content)
+        processed_bytes = _DATA_URL_RE.sub(extract_data_url, html_bytes)
+        # Match the newline translation of reading the file in text mode
+        processed_content = processed_bytes.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        
+        # Write after the substitution so decoding isn't interleaved with disk IO
+        extracted_images = []
+        for filename, decoded_data in decoded_images:
+            try:
+                _write_bytes(os.path.join(files_folder, filename), decoded_data)
+            except Exception as e:
+                self.logger.warning(f"Could not extract image: {e}")
+                continue
+            extracted_images.append(f"![[{filename}]]")
         
         if image_count > 0:
             self.logger.info(f"Extracted {image_count} images from HTML to _files_/")
-            self._extracted_images = extracted_images
-        else:
-            self._extracted_images = []
         
-        return processed_content
+        return processed_content, extracted_images
 
     def _create_frontmatter(self, metadata: Dict) -> str:
         """Create YAML frontmatter for the note."""
@@ -311,11 +585,11 @@ tags:
 
     def _clean_markdown_newlines(self, content: str) -> str:
         """Clean up redundant newlines and whitespace in markdown content."""
-        content = re.sub(r'\*\*\s*\*\*', '', content)
-        content = re.sub(r'\*\s*\*(?!\*)', '', content)
-        content = re.sub(r'^#+\s*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^>\s*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _EMPTY_BOLD_RE.sub('', content)
+        content = _EMPTY_ITALIC_RE.sub('', content)
+        content = _EMPTY_HEADING_RE.sub('', content)
+        content = _EMPTY_QUOTE_RE.sub('', content)
+        content = _EXTRA_NEWLINES_RE.sub('\n\n', content)
         return content.rstrip() + '\n'
 
 
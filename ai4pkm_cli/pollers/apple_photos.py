@@ -1,8 +1,8 @@
 """Apple Photos processing poller - syncs and processes photos from iCloud."""
 
-import glob
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -11,6 +11,8 @@ from ..logger import Logger
 
 logger = Logger()
 
+_SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
 
 class ApplePhotosPoller(BasePoller):
     """Poller for processing photos with configurable source and destination folders."""
@@ -35,6 +37,14 @@ class ApplePhotosPoller(BasePoller):
         
         self.albums = self.poller_config.get("albums", ["AI4PKM"])
         self.days = self.poller_config.get("days", 7)
+        
+        export_script = _SCRIPTS_DIR / "export_photos.applescript"
+        process_script = _SCRIPTS_DIR / "process_photo.sh"
+        for script in (export_script, process_script):
+            if not script.exists():
+                raise FileNotFoundError(f"Script not found: {script}")
+        self._export_script = str(export_script)
+        self._process_script = str(process_script)
 
     def poll(self) -> bool:
         """
@@ -50,48 +60,31 @@ class ApplePhotosPoller(BasePoller):
         self.logger.info(f"Looking back {self.days} days")
 
         try:
-            script_path = os.path.join(
-                os.path.dirname(__file__), "..", "scripts", "export_photos.applescript"
-            )
-            script_path = os.path.abspath(script_path)
-            
-            if not os.path.exists(script_path):
-                self.logger.error(f"AppleScript not found: {script_path}")
-                return False
-            
             self.logger.info("Exporting photos from Photos app...")
             
             for album in self.albums:
                 self.logger.info(f"Processing album: {album}")
-                result = subprocess.run(
-                    ["osascript", script_path, album, str(self.source_folder_path), str(self.days)], 
-                    capture_output=True, text=True, check=True
-                )
+                skipped_count_msgs = {"too_old": 0, "already_exists": 0, "other": 0}
                 
-                if result.stderr:
-                    skipped_count_msgs = {"too_old": 0, "already_exists": 0, "other": 0}
-                    
-                    for line in result.stderr.strip().split('\n'):
-                        line = line.strip()
-                        if not line:
-                            continue
-                            
-                        if "Too old:" in line:
-                            skipped_count_msgs["too_old"] += 1
-                        elif "Already exists:" in line:
-                            skipped_count_msgs["already_exists"] += 1
-                        elif any(keyword in line for keyword in ["Exported:", "Processing", "Found", "total photos"]):
-                            self.logger.info(f"AppleScript ({album}): {line}")
-                        else:
-                            self.logger.debug(f"AppleScript ({album}): {line}")
-                            skipped_count_msgs["other"] += 1
-                    
-                    if skipped_count_msgs["too_old"] > 0:
-                        self.logger.info(f"AppleScript ({album}): Skipped {skipped_count_msgs['too_old']} photos (too old)")
-                    if skipped_count_msgs["already_exists"] > 0:
-                        self.logger.info(f"AppleScript ({album}): Skipped {skipped_count_msgs['already_exists']} photos (already exists)")
-                    if skipped_count_msgs["other"] > 0:
-                        self.logger.debug(f"AppleScript ({album}): {skipped_count_msgs['other']} other debug messages")
+                for line in self._iter_stderr_lines(
+                    ["osascript", self._export_script, album, str(self.source_folder_path), str(self.days)]
+                ):
+                    if "Too old:" in line:
+                        skipped_count_msgs["too_old"] += 1
+                    elif "Already exists:" in line:
+                        skipped_count_msgs["already_exists"] += 1
+                    elif any(keyword in line for keyword in ["Exported:", "Processing", "Found", "total photos"]):
+                        self.logger.info(f"AppleScript ({album}): {line}")
+                    else:
+                        self.logger.debug(f"AppleScript ({album}): {line}")
+                        skipped_count_msgs["other"] += 1
+                
+                if skipped_count_msgs["too_old"] > 0:
+                    self.logger.info(f"AppleScript ({album}): Skipped {skipped_count_msgs['too_old']} photos (too old)")
+                if skipped_count_msgs["already_exists"] > 0:
+                    self.logger.info(f"AppleScript ({album}): Skipped {skipped_count_msgs['already_exists']} photos (already exists)")
+                if skipped_count_msgs["other"] > 0:
+                    self.logger.debug(f"AppleScript ({album}): {skipped_count_msgs['other']} other debug messages")
                             
             self.logger.info("Photo export completed successfully for all albums")
             
@@ -107,15 +100,28 @@ class ApplePhotosPoller(BasePoller):
             self.destination_folder_path.mkdir(parents=True, exist_ok=True)
 
             processed_basenames = set()
-            source_pattern = os.path.join(str(self.source_folder_path), "*")
             processed_count = 0
             skipped_count = 0
 
-            for file in glob.glob(source_pattern):
-                if not os.path.isfile(file):
-                    continue
-
-                basename = os.path.basename(file)
+            with os.scandir(self.source_folder_path) as entries:
+                # Hidden files are skipped, as the previous "*" glob did
+                source_files = [
+                    (entry.path, entry.name) for entry in entries
+                    if not entry.name.startswith('.') and entry.is_file()
+                ]
+
+            # process_photo.sh names its outputs "<date> <name>.<ext>"; index both
+            # the full stem and the original name so lookups are O(1) per photo
+            existing_outputs = set()
+            with os.scandir(self.destination_folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stem = os.path.splitext(entry.name)[0]
+                        existing_outputs.add(stem)
+                        existing_outputs.add(stem.split(' ', 1)[-1])
+
+            to_process = []
+            for file, basename in source_files:
                 basename_no_ext = os.path.splitext(basename)[0]
 
                 if basename_no_ext in processed_basenames:
@@ -123,40 +129,40 @@ class ApplePhotosPoller(BasePoller):
 
                 processed_basenames.add(basename_no_ext)
 
-                files = glob.glob(f"{self.destination_folder_path}*{basename_no_ext}.*")
-                if files:
+                if basename_no_ext in existing_outputs:
                     skipped_count += 1
                     continue
 
-                script_path = os.path.join(
-                    os.path.dirname(__file__), "..", "scripts", "process_photo.sh"
-                )
-                script_path = os.path.abspath(script_path)
-                
-                if not os.path.exists(script_path):
-                    self.logger.error(f"Processing script not found: {script_path}")
-                    continue
-                
-                self.logger.info(f"Processing: {basename}")
-                try:
-                    result = subprocess.run(
-                        [script_path, file, str(self.destination_folder_path)],
-                        capture_output=True, text=True, check=True
-                    )
-                    
-                    processed_count += 1
-                    self.logger.info(f"Successfully processed: {basename}")
-                    
-                    script_output = result.stdout.strip() if result.stdout else ""
-                    if script_output:
-                        for line in script_output.split('\n'):
-                            if line.strip():
-                                self.logger.debug(f"Shell script: {line.strip()}")
-                                
-                except subprocess.CalledProcessError as e:
-                    self.logger.error(f"Failed to process {basename}: {e}")
-                    self.logger.error(f"Error output: {e.stderr}")
-                    continue
+                to_process.append((file, basename))
+
+            if to_process:
+                # Each photo is an independent child process; the GIL is released while waiting
+                with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(to_process))) as executor:
+                    futures = []
+                    for file, basename in to_process:
+                        self.logger.info(f"Processing: {basename}")
+                        futures.append((basename, executor.submit(
+                            subprocess.run,
+                            [self._process_script, file, str(self.destination_folder_path)],
+                            capture_output=True, text=True, check=True
+                        )))
+
+                    for basename, future in futures:
+                        try:
+                            result = future.result()
+                        except subprocess.CalledProcessError as e:
+                            self.logger.error(f"Failed to process {basename}: {e}")
+                            self.logger.error(f"Error output: {e.stderr}")
+                            continue
+
+                        processed_count += 1
+                        self.logger.info(f"Successfully processed: {basename}")
+                        
+                        script_output = result.stdout.strip() if result.stdout else ""
+                        if script_output:
+                            for line in script_output.split('\n'):
+                                if line.strip():
+                                    self.logger.debug(f"Shell script: {line.strip()}")
 
             self.logger.info(
                 f"Photo processing completed: {processed_count} processed, {skipped_count} skipped"
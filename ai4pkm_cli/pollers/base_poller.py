@@ -1,14 +1,31 @@
 """Base poller class with common functionality for all pollers."""
 
 import json
+import os
 import signal
+import subprocess
 import sys
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matches json.dump(indent=2, default=str): datetimes go through default=str too
+_ORJSON_STATE_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+# Number of trailing stderr lines kept for the error of a failed script
+STDERR_TAIL_LINES = 20
 
 
 class BasePoller(ABC):
@@ -54,6 +71,8 @@ class BasePoller(ABC):
         self._thread: Optional[threading.Thread] = None
         self._shutdown_event = threading.Event()
         
+        # Serialized state last read from or written to state_file
+        self._saved_state: Optional[bytes] = None
         self.state = self.load_state()
 
     def load_state(self) -> Dict[str, Any]:
@@ -65,8 +84,11 @@ class BasePoller(ABC):
         """
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    raw = f.read()
+                state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._saved_state = raw
+                return state
             except (json.JSONDecodeError, OSError) as e:
                 self.logger.warning(f"Failed to load state from {self.state_file}: {e}")
                 return {}
@@ -76,12 +98,14 @@ class BasePoller(ABC):
     def save_state(self) -> bool:
         """
         Save current state to state.json file.
-        Only saves if state contains data for next polling.
+        Only saves if state contains data for next polling, and skips the
+        write when the serialized state matches what is already on disk.
 
         Returns:
             True if successful, False otherwise
         """
         if not self.state:
+            self._saved_state = None
             if self.state_file.exists():
                 try:
                     self.state_file.unlink()
@@ -89,13 +113,28 @@ class BasePoller(ABC):
                     pass
             return True
         
+        if orjson is not None:
+            data = orjson.dumps(self.state, default=str, option=_ORJSON_STATE_OPTIONS)
+        else:
+            data = json.dumps(self.state, indent=2, default=str).encode('utf-8')
+        if data == self._saved_state:
+            return True
+        
+        tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2, default=str)
+            # Write to a temp file and swap it in so a crash never leaves partial JSON
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.state_file)
+            self._saved_state = data
             return True
         except OSError as e:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             self.logger.error(f"Failed to save state to {self.state_file}: {e}")
             return False
 
@@ -110,6 +149,33 @@ class BasePoller(ABC):
             self.state.update(kwargs)
             self.save_state()
 
+    def _iter_stderr_lines(self, args: List[str]) -> Iterator[str]:
+        """
+        Run a command and yield its stderr lines as they are written.
+
+        Args:
+            args: Command and arguments
+
+        Yields:
+            Stripped, non-empty stderr lines
+
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero (stderr holds the last lines)
+        """
+        tail = deque(maxlen=STDERR_TAIL_LINES)
+        with subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, bufsize=1
+        ) as proc:
+            for line in proc.stderr:
+                line = line.strip()
+                if line:
+                    tail.append(line)
+                    yield line
+            returncode = proc.wait()
+        
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, args, stderr='\n'.join(tail))
+
     @abstractmethod
     def poll(self) -> bool:
         """
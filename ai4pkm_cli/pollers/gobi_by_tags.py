@@ -1,7 +1,9 @@
 """Gobi sync by tags poller - syncs data from Gobi API filtered by tags."""
 
 import requests
+from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Optional
 import pytz
@@ -9,12 +11,20 @@ from tzlocal import get_localzone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .base_poller import BasePoller
+from .gobi_downloads import GobiDownloadMixin
 from ..logger import Logger
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    def _parse_iso_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 logger = Logger()
 
 
-class GobiByTagsPoller(BasePoller):
+class GobiByTagsPoller(GobiDownloadMixin, BasePoller):
     """Poller for syncing Gobi data filtered by tags."""
 
     def __init__(
@@ -38,6 +48,9 @@ class GobiByTagsPoller(BasePoller):
         )
         self.output_dir = Path(self.target_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._init_session()
+        # Frame directories already created during the current format_data_markdown call
+        self._mkdir_cache = set()
 
     def poll(self) -> bool:
         """
@@ -69,7 +82,7 @@ class GobiByTagsPoller(BasePoller):
                 self.logger.info(f"Using system local timezone: {timezone_name}")
 
             tags_param = ','.join(self.tags) if isinstance(self.tags, list) else self.tags
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base_url}/devices-by-tags?tags={tags_param}",
                 headers={
                     "Content-Type": "application/json",
@@ -111,7 +124,7 @@ class GobiByTagsPoller(BasePoller):
         transcriptions = []
         frames = []
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base_url}/sync-by-tags",
                 headers={
                     "Content-Type": "application/json",
@@ -130,19 +143,21 @@ class GobiByTagsPoller(BasePoller):
                     date_time_str = ":".join(line.split(":")[:-1])
                     speaker = date_time_str.split("@")[0]
                     date_time_str = date_time_str.split("@")[1][:-6] + "Z"
-                    date_time_str = datetime.fromisoformat(
-                        date_time_str.replace("Z", "+00:00")
-                    )
-                    date_time_str = date_time_str.strftime("%Y-%m-%dT%H:%M:%SZ")
+                    created_at_dt = _parse_iso_datetime(date_time_str)
                     transcriptions.append(
                         {
                             **transcription,
                             "transcription": line.split(": ")[-1],
-                            "created_at": date_time_str,
+                            "created_at_dt": created_at_dt,
+                            "created_at_ts": created_at_dt.timestamp(),
                             "speaker": speaker,
                         }
                     )
-            frames.extend(data.get("frames", []))
+            for frame in data.get("frames", []):
+                created_at_dt = _parse_iso_datetime(frame["created_at"])
+                frame["created_at_dt"] = created_at_dt
+                frame["created_at_ts"] = created_at_dt.timestamp()
+                frames.append(frame)
 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API request failed: {e}")
@@ -155,20 +170,6 @@ class GobiByTagsPoller(BasePoller):
         )
         return transcriptions, frames
 
-    def _download_frame(self, download_url, file_path):
-        """Download a single frame image."""
-        try:
-            if not file_path.exists():
-                self.logger.info(f"Downloading frame to {file_path}...")
-                response = requests.get(download_url)
-                response.raise_for_status()
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to download frame {file_path}: {e}")
-            return False
-
     def _process_entry(self, entry, local_tz, deviceId):
         """Process a single entry (transcription or frame)."""
         transcription = entry.get("transcription")
@@ -176,7 +177,7 @@ class GobiByTagsPoller(BasePoller):
         timestamp = entry.get("created_at")
         speaker = entry.get("speaker")
 
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        dt = entry.get("created_at_dt") or _parse_iso_datetime(timestamp)
         local_dt = dt.astimezone(local_tz)
         date_key = local_dt.strftime("%Y-%m-%d")
 
@@ -194,7 +195,9 @@ class GobiByTagsPoller(BasePoller):
 
             relative_dir = f"./frames/{year}/{month}/{day}/{hour}"
             frames_dir = self.output_dir / deviceId / relative_dir
-            frames_dir.mkdir(parents=True, exist_ok=True)
+            if frames_dir not in self._mkdir_cache:
+                frames_dir.mkdir(parents=True, exist_ok=True)
+                self._mkdir_cache.add(frames_dir)
             file_path = frames_dir / filename
 
             markdown_line = f"{local_dt.strftime('%Y-%m-%d %H:%M:%S')} ![frame]({relative_dir}/{filename})\n"
@@ -207,16 +210,17 @@ class GobiByTagsPoller(BasePoller):
         """Convert lifelog data to markdown format."""
         data = transcriptions + frames
         local_tz = pytz.timezone(timezone_str)
-        markdown_contents = {}
+        markdown_contents = defaultdict(list)
         download_tasks = []
-        processed_entries = []
+        self._mkdir_cache.clear()
 
-        for entry in sorted(data, key=lambda x: x.get("created_at", "")):
+        data.sort(key=itemgetter("created_at_ts"))
+        for entry in data:
             date_key, markdown_line, download_task = self._process_entry(
                 entry, local_tz, deviceId
             )
             if date_key and markdown_line:
-                processed_entries.append((date_key, markdown_line))
+                markdown_contents[date_key].append(markdown_line)
                 if download_task:
                     download_tasks.append(download_task)
 
@@ -224,7 +228,7 @@ class GobiByTagsPoller(BasePoller):
             self.logger.info(
                 f"Starting parallel download of {len(download_tasks)} frames..."
             )
-            with ThreadPoolExecutor(max_workers=5) as executor:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_task = {
                     executor.submit(self._download_frame, download_url, file_path): (
                         download_url,
@@ -246,12 +250,7 @@ class GobiByTagsPoller(BasePoller):
                             f"Exception during frame download {file_path}: {e}"
                         )
 
-        for date_key, markdown_line in processed_entries:
-            if date_key not in markdown_contents:
-                markdown_contents[date_key] = ""
-            markdown_contents[date_key] += markdown_line
-
-        return markdown_contents
+        return {date_key: "".join(lines) for date_key, lines in markdown_contents.items()}
 
     def save_to_file(self, deviceId, content, target_date):
         """Save markdown content to file."""
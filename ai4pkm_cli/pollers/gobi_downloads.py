@@ -0,0 +1,83 @@
+"""Shared HTTP session and frame download handling for the Gobi pollers."""
+
+import os
+import shutil
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Frame downloads: seconds to wait for the server, and bytes copied per read
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Parallel frame downloads when download_concurrency is unset or invalid
+DEFAULT_DOWNLOAD_CONCURRENCY = 16
+
+
+class GobiDownloadMixin:
+    """
+    Pooled HTTP session and parallel frame downloads for Gobi pollers.
+
+    Mix in before BasePoller; relies on its poller_config and logger.
+    """
+
+    def _init_session(self) -> None:
+        """Set max_workers from the config and open the pooled HTTP session."""
+        self.max_workers = self._get_download_concurrency()
+
+        # Keep-alive connections shared by the API calls and the frame download workers.
+        # The API key is sent per request so it never reaches the frame download hosts.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=self.max_workers * 2,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get_download_concurrency(self) -> int:
+        """
+        Read the frame download worker count from the poller config.
+
+        Returns:
+            download_concurrency as a positive int, or the default if it is invalid
+        """
+        value = self.poller_config.get("download_concurrency", DEFAULT_DOWNLOAD_CONCURRENCY)
+        try:
+            workers = int(value)
+        except (TypeError, ValueError):
+            workers = 0
+        if workers < 1:
+            self.logger.warning(
+                f"Invalid download_concurrency {value!r}; using {DEFAULT_DOWNLOAD_CONCURRENCY}"
+            )
+            return DEFAULT_DOWNLOAD_CONCURRENCY
+        return workers
+
+    def _download_frame(self, download_url, file_path):
+        """Download a single frame image."""
+        # Stream into a side file so a failed download never leaves a partial frame behind
+        part_path = file_path.with_name(file_path.name + ".part")
+        try:
+            if not file_path.exists():
+                self.logger.info(f"Downloading frame to {file_path}...")
+                with self.session.get(download_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with open(part_path, "wb") as f:
+                        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                os.replace(part_path, file_path)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to download frame {file_path}: {e}")
+            try:
+                part_path.unlink()
+            except OSError:
+                pass
+            return False
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the polling loop and close pooled HTTP connections."""
+        super().stop(timeout)
+        self.session.close()
@@ -0,0 +1,40 @@
+"""
+Unit tests for config module.
+"""
+import os
+from ai4pkm_cli.config import Config, _parse_yaml_file
+
+
+def test_config_merges_secrets(tmp_path):
+    """Test secrets.yaml is deep-merged over orchestrator.yaml."""
+    (tmp_path / "orchestrator.yaml").write_text(
+        "pollers:\n  gobi:\n    enabled: true\n", encoding="utf-8"
+    )
+    (tmp_path / "secrets.yaml").write_text(
+        "pollers:\n  gobi:\n    api_key: secret\n", encoding="utf-8"
+    )
+
+    config = Config(vault_path=tmp_path)
+
+    assert config.get_pollers_config() == {'gobi': {'enabled': True, 'api_key': 'secret'}}
+
+
+def test_config_reuses_parse_of_unchanged_file(tmp_path):
+    """Test unchanged YAML is parsed once and each Config gets its own copy."""
+    config_path = tmp_path / "orchestrator.yaml"
+    config_path.write_text("orchestrator:\n  max_concurrent: 2\n", encoding="utf-8")
+
+    _parse_yaml_file.cache_clear()
+    first = Config(vault_path=tmp_path)
+    second = Config(vault_path=tmp_path)
+    assert _parse_yaml_file.cache_info().hits == 1
+
+    first.config['orchestrator']['max_concurrent'] = 9
+    assert second.get_orchestrator_max_concurrent() == 2
+
+    # A rewritten file is parsed again
+    config_path.write_text("orchestrator:\n  max_concurrent: 5\n", encoding="utf-8")
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert second.reload()
+    assert second.get_orchestrator_max_concurrent() == 5
@@ -86,6 +86,23 @@ Test prompt body
         orch.stop()
         assert orch._running is False
 
+    def test_request_shutdown_stops_run_forever(self, temp_vault):
+        """Test request_shutdown wakes run_forever, which stops the orchestrator."""
+        import threading
+        vault_path, agents_dir = temp_vault
+
+        orch = Orchestrator(vault_path, agents_dir)
+        runner = threading.Thread(target=orch.run_forever, daemon=True)
+        runner.start()
+        time.sleep(0.2)
+        assert orch._running is True
+
+        orch.request_shutdown()
+        runner.join(timeout=15.0)
+
+        assert not runner.is_alive()
+        assert orch._running is False
+
     def test_start_when_already_running(self, temp_vault):
         """Test starting orchestrator when already running."""
         vault_path, agents_dir = temp_vault
@@ -201,6 +218,46 @@ Test prompt body
         assert len(status['agent_list']) == 1
         assert status['agent_list'][0]['abbreviation'] == 'TST'
 
+    def test_describe_config_does_not_build_components(self, tmp_path):
+        """Test describe_config reports agents and pollers without creating dirs or pollers."""
+        from ai4pkm_cli.config import Config
+
+        (tmp_path / "orchestrator.yaml").write_text("""
+orchestrator:
+  max_concurrent: 4
+nodes:
+  - type: agent
+    name: Test Agent (TST)
+    input_path: Ingest/Clippings
+pollers:
+  gobi:
+    enabled: true
+    target_dir: Ingest/Gobi
+  limitless:
+    enabled: false
+    target_dir: Ingest/Limitless
+""", encoding='utf-8')
+        prompts_dir = tmp_path / "_Settings_" / "Prompts"
+        prompts_dir.mkdir(parents=True)
+        (prompts_dir / "Test Agent (TST).md").write_text(
+            '---\ntitle: "Test Agent"\nabbreviation: "TST"\ncategory: "ingestion"\n---\n\nTest prompt body',
+            encoding='utf-8'
+        )
+
+        with patch('ai4pkm_cli.orchestrator.poller_manager._import_poller_class') as import_poller:
+            status = Orchestrator.describe_config(tmp_path, Config(vault_path=tmp_path))
+
+        import_poller.assert_not_called()
+        assert not (tmp_path / "_Settings_" / "Tasks").exists()
+        assert not (tmp_path / "Ingest").exists()
+        assert status['running'] is False
+        assert status['max_concurrent'] == 4
+        assert [a['abbreviation'] for a in status['agent_list']] == ['TST']
+        assert status['poller_list'] == [
+            {'name': 'gobi', 'target_dir': 'Ingest/Gobi', 'poll_interval': 3600}
+        ]
+        assert status['pollers_loaded'] == 1
+
     def test_get_status_when_running(self, temp_vault):
         """Test status when orchestrator is running."""
         vault_path, agents_dir = temp_vault
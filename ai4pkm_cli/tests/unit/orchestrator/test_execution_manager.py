@@ -69,6 +69,31 @@ class TestExecutionManager:
 
         assert manager.can_execute(sample_agent) is False
 
+    def test_reserve_and_release_slot(self, temp_vault, sample_agent):
+        """Test reserve_slot respects per-agent limit and release_slot frees it."""
+        manager = ExecutionManager(temp_vault, max_concurrent=10)
+
+        # Agent has max_parallel=2
+        assert manager.reserve_slot(sample_agent) is True
+        assert manager.reserve_slot(sample_agent) is True
+        assert manager.reserve_slot(sample_agent) is False
+        assert manager.get_running_count() == 2
+        assert manager.get_agent_running_count(sample_agent.abbreviation) == 2
+
+        manager.release_slot(sample_agent)
+        assert manager.get_running_count() == 1
+        assert manager.get_agent_running_count(sample_agent.abbreviation) == 1
+        assert manager.reserve_slot(sample_agent) is True
+
+    def test_reserve_slot_at_global_limit(self, temp_vault, sample_agent):
+        """Test reserve_slot fails without leaking counts at global limit."""
+        manager = ExecutionManager(temp_vault, max_concurrent=1)
+
+        assert manager.reserve_slot(sample_agent) is True
+        assert manager.reserve_slot(sample_agent) is False
+        assert manager.get_running_count() == 1
+        assert manager.get_agent_running_count(sample_agent.abbreviation) == 1
+
     @patch('ai4pkm_cli.orchestrator.execution_manager.CLAUDE_CLI_PATH', '/mock/claude')
     @patch('subprocess.run')
     def test_execute_increments_counters(self, mock_subprocess_run, temp_vault, sample_agent):
@@ -168,6 +193,82 @@ class TestExecutionManager:
         assert ctx.status == 'completed'
         assert mock_subprocess_run.called
 
+    def test_execute_unknown_executor_fails(self, temp_vault, sample_agent):
+        """Test execute marks unknown executors as failed and releases slots."""
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.executor = "unknown_cli"
+        sample_agent.task_create = False
+
+        ctx = manager.execute(sample_agent, {'path': 'test.md', 'event_type': 'created'})
+
+        assert ctx.status == 'failed'
+        assert manager.get_running_count() == 0
+        assert manager.get_agent_running_count(sample_agent.abbreviation) == 0
+        manager.close()
+
+    def test_system_prompt_refresh(self, temp_vault, sample_agent):
+        """Test system prompt is prepended and reloaded only when the file changes."""
+        import os
+        prompts_dir = temp_vault / "_Settings_" / "Prompts"
+        prompts_dir.mkdir(parents=True)
+        prompt_file = prompts_dir / "System Prompt.md"
+        prompt_file.write_text("---\ntitle: System\n---\nBe concise.", encoding='utf-8')
+
+        manager = ExecutionManager(temp_vault, max_concurrent=3,
+                                   orchestrator_settings={'prompts_dir': '_Settings_/Prompts'})
+        assert manager._build_prompt(sample_agent, {}).startswith("Be concise.\n\nTest prompt")
+        assert manager.refresh_system_prompt() is False
+
+        prompt_file.write_text("Be thorough.", encoding='utf-8')
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager.refresh_system_prompt() is True
+        assert manager._build_prompt(sample_agent, {}).startswith("Be thorough.\n\nTest prompt")
+
+    def test_validate_output_update_file_uses_start_ns(self, temp_vault, sample_agent):
+        """Test update_file validation compares input mtime with execution start."""
+        import os
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.output_path = "AI"
+        sample_agent.output_type = "update_file"
+        input_file = temp_vault / "note.md"
+        input_file.write_text("content", encoding='utf-8')
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={'path': 'note.md'},
+                               start_time_ns=time.time_ns())
+
+        valid, link, _ = manager._validate_output(sample_agent, {'path': 'note.md'}, ctx)
+        assert valid is True
+        assert link == "[[note.md]]"
+
+        # Modified well before the execution started
+        old_ns = ctx.start_time_ns - 60_000_000_000
+        os.utime(input_file, ns=(old_ns, old_ns))
+        valid, _, error = manager._validate_output(sample_agent, {'path': 'note.md'}, ctx)
+        assert valid is False
+        assert "not modified" in error
+
+    def test_validate_output_new_file_prefers_matching_name(self, temp_vault, sample_agent):
+        """Test new_file validation picks a recent output named after the input."""
+        import os
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.output_path = "AI"
+        output_dir = temp_vault / "AI"
+        output_dir.mkdir()
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={'path': 'Inbox/note.md'},
+                               start_time_ns=time.time_ns())
+
+        (output_dir / "other.md").write_text("x", encoding='utf-8')
+        (output_dir / "note - TST.md").write_text("x", encoding='utf-8')
+        stale = output_dir / "note - old.md"
+        stale.write_text("x", encoding='utf-8')
+        old_ns = ctx.start_time_ns - 60_000_000_000
+        os.utime(stale, ns=(old_ns, old_ns))
+
+        valid, link, _ = manager._validate_output(sample_agent, {'path': 'Inbox/note.md'}, ctx)
+        assert valid is True
+        assert link == "[[AI/note - TST]]"
+
     def test_get_running_executions(self, temp_vault, sample_agent):
         """Test getting list of running executions."""
         manager = ExecutionManager(temp_vault, max_concurrent=3)
@@ -176,29 +277,132 @@ class TestExecutionManager:
         assert len(manager.get_running_executions()) == 0
 
         # Manually add a running execution
-        from datetime import datetime
         ctx = ExecutionContext(
             agent=sample_agent,
             trigger_data={},
-            start_time=datetime.now()
+            start_time_ns=time.time_ns()
         )
 
-        with manager._executions_lock:
-            manager._running_executions[ctx.execution_id] = ctx
+        manager._register_execution(ctx)
 
         running = manager.get_running_executions()
         assert len(running) == 1
         assert running[0].execution_id == ctx.execution_id
 
+        # Snapshots are immutable and replaced, not mutated, on changes
+        manager._unregister_execution(ctx.execution_id)
+        assert len(running) == 1
+        assert manager.get_running_executions() == ()
+
+    @pytest.mark.parametrize("stream_logs", [False, True])
+    def test_execute_subprocess_collects_output(self, temp_vault, sample_agent, stream_logs):
+        """Test subprocess output is captured with and without live streaming."""
+        import sys
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.stream_logs = stream_logs
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={})
+
+        manager._execute_subprocess(
+            ctx, 'Test CLI', [sys.executable, '-c', 'print("line one"); print("line two")'], 30
+        )
+
+        assert ctx.response == "[Test CLI] line one\n[Test CLI] line two"
+        manager.close()
+
+    def test_execute_subprocess_streams_long_lines(self, temp_vault, sample_agent):
+        """Test streamed output handles lines longer than one read chunk."""
+        import sys
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.stream_logs = True
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={})
+
+        manager._execute_subprocess(
+            ctx, 'Test CLI',
+            [sys.executable, '-c', 'import sys; sys.stdout.write("x" * 200000 + "\\nlast")'], 30
+        )
+
+        lines = ctx.response.split("\n")
+        assert lines[0] == "[Test CLI] " + "x" * 200000
+        assert lines[1] == "[Test CLI] last"
+        manager.close()
+
+    def test_execute_subprocess_failure_sets_error(self, temp_vault, sample_agent):
+        """Test nonzero exit code records output as error message."""
+        import sys
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={})
+
+        with pytest.raises(RuntimeError):
+            manager._execute_subprocess(
+                ctx, 'Test CLI', [sys.executable, '-c', 'print("boom"); raise SystemExit(2)'], 30
+            )
+
+        assert ctx.error_message == "[Test CLI] boom"
+        manager.close()
+
+    @pytest.mark.parametrize("stream_logs", [False, True])
+    def test_execute_subprocess_timeout_kills_process(self, temp_vault, sample_agent, stream_logs):
+        """Test a process exceeding its timeout is killed and reported."""
+        import sys
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.stream_logs = stream_logs
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={})
+
+        started = time.monotonic()
+        with pytest.raises(RuntimeError, match="timed out"):
+            manager._execute_subprocess(
+                ctx, 'Test CLI', [sys.executable, '-c', 'import time; time.sleep(30)'], 1
+            )
+
+        assert time.monotonic() - started < 10
+        manager.close()
+
+    def test_execute_subprocess_after_close(self, temp_vault, sample_agent):
+        """Test the manager still runs agents after close()."""
+        import sys
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        manager.close()
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={})
+
+        manager._execute_subprocess(ctx, 'Test CLI', [sys.executable, '-c', 'print("again")'], 30)
+
+        assert ctx.response == "[Test CLI] again"
+        assert manager._heartbeat_thread.is_alive()
+        manager.close()
+
+    @pytest.mark.parametrize("timeout, expected_status", [(0, 'failed'), (10, 'completed')])
+    def test_close_drains_running_agents(self, temp_vault, sample_agent, timeout, expected_status):
+        """Test close() lets running agents finish within the timeout and kills the rest."""
+        import sys
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        cmd = [sys.executable, '-c', 'import time; time.sleep(1)']
+        results = []
+
+        def fake_executor(agent, ctx, trigger_data):
+            manager._execute_subprocess(ctx, 'Test CLI', cmd, 60)
+
+        with patch.dict(manager._executor_dispatch, {'claude_code': fake_executor}):
+            worker = threading.Thread(target=lambda: results.append(manager.execute(sample_agent, {})))
+            worker.start()
+            while not manager._heartbeats:
+                time.sleep(0.05)
+
+            manager.close(wait=False, timeout=timeout)
+            worker.join(timeout=10)
+
+        assert not worker.is_alive()
+        assert results[0].status == expected_status
+        assert manager.get_running_count() == 0
+        assert not manager.get_running_executions()
+
     def test_prepare_log_path_creates_directory(self, temp_vault, sample_agent):
         """Test log path preparation creates directory."""
         manager = ExecutionManager(temp_vault, max_concurrent=3)
 
-        from datetime import datetime
         ctx = ExecutionContext(
             agent=sample_agent,
             trigger_data={},
-            start_time=datetime.now()
+            start_time_ns=time.time_ns()
         )
 
         log_path = manager._prepare_log_path(sample_agent, ctx)
@@ -207,3 +411,39 @@ class TestExecutionManager:
         assert log_path.parent.exists()
         assert log_path.parent.name == "Logs"
         assert "TST" in log_path.name
+
+    def test_compute_wiki_link(self):
+        """Test vault-relative wiki link conversion and the outside-vault fallback."""
+        from ai4pkm_cli.orchestrator.execution_manager import _compute_wiki_link
+
+        vault = Path("/vault")
+        assert _compute_wiki_link(str(vault), str(vault / "AI" / "Tasks" / "task.md")) == "[[AI/Tasks/task]]"
+        assert _compute_wiki_link(str(vault), "/elsewhere/task.md") is None
+
+    def test_prepare_log_path_keeps_existing_log_and_recreates_dir(self, temp_vault, sample_agent):
+        """Test log path preparation doesn't truncate logs and survives a removed directory."""
+        import shutil
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        ctx = ExecutionContext(agent=sample_agent, trigger_data={}, start_time_ns=time.time_ns())
+
+        log_path = manager._prepare_log_path(sample_agent, ctx)
+        log_path.write_text("existing", encoding='utf-8')
+        assert manager._prepare_log_path(sample_agent, ctx).read_text(encoding='utf-8') == "existing"
+
+        shutil.rmtree(log_path.parent)
+        assert manager._prepare_log_path(sample_agent, ctx).exists()
+
+    def test_remove_trigger_content_rewrites_in_place(self, temp_vault, sample_agent):
+        """Test post-processing strips the trigger pattern and truncates the file."""
+        manager = ExecutionManager(temp_vault, max_concurrent=3)
+        sample_agent.trigger_content_pattern = r"#ai-trigger\n?"
+        note = temp_vault / "note.md"
+        note.write_bytes(b"# Note\r\n#ai-trigger\nbody text\n")
+        inode = note.stat().st_ino
+
+        manager._remove_trigger_content(sample_agent, {'path': 'note.md'})
+        assert note.read_bytes() == b"# Note\r\nbody text\n"
+        assert note.stat().st_ino == inode
+
+        # Missing file is reported, not raised
+        manager._remove_trigger_content(sample_agent, {'path': 'missing.md'})
@@ -110,3 +110,140 @@ def test_file_monitor_queues_multiple_events(tmp_path):
         
     finally:
         monitor.stop()
+
+
+def test_file_monitor_debounce_coalesces_rapid_events(tmp_path):
+    """Test rapid events for one path are coalesced into the latest event."""
+    from datetime import datetime
+    monitor = FileSystemMonitor(tmp_path, debounce_interval=0.05)
+    monitor.start()
+
+    try:
+        for i in range(5):
+            monitor._debounce_event("note.md", "modified", {
+                'path': "note.md",
+                'event_type': "modified",
+                'is_directory': False,
+                'timestamp_ns': int(datetime(2025, 1, 1, 0, 0, i).timestamp()) * 10**9,
+            })
+        monitor._debounce_event("other.md", "created", {
+            'path': "other.md",
+            'event_type': "created",
+            'is_directory': False,
+            'timestamp_ns': int(datetime(2025, 1, 1).timestamp()) * 10**9,
+        })
+
+        first = monitor.event_queue.get(timeout=1.0)
+        second = monitor.event_queue.get(timeout=1.0)
+        time.sleep(0.1)
+
+        assert monitor.event_queue.empty()
+        by_path = {first.path: first, second.path: second}
+        assert by_path["note.md"].timestamp == datetime(2025, 1, 1, 0, 0, 4)
+        assert "other.md" in by_path
+
+    finally:
+        monitor.stop()
+
+
+def test_ring_event_queue_fifo_and_bounds():
+    """Test RingEventQueue ordering, Empty on timeout and overflow rejection."""
+    import threading
+    from queue import Empty
+    from ai4pkm_cli.orchestrator.file_monitor import RingEventQueue
+
+    queue = RingEventQueue(maxsize=2)
+    assert queue.empty()
+    assert queue.put(1) and queue.put(2)
+    assert queue.put(3) is False
+    assert queue.qsize() == 2
+    assert queue.get(timeout=0.1) == 1
+    assert queue.get_nowait() == 2
+
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    with pytest.raises(Empty):
+        queue.get(timeout=0.05)
+
+    # A blocked consumer is woken by a producer on another thread
+    threading.Timer(0.05, queue.put, args=("late",)).start()
+    assert queue.get(timeout=2.0) == "late"
+
+
+def test_file_event_handler_filters_paths(tmp_path):
+    """Test the handler only debounces markdown files and the root orchestrator.yaml."""
+    from unittest.mock import MagicMock
+    from watchdog.events import FileCreatedEvent, FileModifiedEvent
+    from ai4pkm_cli.orchestrator.file_monitor import _FileEventHandler
+
+    monitor = MagicMock()
+    monitor.watched_extensions = frozenset({'.md'})
+    handler = _FileEventHandler(monitor, tmp_path, 0.5)
+
+    handler.on_created(FileCreatedEvent(str(tmp_path / "notes" / "a.txt")))
+    handler.on_modified(FileModifiedEvent(str(tmp_path / "notes" / "orchestrator.yaml")))
+    monitor._debounce_event.assert_not_called()
+
+    handler.on_modified(FileModifiedEvent(str(tmp_path / "orchestrator.yaml")))
+    handler.on_created(FileCreatedEvent(str(tmp_path / "notes" / "a.md")))
+    calls = [c.args[:2] for c in monitor._debounce_event.call_args_list]
+    assert calls == [("orchestrator.yaml", "config_reload"), (str(Path("notes") / "a.md"), "created")]
+
+
+def test_build_trigger_event_caches_unchanged_frontmatter(tmp_path):
+    """Test frontmatter of an unchanged file is parsed once and copied per event."""
+    from ai4pkm_cli.orchestrator.file_monitor import _cached_frontmatter
+
+    monitor = FileSystemMonitor(tmp_path)
+    note = tmp_path / "note.md"
+    note.write_text("---\nstatus: pending\n---\n# Note", encoding='utf-8')
+    event_data = {
+        'path': "note.md",
+        'event_type': "modified",
+        'is_directory': False,
+        'timestamp_ns': time.time_ns(),
+        'file_path': note,
+    }
+
+    _cached_frontmatter.cache_clear()
+    first = monitor._build_trigger_event(event_data)
+    second = monitor._build_trigger_event(event_data)
+
+    assert first.frontmatter == second.frontmatter == {'status': 'pending'}
+    assert first.frontmatter is not second.frontmatter
+    assert _cached_frontmatter.cache_info().hits == 1
+
+
+def test_ring_event_queue_put_many_respects_bound():
+    """Test put_many enqueues in order and rejects items past maxsize."""
+    from ai4pkm_cli.orchestrator.file_monitor import RingEventQueue
+
+    queue = RingEventQueue(maxsize=3)
+    assert queue.put(0)
+    assert queue.put_many([1, 2, 3]) == 2
+    assert [queue.get_nowait() for _ in range(3)] == [0, 1, 2]
+    assert queue.put_many([]) == 0
+    assert queue.empty()
+
+
+def test_file_monitor_watches_agent_trigger_extensions(tmp_path):
+    """Test extensions from agent trigger patterns are watched alongside markdown."""
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+    from watchdog.events import FileCreatedEvent
+    from ai4pkm_cli.orchestrator.file_monitor import _FileEventHandler
+
+    registry = SimpleNamespace(agents={'PDF': SimpleNamespace(trigger_extensions=frozenset({'.pdf'}))})
+    monitor = FileSystemMonitor(tmp_path, registry)
+    assert monitor.watched_extensions == frozenset({'.md', '.pdf'})
+
+    monitor._debounce_event = MagicMock()
+    handler = _FileEventHandler(monitor, tmp_path, 0.5)
+    handler.on_created(FileCreatedEvent(str(tmp_path / "Ingest" / "paper.pdf")))
+    handler.on_created(FileCreatedEvent(str(tmp_path / "dir.pdf" / "notes")))
+    assert [c.args[:2] for c in monitor._debounce_event.call_args_list] == [
+        (str(Path("Ingest") / "paper.pdf"), "created")
+    ]
+
+    monitor.set_agent_registry(SimpleNamespace(agents={}))
+    assert monitor.watched_extensions == frozenset({'.md'})
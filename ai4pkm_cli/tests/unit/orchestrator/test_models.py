@@ -1,4 +1,5 @@
 """Unit tests for orchestrator data models."""
+import sys
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -54,3 +55,52 @@ def test_trigger_event_creation():
     
     assert event.path == "test.md"
     assert event.frontmatter == {}
+
+
+def test_execution_context_times_from_ns():
+    """Test start_time/end_time are derived from the nanosecond timestamps."""
+    start = datetime(2025, 10, 25, 10, 0, 0, 123456)
+    context = ExecutionContext()
+    assert context.start_time is None
+
+    context.start_time = start
+    assert context.start_time == start
+    assert context.start_time_ns == round(start.timestamp() * 1_000_000) * 1000
+
+    context.end_time_ns = context.start_time_ns + 1_500_000_000
+    assert context.duration == 1.5
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+def test_models_use_slots():
+    """Test the hot-path dataclasses don't carry a per-instance __dict__."""
+    context = ExecutionContext()
+    with pytest.raises(AttributeError):
+        context.not_a_field = 1
+    assert not hasattr(context, '__dict__')
+    assert not hasattr(TriggerEvent(path="a.md", event_type="created", is_directory=False,
+                                    timestamp=datetime.now()), '__dict__')
+
+
+def test_agent_trigger_extensions():
+    """Test trigger_extensions is derived from literal pattern suffixes only."""
+    def make(pattern):
+        return AgentDefinition(name="A", abbreviation="A", category="ingestion",
+                               trigger_pattern=pattern, trigger_event="created")
+
+    assert make("Ingest/*.md").trigger_extensions == frozenset({'.md'})
+    assert make("Ingest/Docs.v2/*.pdf").trigger_extensions == frozenset({'.pdf'})
+    assert make("Ingest/*").trigger_extensions == frozenset()
+    assert make("Ingest/*.m?").trigger_extensions == frozenset()
+    assert make(None).trigger_extensions == frozenset()
+
+
+def test_agent_task_prompt_body_strips_frontmatter():
+    """Test task_prompt_body drops a leading frontmatter block once at construction."""
+    def make(body):
+        return AgentDefinition(name="A", abbreviation="A", category="ingestion",
+                               trigger_pattern=None, trigger_event=None, prompt_body=body)
+
+    assert make("---\ntitle: A\n---\n\nDo the thing\n").task_prompt_body == "Do the thing"
+    assert make("Do the thing").task_prompt_body == "Do the thing"
+    assert make("--- unterminated").task_prompt_body == "--- unterminated"
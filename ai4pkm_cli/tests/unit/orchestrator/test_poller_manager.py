@@ -0,0 +1,101 @@
+"""Unit tests for poller_manager.py"""
+
+from unittest.mock import Mock, patch
+import pytest
+
+from ai4pkm_cli.orchestrator.poller_manager import PollerManager
+
+
+class FakePoller:
+    """Minimal poller recording start/stop calls."""
+
+    def __init__(self, poller_config, vault_path):
+        self.poller_config = poller_config
+        self.started = 0
+        self.stopped = 0
+
+    def start(self):
+        self.started += 1
+
+    def stop(self):
+        self.stopped += 1
+
+
+class TestPollerManager:
+    """Test PollerManager functionality."""
+
+    @pytest.fixture
+    def config(self):
+        """Create mock config with two enabled pollers."""
+        config = Mock()
+        config.get_pollers_config.return_value = {
+            'gobi': {'enabled': True, 'target_dir': 'Ingest/Gobi'},
+            'limitless': {'enabled': True, 'target_dir': 'Ingest/Limitless'},
+            'apple_notes': {'enabled': False, 'target_dir': 'Ingest/Notes'},
+        }
+        return config
+
+    @pytest.fixture
+    def manager(self, tmp_path, config):
+        """Create poller manager with poller imports replaced by FakePoller."""
+        with patch('ai4pkm_cli.orchestrator.poller_manager._import_poller_class', return_value=FakePoller):
+            yield PollerManager(tmp_path, config)
+
+    def test_loads_enabled_pollers_only(self, manager):
+        """Test only enabled pollers are instantiated."""
+        assert set(manager.pollers) == {'gobi', 'limitless'}
+
+    def test_reload_restarts_only_changed_pollers(self, manager, config):
+        """Test reload keeps unchanged pollers running and swaps changed ones."""
+        manager.start_all()
+        gobi = manager.pollers['gobi']
+        limitless = manager.pollers['limitless']
+
+        config.get_pollers_config.return_value = {
+            'gobi': {'enabled': True, 'target_dir': 'Ingest/Gobi'},
+            'limitless': {'enabled': True, 'target_dir': 'Ingest/Limitless', 'poll_interval': 60},
+        }
+        manager.reload()
+
+        assert manager.pollers['gobi'] is gobi
+        assert (gobi.started, gobi.stopped) == (1, 0)
+        assert limitless.stopped == 1
+        assert manager.pollers['limitless'] is not limitless
+        assert manager.pollers['limitless'].started == 1
+
+    def test_reload_stops_removed_pollers(self, manager, config):
+        """Test reload stops pollers that were disabled or removed."""
+        gobi = manager.pollers['gobi']
+        config.get_pollers_config.return_value = {
+            'limitless': {'enabled': True, 'target_dir': 'Ingest/Limitless'},
+        }
+        manager.reload()
+
+        assert set(manager.pollers) == {'limitless'}
+        assert gobi.stopped == 1
+
+    def test_start_all_isolates_failures(self, manager):
+        """Test one poller failing to start doesn't stop the others."""
+        manager.pollers['gobi'].start = Mock(side_effect=RuntimeError("auth failed"))
+        manager.start_all()
+        assert manager.pollers['limitless'].started == 1
+
+        manager.stop_all()
+        assert manager.pollers['gobi'].stopped == 1
+        assert manager.pollers['limitless'].stopped == 1
+
+    def test_unknown_and_disabled_pollers_are_filtered(self, manager, config):
+        """Test unknown names are reported once and never imported."""
+        config.get_pollers_config.return_value = {
+            'gobi': {'enabled': True, 'target_dir': 'Ingest/Gobi'},
+            'mystery': {'enabled': True, 'target_dir': 'Ingest/Mystery'},
+            'limitless': {'enabled': False, 'target_dir': 'Ingest/Limitless'},
+        }
+        manager.logger = Mock()
+        with patch('ai4pkm_cli.orchestrator.poller_manager._import_poller_class',
+                   return_value=FakePoller) as import_poller:
+            manager.reload()
+
+        assert set(manager.pollers) == {'gobi'}
+        import_poller.assert_not_called()
+        manager.logger.warning.assert_called_once_with("Unknown poller name(s): mystery")
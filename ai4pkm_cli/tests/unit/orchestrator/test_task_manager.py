@@ -99,6 +99,21 @@ class TestTaskFileManager:
         
         assert task_path is None
 
+    def test_create_task_files_preserves_order(self, temp_vault, mock_config):
+        """Test batch creation writes every task file and returns paths in input order."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        agent = AgentDefinition(name="Test Agent", abbreviation="TST", category="ingestion",
+                                trigger_pattern=None, trigger_event=None)
+        tasks = [
+            (ExecutionContext(trigger_data={'path': f"Ingest/note{i}.md"}), agent, "QUEUED", '{}')
+            for i in range(5)
+        ]
+
+        paths = manager.create_task_files(tasks)
+
+        assert [p.name.split(" - ")[1] for p in paths] == [f"note{i}.md" for i in range(5)]
+        assert all('status: "QUEUED"' in p.read_text(encoding='utf-8') for p in paths)
+
     def test_update_task_status(self, temp_vault, mock_config, sample_agent, execution_context):
         """Test updating task status."""
         manager = TaskFileManager(temp_vault, config=mock_config)
@@ -115,6 +130,91 @@ class TestTaskFileManager:
         assert "status: \"PROCESSED\"" in content
         assert "status: \"IN_PROGRESS\"" not in content
 
+    def test_update_task_status_batches_fsync(self, temp_vault, mock_config):
+        """Test status updates are written at once and fsync'ed in one batch."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        task_path.write_text('---\nstatus: "QUEUED"\n---\n\n## Process Log\n', encoding='utf-8')
+
+        with patch('ai4pkm_cli.orchestrator.task_manager.os.fsync') as fsync:
+            manager.update_task_status(task_path, "IN_PROGRESS")
+            manager.update_task_status(task_path, "PROCESSED")
+            assert "status: \"PROCESSED\"" in task_path.read_text(encoding='utf-8')
+            assert fsync.call_count == 0
+
+            # One fsync for the file, one for its directory
+            manager.flush()
+            assert fsync.call_count == 2
+
+            manager.update_task_status(task_path, "FAILED", durable=True)
+            assert fsync.call_count == 4
+            assert manager._sync_timer is None
+
+        # Written via temp file + rename; nothing left behind
+        assert [p.name for p in manager.tasks_dir.iterdir()] == [task_path.name]
+
+    def test_write_task_file_concurrent_writers(self, temp_vault, mock_config):
+        """Test concurrent writes to one task never collide on a temp file."""
+        import threading
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        errors = []
+
+        def write_many(label):
+            for i in range(200):
+                try:
+                    manager._write_task_file(task_path, f"{label} {i}\n", durable=False)
+                except OSError as e:
+                    errors.append(e)
+
+        writers = [threading.Thread(target=write_many, args=(label,)) for label in ("a", "b")]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+        manager.flush()
+
+        assert errors == []
+        assert [p.name for p in manager.tasks_dir.iterdir()] == [task_path.name]
+
+    def test_update_task_status_reuses_written_content(self, temp_vault, mock_config):
+        """Test active tasks skip the re-read until the file changes on disk."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        task_path.write_text('---\nstatus: "QUEUED"\n---\n\n## Process Log\n', encoding='utf-8')
+
+        manager.update_task_status(task_path, "IN_PROGRESS")
+        with patch.object(Path, 'read_text', side_effect=AssertionError("unexpected read")):
+            manager.update_task_status(task_path, "IN_PROGRESS", error_message="retrying")
+
+        # An external edit changes the stat signature and forces a read
+        task_path.write_text(task_path.read_text(encoding='utf-8') + "agent notes\n", encoding='utf-8')
+        manager.update_task_status(task_path, "PROCESSED")
+
+        content = task_path.read_text(encoding='utf-8')
+        assert 'status: "PROCESSED"' in content
+        assert "Error: retrying" in content and "agent notes" in content
+        assert task_path not in manager._content_cache
+
+    def test_update_task_status_rewrites_only_status_line(self, temp_vault, mock_config):
+        """Test status-only updates edit the status line and leave the rest byte-for-byte."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        original = ('---\ntitle:   "TST - input"\nstatus: "QUEUED"\nagent_params:\n    depth: 2\n---\n'
+                    '\nstatus: "QUEUED" in the body\n')
+        task_path.write_text(original, encoding='utf-8')
+
+        with patch('ai4pkm_cli.markdown_utils.update_frontmatter_fields') as round_trip:
+            manager.update_task_status(task_path, "IN_PROGRESS")
+        round_trip.assert_not_called()
+        assert task_path.read_text(encoding='utf-8') == original.replace('"QUEUED"', '"IN_PROGRESS"', 1)
+
+        # Unquoted status lines go through the YAML round-trip
+        task_path.write_text('---\nstatus: QUEUED\n---\n', encoding='utf-8')
+        manager.update_task_status(task_path, "PROCESSED")
+        _, frontmatter = manager.read_task_file(task_path)
+        assert frontmatter['status'] == "PROCESSED"
+
     def test_update_task_status_with_output(self, temp_vault, mock_config, sample_agent, execution_context):
         """Test updating task status with output link."""
         manager = TaskFileManager(temp_vault, config=mock_config)
@@ -159,3 +259,117 @@ class TestTaskFileManager:
         # Filename should be truncated (macOS limit is 255 bytes)
         assert len(task_path.name.encode('utf-8')) <= 255
 
+    def test_generate_task_filename_uses_start_time(self, temp_vault, mock_config):
+        """Test filenames use the execution start date, and time for scheduled runs."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        agent = Mock(abbreviation="TST")
+        start = datetime(2025, 3, 7, 9, 5, 30)
+
+        ctx = ExecutionContext(trigger_data={"path": "Ingest/note.md"})
+        ctx.start_time = start
+        assert manager._generate_task_filename(ctx, agent) == "2025-03-07 TST - note.md"
+
+        ctx.trigger_data = {}
+        assert manager._generate_task_filename(ctx, agent) == "2025-03-07 TST - scheduled-0905.md"
+
+    def test_path_stem_matches_pathlib(self):
+        """Test _path_stem agrees with Path.stem on ordinary and edge-case paths."""
+        from ai4pkm_cli.orchestrator.task_manager import _path_stem
+
+        for path in ["Ingest/Clippings/Article.md", "a/b.tar.gz", "notes/.hidden", "dir/", "name.", "", "./", "a/.."]:
+            assert _path_stem(path) == Path(path).stem
+
+    def test_truncate_filename_to_bytes(self, temp_vault, mock_config):
+        """Test ASCII and multi-byte names are cut to the byte limit on character boundaries."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+
+        assert manager._truncate_filename_to_bytes("short.md", max_bytes=20) == "short.md"
+        assert manager._truncate_filename_to_bytes("a" * 30 + ".md", max_bytes=20) == "a" * 14 + "....md"
+
+        truncated = manager._truncate_filename_to_bytes("노트" * 10 + ".md", max_bytes=20)
+        assert truncated == "노트노트" + "....md"
+        assert len(truncated.encode('utf-8')) <= 20
+
+    def test_finalize_task_updates_status_and_process_log(self, temp_vault, mock_config):
+        """Test finalize_task writes status, output and log entries in one pass."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        task_path.write_text(
+            '---\nstatus: "IN_PROGRESS"\noutput: ""\n---\n\n## Process Log\n\n## Evaluation Log\n',
+            encoding='utf-8'
+        )
+
+        content, frontmatter = manager.read_task_file(task_path)
+        assert frontmatter['status'] == "IN_PROGRESS"
+
+        manager.finalize_task(
+            task_path, "FAILED", output="[[AI/out]]", error_message="boom",
+            process_log_summary="Execution completed", content=content
+        )
+
+        content, frontmatter = manager.read_task_file(task_path)
+        assert frontmatter['status'] == "FAILED"
+        assert frontmatter['output'] == "[[AI/out]]"
+        log_section = content.split("## Process Log", 1)[1]
+        assert log_section.index("Execution completed") < log_section.index("Error: boom")
+
+    def test_read_task_file_missing(self, temp_vault, mock_config):
+        """Test read_task_file tolerates a missing file."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        assert manager.read_task_file(manager.tasks_dir / "missing.md") == (None, {})
+
+    def test_stat_task_file_detects_changes(self, temp_vault, mock_config):
+        """Test stat_task_file signature changes when the file is rewritten."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        assert manager.stat_task_file(task_path) is None
+
+        task_path.write_text('---\nstatus: "IN_PROGRESS"\n---\n', encoding='utf-8')
+        signature = manager.stat_task_file(task_path)
+        assert signature == manager.stat_task_file(task_path)
+
+        task_path.write_text('---\nstatus: "PROCESSED"\noutput: "[[AI/out]]"\n---\n', encoding='utf-8')
+        assert manager.stat_task_file(task_path) != signature
+
+    def test_quick_read_status_output(self):
+        """Test the frontmatter line scan and its YAML fallback cases."""
+        quick = TaskFileManager.quick_read_status_output
+        assert quick('---\nstatus: "PROCESSED"\noutput: \'[[AI/out]]\'\n---\n\nbody\n') == ("PROCESSED", "[[AI/out]]")
+        assert quick('---\nstatus: COMPLETED\npriority: high\n---\n') == ("COMPLETED", "")
+        assert quick('no frontmatter\n') == ("", "")
+        # Values YAML would interpret differently need the full parse
+        assert quick('---\nstatus: DONE\noutput: [[AI/out]]\n---\n') is None
+        assert quick('---\nstatus: null\n---\n') is None
+        assert quick('---\nstatus: "a\\"b"\n---\n') is None
+
+    def test_read_task_status_falls_back_to_yaml(self, temp_vault, mock_config):
+        """Test read_task_status returns content and fields, using YAML when needed."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        task_path = manager.tasks_dir / "2025-01-01 TST - input.md"
+        task_path.write_text('---\nstatus: PROCESSED # agent\noutput: "[[AI/out]]"\n---\n', encoding='utf-8')
+
+        content, status, output = manager.read_task_status(task_path)
+        assert content.startswith('---')
+        assert (status, output) == ("PROCESSED", "[[AI/out]]")
+        assert manager.read_task_status(manager.tasks_dir / "missing.md") == (None, "", "")
+
+    def test_render_frontmatter_quotes_strings(self, temp_vault, mock_config):
+        """Test frontmatter strings are double-quoted and the shared dumper is reusable."""
+        manager = TaskFileManager(temp_vault, config=mock_config)
+        data = {
+            'title': 'EIC - 노트 "draft"',
+            'output': '',
+            'agent_params': {'limit': 3, 'tag': 'x'},
+        }
+        expected = (
+            '---\n'
+            'title: "EIC - 노트 \\"draft\\""\n'
+            'output: ""\n'
+            'agent_params:\n'
+            '  limit: 3\n'
+            '  tag: "x"\n'
+            '---'
+        )
+
+        for _ in range(2):
+            assert manager._render_frontmatter({**data, 'agent_params': dict(data['agent_params'])}) == expected
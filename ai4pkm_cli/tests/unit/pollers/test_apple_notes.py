@@ -0,0 +1,48 @@
+"""Unit tests for apple_notes.py HTML conversion"""
+
+import re
+
+import pytest
+
+pytest.importorskip("selectolax")
+
+from ai4pkm_cli.pollers.apple_notes import _selectolax_to_markdown
+
+
+def _normalize(markdown: str) -> str:
+    """Ignore layout differences that don't change how the markdown renders."""
+    lines = [line.rstrip() for line in markdown.split('\n')]
+    text = re.sub(r'\n{3,}', '\n\n', '\n'.join(lines)).strip()
+    return re.sub(r' *\| *', '|', text)
+
+
+def _html2text(html_content: str) -> str:
+    html2text = pytest.importorskip("html2text")
+    converter = html2text.HTML2Text(bodywidth=0)
+    converter.ignore_links = False
+    converter.unicode_snob = True
+    return converter.handle(html_content)
+
+
+@pytest.mark.parametrize("html_content", [
+    '<h1>Title</h1><div>Body text</div><h2>Section</h2><div>More</div>',
+    '<ul><li>one<ul><li>two</li><li>three</li></ul></li><li>four</li></ul>',
+    '<ol><li>first</li><li>second</li></ol>',
+    '<div>See <a href="https://example.com">the site</a> for details</div>',
+    '<div><table><tbody><tr><td>A</td><td>B</td></tr>'
+    '<tr><td>1</td><td>2</td></tr><tr><td>3</td><td>4</td></tr></tbody></table></div>',
+    '<table><thead><tr><th>Name</th><th>Value</th></tr></thead>'
+    '<tbody><tr><td>x</td><td>1</td></tr></tbody></table>',
+])
+def test_selectolax_matches_html2text(html_content):
+    """Test the selectolax emitter renders like html2text."""
+    assert _normalize(_selectolax_to_markdown(html_content)) == _normalize(_html2text(html_content))
+
+
+def test_selectolax_table_has_header_separator():
+    """Test tables get a markdown header separator after the first row."""
+    markdown = _selectolax_to_markdown(
+        '<table><tr><td>A</td><td>B</td></tr><tr><td>1</td><td>2</td></tr></table>'
+    )
+
+    assert markdown == 'A | B\n---|---\n1 | 2'
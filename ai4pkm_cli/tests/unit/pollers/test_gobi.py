@@ -0,0 +1,28 @@
+"""Unit tests for gobi.py and gobi_by_tags.py configuration"""
+
+import pytest
+
+pytest.importorskip("pytz")
+
+from ai4pkm_cli.pollers.gobi import GobiPoller
+from ai4pkm_cli.pollers.gobi_by_tags import GobiByTagsPoller
+
+
+@pytest.mark.parametrize("poller_class", [GobiPoller, GobiByTagsPoller])
+@pytest.mark.parametrize("value, expected", [
+    (8, 8),
+    ("4", 4),
+    (0, 16),
+    (-2, 16),
+    ("many", 16),
+    (None, 16),
+])
+def test_download_concurrency_validated(tmp_path, poller_class, value, expected):
+    """Test download_concurrency is coerced to int and falls back when invalid."""
+    poller = poller_class(
+        {"target_dir": str(tmp_path), "api_key": "key", "tags": ["tag"], "download_concurrency": value},
+        vault_path=tmp_path,
+    )
+
+    assert poller.max_workers == expected
+    assert poller.session.get_adapter("https://").poolmanager.connection_pool_kw["maxsize"] == expected * 2